@@ -0,0 +1,33 @@
+"""Add composite index on purchases (user_id, purchased_at)
+
+Revision ID: 7c1f3a9d2e41
+Revises: 50de79cbcacf
+Create Date: 2026-10-15 10:12:40.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1f3a9d2e41'
+down_revision: Union[str, Sequence[str], None] = '50de79cbcacf'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_purchases_user_id_purchased_at',
+        'purchases',
+        ['user_id', 'purchased_at'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_purchases_user_id_purchased_at', table_name='purchases')
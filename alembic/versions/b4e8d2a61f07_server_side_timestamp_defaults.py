@@ -0,0 +1,53 @@
+"""Use server-side defaults for timestamp columns
+
+Revision ID: b4e8d2a61f07
+Revises: 7c1f3a9d2e41
+Create Date: 2026-10-15 22:30:11.482913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.database import utcnow
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4e8d2a61f07'
+down_revision: Union[str, Sequence[str], None] = '7c1f3a9d2e41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TIMESTAMP_COLUMNS = {
+    'users': ('created_at', 'updated_at'),
+    'products': ('created_at', 'updated_at'),
+    'purchases': ('purchased_at',),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table_name, columns in TIMESTAMP_COLUMNS.items():
+        with op.batch_alter_table(table_name) as batch_op:
+            for column in columns:
+                batch_op.alter_column(
+                    column,
+                    existing_type=sa.DateTime(),
+                    existing_nullable=False,
+                    server_default=utcnow(),
+                )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table_name, columns in TIMESTAMP_COLUMNS.items():
+        with op.batch_alter_table(table_name) as batch_op:
+            for column in columns:
+                batch_op.alter_column(
+                    column,
+                    existing_type=sa.DateTime(),
+                    existing_nullable=False,
+                    server_default=None,
+                )
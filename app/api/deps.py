@@ -4,7 +4,7 @@ FastAPI 의존성 주입 함수들
 데이터베이스 세션, 설정, 인증 등의 의존성을 제공합니다.
 """
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 
@@ -13,7 +13,6 @@ from app.db.database import get_db
 from app.db.redis_client import get_redis_client
 from app.services.auth_service import AuthService
 from app.models.user import User
-from app.core.exceptions import InvalidCredentialsException, UserNotFoundException
 
 
 # OAuth2 토큰 스키마 설정
@@ -38,29 +37,12 @@ def get_current_user(
         User: 인증된 사용자 객체
 
     Raises:
-        HTTPException: 인증 실패 시 401 Unauthorized
+        InvalidCredentialsException: 토큰이 유효하지 않은 경우 (전역 핸들러에서 401로 변환)
+        UserNotFoundException: 토큰의 사용자가 없는 경우 (전역 핸들러에서 401로 변환)
 
     Example:
         @app.get("/protected")
         def protected_route(current_user: User = Depends(get_current_user)):
             return {"user": current_user.username}
     """
-    try:
-        user = AuthService.get_current_user(token, db, settings)
-        return user
-
-    except InvalidCredentialsException as e:
-        # 토큰이 유효하지 않거나 만료된 경우
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=str(e),
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    except UserNotFoundException as e:
-        # 토큰은 유효하지만 사용자가 없는 경우
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=str(e),
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    return AuthService.get_current_user(token, db, settings)
@@ -13,7 +13,6 @@ from app.core.config import Settings, get_settings
 from app.core.security import create_access_token
 from app.services.auth_service import AuthService
 from app.schemas.auth import UserRegisterRequest, TokenResponse, UserResponse
-from app.core.exceptions import UserAlreadyExistsException
 from app.models.user import User
 
 
@@ -26,6 +25,7 @@ router = APIRouter()
 def register(
     user_data: UserRegisterRequest,
     db: Session = Depends(get_db),
+    settings: Settings = Depends(get_settings),
 ):
     """
     새 사용자를 등록합니다.
@@ -33,6 +33,7 @@ def register(
     Args:
         user_data: 사용자 등록 정보 (username, password)
         db: 데이터베이스 세션
+        settings: 애플리케이션 설정 (bcrypt cost)
 
     Returns:
         UserResponse: 생성된 사용자 정보
@@ -59,19 +60,13 @@ def register(
         }
         ```
     """
-    try:
-        user = AuthService.register_user(
-            username=user_data.username,
-            password=user_data.password,
-            db=db,
-        )
-        return user
-
-    except UserAlreadyExistsException as e:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=str(e),
-        )
+    user = AuthService.register_user(
+        username=user_data.username,
+        password=user_data.password,
+        db=db,
+        settings=settings,
+    )
+    return user
 
 
 @router.post("/login", response_model=TokenResponse)
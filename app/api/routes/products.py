@@ -6,15 +6,12 @@
 
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from redis import Redis
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db, get_current_user
 from app.core.config import Settings, get_settings
-from app.core.exceptions import (
-    ProductAlreadyExistsException,
-)
 from app.db.redis_client import get_redis_client
 from app.models.user import User
 from app.schemas.inventory import (
@@ -74,33 +71,32 @@ def create_product(
         }
         ```
     """
-    try:
-        product = ProductService.create_product(
-            name=product_data.name,
-            price=product_data.price,
-            stock=product_data.stock,
-            db=db,
-            redis=redis,
-            settings=settings,
-        )
-        return product
-
-    except ProductAlreadyExistsException as e:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=str(e),
-        )
+    product = ProductService.create_product(
+        name=product_data.name,
+        price=product_data.price,
+        stock=product_data.stock,
+        db=db,
+        redis=redis,
+        settings=settings,
+    )
+    return product
 
 
 @router.get("/products", response_model=List[ProductResponse])
 def list_products(
+    skip: int = Query(0, ge=0, description="건너뛸 레코드 수"),
+    limit: int = Query(100, ge=1, le=100, description="조회할 최대 레코드 수"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """
-    모든 상품 목록을 조회합니다 (인증 필요).
+    상품 목록을 ID 순으로 조회합니다 (인증 필요).
+
+    한 번에 최대 100개까지 페이지 단위로 조회합니다.
 
     Args:
+        skip: 건너뛸 레코드 수 (페이지네이션)
+        limit: 조회할 최대 레코드 수 (최대 100)
         db: 데이터베이스 세션
         current_user: 현재 인증된 사용자
 
@@ -123,7 +119,7 @@ def list_products(
         ]
         ```
     """
-    products = ProductService.list_products(db)
+    products = ProductService.list_products(db, skip=skip, limit=limit)
     return products
 
 
@@ -205,8 +201,9 @@ def get_stock(
         }
         ```
     """
-    product = ProductService.get_product(product_id, db)
-    if product is None:
+    # 재고 컬럼만 조회 (Product 객체 생성 생략)
+    db_stock = ProductService.get_db_stock(product_id, db)
+    if db_stock is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Product with id {product_id} not found",
@@ -215,11 +212,11 @@ def get_stock(
     # Redis에서 재고 조회
     redis_stock = InventoryService.get_stock(product_id, redis)
     # 동기화 상태 확인
-    synced = redis_stock == product.stock if redis_stock is not None else False
+    synced = redis_stock == db_stock if redis_stock is not None else False
 
     return StockResponse(
         product_id=product_id,
-        db_stock=product.stock,
+        db_stock=db_stock,
         redis_stock=redis_stock,
         synced=synced,
     )
@@ -6,18 +6,14 @@
 
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Query, status
 from redis import Redis
+from redis.asyncio import Redis as AsyncRedis
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db, get_current_user
 from app.core.config import Settings, get_settings
-from app.core.exceptions import (
-    ProductNotFoundException,
-    InsufficientStockException,
-    LockAcquisitionException,
-)
-from app.db.redis_client import get_redis_client
+from app.db.redis_client import get_async_redis_client, get_redis_client
 from app.models.user import User
 from app.models.purchase import Purchase
 from app.schemas.inventory import (
@@ -78,45 +74,76 @@ def purchase_product(
         }
         ```
     """
-    try:
-        purchase = PurchaseService.purchase_product(
-            user_id=current_user.id,
-            product_id=purchase_data.product_id,
-            quantity=purchase_data.quantity,
-            db=db,
-            redis=redis,
-            settings=settings,
-        )
-        return purchase
-
-    except ProductNotFoundException as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        )
-
-    except InsufficientStockException as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        )
-
-    except LockAcquisitionException as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        )
+    purchase = PurchaseService.purchase_product(
+        user_id=current_user.id,
+        product_id=purchase_data.product_id,
+        quantity=purchase_data.quantity,
+        db=db,
+        redis=redis,
+        settings=settings,
+    )
+    return purchase
+
+
+@router.post(
+    "/purchases/async",
+    response_model=PurchaseResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def purchase_product_async(
+    purchase_data: PurchaseRequest,
+    db: Session = Depends(get_db),
+    redis: AsyncRedis = Depends(get_async_redis_client),
+    settings: Settings = Depends(get_settings),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    상품을 구매합니다 (인증 필요, 비동기 Redis 클라이언트 사용).
+
+    /purchases와 같은 비관적 락 로직을 redis.asyncio로 실행합니다.
+    Redis 왕복을 이벤트 루프에서 대기하므로 스레드 하나를 점유하지 않고
+    여러 구매 요청을 동시에 처리할 수 있습니다.
+
+    Args:
+        purchase_data: 구매 정보 (product_id, quantity)
+        db: 데이터베이스 세션
+        redis: 비동기 Redis 클라이언트
+        settings: 애플리케이션 설정
+        current_user: 현재 인증된 사용자
+
+    Returns:
+        PurchaseResponse: 생성된 구매 정보
+
+    Raises:
+        HTTPException 404: 상품을 찾을 수 없는 경우
+        HTTPException 400: 재고 부족 또는 락 획득 실패
+    """
+    purchase = await PurchaseService.purchase_product_async(
+        user_id=current_user.id,
+        product_id=purchase_data.product_id,
+        quantity=purchase_data.quantity,
+        db=db,
+        redis=redis,
+        settings=settings,
+    )
+    return purchase
 
 
 @router.get("/purchases/me", response_model=List[PurchaseResponse])
 def get_my_purchases(
+    skip: int = Query(0, ge=0, description="건너뛸 레코드 수"),
+    limit: int = Query(50, ge=1, le=100, description="조회할 최대 레코드 수"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """
-    현재 사용자의 구매 이력을 조회합니다 (인증 필요).
+    현재 사용자의 구매 이력을 최신순으로 조회합니다 (인증 필요).
+
+    (user_id, purchased_at) 복합 인덱스를 사용하며, 페이지 단위로 조회합니다.
 
     Args:
+        skip: 건너뛸 레코드 수 (페이지네이션)
+        limit: 조회할 최대 레코드 수 (최대 100)
         db: 데이터베이스 세션
         current_user: 현재 인증된 사용자
 
@@ -142,6 +169,8 @@ def get_my_purchases(
         db.query(Purchase)
         .filter(Purchase.user_id == current_user.id)
         .order_by(Purchase.purchased_at.desc())
+        .offset(skip)
+        .limit(limit)
         .all()
     )
     return purchases
@@ -4,18 +4,19 @@ Redlock 기반 구매 API 엔드포인트
 다중 Redis 노드에 분산 락을 획득하여 재고 정합성을 보장하는 구매 처리 기능을 제공합니다.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from aioredlock import Aioredlock
+from fastapi import APIRouter, Depends, status
 from redis import Redis
+from redis.asyncio import Redis as AsyncRedis
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db, get_current_user
 from app.core.config import Settings, get_settings
-from app.core.exceptions import (
-    ProductNotFoundException,
-    InsufficientStockException,
-    LockAcquisitionException,
+from app.db.redis_client import (
+    get_async_redis_nodes,
+    get_lock_manager,
+    get_redis_nodes,
 )
-from app.db.redis_client import get_redis_nodes
 from app.models.user import User
 from app.schemas.inventory import (
     PurchaseRequest,
@@ -35,7 +36,8 @@ router = APIRouter()
 async def purchase_product_redlock_aioredlock(
     purchase_data: PurchaseRequest,
     db: Session = Depends(get_db),
-    redis_nodes: list[Redis] = Depends(get_redis_nodes),
+    redis_nodes: list[AsyncRedis] = Depends(get_async_redis_nodes),
+    lock_manager: Aioredlock = Depends(get_lock_manager),
     settings: Settings = Depends(get_settings),
     current_user: User = Depends(get_current_user),
 ):
@@ -48,7 +50,8 @@ async def purchase_product_redlock_aioredlock(
     Args:
         purchase_data: 구매 정보 (product_id, quantity)
         db: 데이터베이스 세션
-        redis_nodes: Redis 클라이언트 리스트 (다중 노드)
+        redis_nodes: 비동기 Redis 클라이언트 리스트 (다중 노드)
+        lock_manager: 공유 aioredlock 락 매니저
         settings: 애플리케이션 설정
         current_user: 현재 인증된 사용자
 
@@ -80,34 +83,16 @@ async def purchase_product_redlock_aioredlock(
         }
         ```
     """
-    try:
-        purchase = await PurchaseService.purchase_with_redlock_aioredlock(
-            user_id=current_user.id,
-            product_id=purchase_data.product_id,
-            quantity=purchase_data.quantity,
-            db=db,
-            redis_nodes=redis_nodes,
-            settings=settings,
-        )
-        return purchase
-
-    except ProductNotFoundException as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        )
-
-    except InsufficientStockException as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        )
-
-    except LockAcquisitionException as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        )
+    purchase = await PurchaseService.purchase_with_redlock_aioredlock(
+        user_id=current_user.id,
+        product_id=purchase_data.product_id,
+        quantity=purchase_data.quantity,
+        db=db,
+        redis_nodes=redis_nodes,
+        lock_manager=lock_manager,
+        settings=settings,
+    )
+    return purchase
 
 
 @router.post(
@@ -163,34 +148,15 @@ def purchase_product_redlock_manual(
         }
         ```
     """
-    try:
-        purchase = PurchaseService.purchase_with_redlock_manual(
-            user_id=current_user.id,
-            product_id=purchase_data.product_id,
-            quantity=purchase_data.quantity,
-            db=db,
-            redis_nodes=redis_nodes,
-            settings=settings,
-        )
-        return purchase
-
-    except ProductNotFoundException as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        )
-
-    except InsufficientStockException as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        )
-
-    except LockAcquisitionException as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        )
+    purchase = PurchaseService.purchase_with_redlock_manual(
+        user_id=current_user.id,
+        product_id=purchase_data.product_id,
+        quantity=purchase_data.quantity,
+        db=db,
+        redis_nodes=redis_nodes,
+        settings=settings,
+    )
+    return purchase
 
 
 @router.post(
@@ -201,7 +167,7 @@ def purchase_product_redlock_manual(
 async def purchase_product_redlock_manual_async(
     purchase_data: PurchaseRequest,
     db: Session = Depends(get_db),
-    redis_nodes: list[Redis] = Depends(get_redis_nodes),
+    redis_nodes: list[AsyncRedis] = Depends(get_async_redis_nodes),
     settings: Settings = Depends(get_settings),
     current_user: User = Depends(get_current_user),
 ):
@@ -214,7 +180,7 @@ async def purchase_product_redlock_manual_async(
     Args:
         purchase_data: 구매 정보 (product_id, quantity)
         db: 데이터베이스 세션
-        redis_nodes: Redis 클라이언트 리스트 (다중 노드)
+        redis_nodes: 비동기 Redis 클라이언트 리스트 (다중 노드)
         settings: 애플리케이션 설정
         current_user: 현재 인증된 사용자
 
@@ -246,31 +212,12 @@ async def purchase_product_redlock_manual_async(
         }
         ```
     """
-    try:
-        purchase = await PurchaseService.purchase_with_redlock_manual_async(
-            user_id=current_user.id,
-            product_id=purchase_data.product_id,
-            quantity=purchase_data.quantity,
-            db=db,
-            redis_nodes=redis_nodes,
-            settings=settings,
-        )
-        return purchase
-
-    except ProductNotFoundException as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        )
-
-    except InsufficientStockException as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        )
-
-    except LockAcquisitionException as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        )
+    purchase = await PurchaseService.purchase_with_redlock_manual_async(
+        user_id=current_user.id,
+        product_id=purchase_data.product_id,
+        quantity=purchase_data.quantity,
+        db=db,
+        redis_nodes=redis_nodes,
+        settings=settings,
+    )
+    return purchase
@@ -5,9 +5,20 @@ Pydantic Settings를 사용하여 환경 변수를 로드합니다.
 .env 파일 또는 시스템 환경 변수에서 설정을 읽어옵니다.
 """
 
+from functools import cached_property, lru_cache
+from typing import NamedTuple
+
+from pydantic import PrivateAttr, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+class RedisNode(NamedTuple):
+    """Redlock에 참여하는 Redis 노드 주소"""
+
+    host: str
+    port: int
+
+
 class Settings(BaseSettings):
     """애플리케이션 설정 클래스"""
 
@@ -17,6 +28,13 @@ class Settings(BaseSettings):
     redis_db: int
     redis_password: str
 
+    # Redis 커넥션 풀 설정 (클라이언트/노드별로 하나씩 생성됨)
+    # 풀이 가득 차면 redis-py는 대기하지 않고 예외를 내므로 스레드풀 크기보다 크게 잡음
+    redis_max_connections: int = 200
+    redis_socket_timeout: float = 2.0
+    # RESP3 서버 지원 클라이언트 캐시 최대 키 수 (0이면 비활성화, Redis 7.4 이상 필요)
+    redis_client_cache_size: int = 0
+
     # Redlock 설정 (분산 락)
     redis_nodes: str = ""  # 쉼표로 구분된 host:port 목록
     use_redlock: bool = False  # Redlock 모드 활성화 여부
@@ -26,18 +44,41 @@ class Settings(BaseSettings):
     jwt_algorithm: str
     jwt_expiration_minutes: int
 
+    # 비밀번호 해싱 설정
+    # bcrypt cost (2^rounds 회 키 스케줄), 기존 해시는 해시에 기록된 cost로 검증됨
+    bcrypt_rounds: int = 10
+
     # 데이터베이스 설정
     database_url: str = "sqlite:///./inventory.db"
 
+    # 데이터베이스 커넥션 풀 설정
+    # 구매 요청은 Redis 락/재고 감소 왕복 동안에도 커넥션을 잡고 있으므로
+    # 풀 크기는 CPU 수가 아니라 예상 동시 구매 요청 수 이상으로 잡음
+    db_pool_size: int = 50  # 기본 connection pool 크기 (SQLAlchemy 기본값: 5)
+    db_max_overflow: int = 100  # 추가 가능한 connection 수 (SQLAlchemy 기본값: 10)
+    db_pool_timeout: int = 60  # connection 대기 timeout 초 (SQLAlchemy 기본값: 30)
+    db_pool_recycle: int = 3600  # connection 재생성 주기 초 (stale connection 방지)
+    # checkout마다 유효성 확인 쿼리(왕복 1회)를 보낼지 여부
+    # 로컬 SQLite는 끊길 일이 없으므로 기본 비활성화, 중간에 프록시/방화벽이 있는 원격 DB면 활성화
+    db_pool_pre_ping: bool = False
+
     # 락 설정
     lock_timeout_seconds: int = 10
     lock_retry_attempts: int = 3
-    lock_retry_delay_ms: int = 100
+    lock_retry_delay_ms: int = 100  # 첫 재시도 지연 (이후 지수적으로 증가)
+    lock_retry_max_delay_ms: int = 1000  # 재시도 지연 상한
 
     # 애플리케이션 설정
     app_env: str = "development"
     log_level: str = "INFO"
 
+    # CORS 허용 Origin (쉼표로 구분, "*"이면 모든 Origin 허용)
+    cors_allowed_origins: str = "*"
+
+    # 동기 엔드포인트(def)를 실행하는 스레드풀 크기 (anyio 기본값: 40)
+    # DB 커넥션 풀 최대치(pool_size + max_overflow)에 맞춤
+    threadpool_size: int = 150
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -45,10 +86,33 @@ class Settings(BaseSettings):
         extra="ignore",  # 정의되지 않은 환경 변수 무시
     )
 
-    @property
+    _redis_node_list: tuple[RedisNode, ...] = PrivateAttr(default=())
+
+    @model_validator(mode="after")
+    def _parse_redis_nodes(self) -> "Settings":
+        """
+        redis_nodes 문자열을 설정 생성 시점에 한 번만 파싱합니다.
+
+        잘못된 노드 설정(예: 숫자가 아닌 포트)은 첫 요청이 아닌 시작 시점에 검증 오류로 드러납니다.
+        """
+        nodes = []
+        for node in self.redis_nodes.split(","):
+            node = node.strip()
+            if not node:
+                continue
+            if ":" in node:
+                host, port = node.split(":")
+                nodes.append(RedisNode(host, int(port)))
+            else:
+                # 포트가 없으면 기본 포트 6380 사용
+                nodes.append(RedisNode(node, 6380))
+        self._redis_node_list = tuple(nodes)
+        return self
+
+    @cached_property
     def redis_url(self) -> str:
         """
-        Redis 연결 URL 생성
+        Redis 연결 URL 생성 (최초 접근 시 한 번만 계산)
 
         비밀번호가 있는 경우: redis://:password@host:port/db
         비밀번호가 없는 경우: redis://host:port/db
@@ -57,31 +121,37 @@ class Settings(BaseSettings):
             return f"redis://:{self.redis_password}@{self.redis_host}:{self.redis_port}/{self.redis_db}"
         return f"redis://{self.redis_host}:{self.redis_port}/{self.redis_db}"
 
-    @property
-    def redis_node_list(self) -> list[dict[str, str | int]]:
+    @cached_property
+    def cors_origin_list(self) -> list[str]:
         """
-        Redlock을 위한 Redis 노드 목록 파싱
+        CORS 허용 Origin 목록 (최초 접근 시 한 번만 파싱)
 
         Returns:
-            [{"host": "redis1", "port": 6380}, {"host": "redis2", "port": 6381}, ...]
+            ["https://shop.example.com", ...] 또는 ["*"]
         """
-        if not self.redis_nodes:
-            return []
+        return [
+            origin.strip()
+            for origin in self.cors_allowed_origins.split(",")
+            if origin.strip()
+        ]
 
-        nodes = []
-        for node in self.redis_nodes.split(","):
-            node = node.strip()
-            if ":" in node:
-                host, port = node.split(":")
-                nodes.append({"host": host, "port": int(port)})
-            else:
-                # 포트가 없으면 기본 포트 6380 사용
-                nodes.append({"host": node, "port": 6380})
-        return nodes
+    @property
+    def redis_node_list(self) -> tuple[RedisNode, ...]:
+        """
+        Redlock을 위한 Redis 노드 목록 (설정 생성 시 파싱된 값)
 
+        Returns:
+            (RedisNode(host="redis1", port=6380), RedisNode(host="redis2", port=6381), ...)
+        """
+        return self._redis_node_list
 
+
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """
     Settings 인스턴스를 반환하는 팩토리 함수
+
+    .env 파싱과 pydantic 검증은 프로세스당 한 번만 수행되도록 캐싱합니다.
+    (FastAPI의 의존성 캐시는 요청 단위로만 동작하므로 lru_cache로 싱글톤화)
     """
     return Settings()
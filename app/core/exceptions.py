@@ -2,6 +2,9 @@
 커스텀 예외 정의
 
 애플리케이션 전역에서 사용되는 커스텀 예외 클래스들입니다.
+
+구매 경합 경로에서는 예외가 제어 흐름으로 쓰이고 메시지는 응답을 만들 때만 필요하므로,
+생성 시에는 필드만 저장하고 메시지는 message/str() 호출 시점에 만듭니다.
 """
 
 
@@ -14,8 +17,14 @@ class UserAlreadyExistsException(Exception):
 
     def __init__(self, username: str):
         self.username = username
-        self.message = f"User with username '{username}' already exists"
-        super().__init__(self.message)
+        super().__init__(username)
+
+    @property
+    def message(self) -> str:
+        return f"User with username '{self.username}' already exists"
+
+    def __str__(self) -> str:
+        return self.message
 
 
 class InvalidCredentialsException(Exception):
@@ -39,8 +48,14 @@ class UserNotFoundException(Exception):
 
     def __init__(self, username: str):
         self.username = username
-        self.message = f"User '{username}' not found"
-        super().__init__(self.message)
+        super().__init__(username)
+
+    @property
+    def message(self) -> str:
+        return f"User '{self.username}' not found"
+
+    def __str__(self) -> str:
+        return self.message
 
 
 class ProductNotFoundException(Exception):
@@ -52,8 +67,14 @@ class ProductNotFoundException(Exception):
 
     def __init__(self, product_id: int):
         self.product_id = product_id
-        self.message = f"Product with id {product_id} not found"
-        super().__init__(self.message)
+        super().__init__(product_id)
+
+    @property
+    def message(self) -> str:
+        return f"Product with id {self.product_id} not found"
+
+    def __str__(self) -> str:
+        return self.message
 
 
 class InsufficientStockException(Exception):
@@ -67,11 +88,17 @@ class InsufficientStockException(Exception):
         self.product_id = product_id
         self.requested = requested
         self.available = available
-        self.message = (
-            f"Insufficient stock for product {product_id}: "
-            f"requested {requested}, available {available}"
+        super().__init__(product_id, requested, available)
+
+    @property
+    def message(self) -> str:
+        return (
+            f"Insufficient stock for product {self.product_id}: "
+            f"requested {self.requested}, available {self.available}"
         )
-        super().__init__(self.message)
+
+    def __str__(self) -> str:
+        return self.message
 
 
 class LockAcquisitionException(Exception):
@@ -83,8 +110,15 @@ class LockAcquisitionException(Exception):
 
     def __init__(self, resource: str, message: str = "Failed to acquire lock"):
         self.resource = resource
-        self.message = f"{message} for resource: {resource}"
-        super().__init__(self.message)
+        self.reason = message
+        super().__init__(resource, message)
+
+    @property
+    def message(self) -> str:
+        return f"{self.reason} for resource: {self.resource}"
+
+    def __str__(self) -> str:
+        return self.message
 
 
 class ProductAlreadyExistsException(Exception):
@@ -96,5 +130,11 @@ class ProductAlreadyExistsException(Exception):
 
     def __init__(self, name: str):
         self.name = name
-        self.message = f"Product with name '{name}' already exists"
-        super().__init__(self.message)
+        super().__init__(name)
+
+    @property
+    def message(self) -> str:
+        return f"Product with name '{self.name}' already exists"
+
+    def __str__(self) -> str:
+        return self.message
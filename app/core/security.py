@@ -4,20 +4,38 @@
 비밀번호 해싱 및 JWT 토큰 생성/검증 기능을 제공합니다.
 """
 
-from datetime import datetime, timedelta, timezone
-from typing import Dict, Any
+import hashlib
+import threading
+import time
+from functools import lru_cache
+from typing import Dict, Any, Optional, Union
 import bcrypt
 import jwt
+from cachetools import TTLCache
 
 from app.core.config import Settings
 
 
-def hash_password(password: str) -> str:
+# 검증된 토큰 → 페이로드 캐시
+# 같은 토큰을 반복 검증할 때 서명 검증을 생략하고 exp만 다시 확인합니다.
+# 검증에 실패한 토큰은 캐시하지 않습니다.
+_token_cache: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+_token_cache_lock = threading.Lock()
+
+
+def clear_token_cache() -> None:
+    """검증된 토큰 캐시를 비웁니다."""
+    with _token_cache_lock:
+        _token_cache.clear()
+
+
+def hash_password(password: str, rounds: Optional[int] = None) -> str:
     """
     비밀번호를 bcrypt로 해싱합니다.
 
     Args:
         password: 해싱할 평문 비밀번호
+        rounds: bcrypt cost (None이면 bcrypt 기본값 12)
 
     Returns:
         str: bcrypt로 해싱된 비밀번호 (salt 포함)
@@ -29,19 +47,19 @@ def hash_password(password: str) -> str:
     """
     password_bytes = password.encode("utf-8")
 
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds) if rounds is not None else bcrypt.gensalt()
     hashed = bcrypt.hashpw(password_bytes, salt)
 
     return hashed.decode("utf-8")
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+def verify_password(plain_password: str, hashed_password: Union[str, bytes]) -> bool:
     """
     평문 비밀번호와 해시된 비밀번호를 비교하여 검증합니다.
 
     Args:
         plain_password: 검증할 평문 비밀번호
-        hashed_password: 저장된 해시된 비밀번호
+        hashed_password: 저장된 해시된 비밀번호 (bytes이면 인코딩 없이 그대로 사용)
 
     Returns:
         bool: 비밀번호가 일치하면 True, 그렇지 않으면 False
@@ -55,11 +73,48 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     password_bytes = plain_password.encode("utf-8")
 
-    hashed_bytes = hashed_password.encode("utf-8")
+    if isinstance(hashed_password, bytes):
+        hashed_bytes = hashed_password
+    else:
+        hashed_bytes = hashed_password.encode("utf-8")
 
+    # bcrypt.checkpw는 해시 결과를 상수 시간으로 비교함
+    # 타이밍 공격을 막기 위해 직접 hashpw 결과를 == 로 비교하지 말 것
     return bcrypt.checkpw(password_bytes, hashed_bytes)
 
 
+@lru_cache(maxsize=8)
+def _get_jwt_key(secret_key: str, algorithm: str) -> Any:
+    """
+    JWT 서명/검증에 사용할 키 객체를 준비합니다.
+
+    PyJWT는 encode/decode 호출마다 문자열 키를 알고리즘별 키 객체로 변환(prepare_key)하므로,
+    (시크릿 키, 알고리즘) 조합별로 한 번만 변환하여 재사용합니다.
+
+    Args:
+        secret_key: JWT 시크릿 키
+        algorithm: JWT 알고리즘 (예: HS256)
+
+    Returns:
+        Any: 알고리즘에 맞게 준비된 키 (HMAC의 경우 bytes)
+    """
+    return jwt.get_algorithm_by_name(algorithm).prepare_key(secret_key)
+
+
+@lru_cache(maxsize=8)
+def _secret_digest(secret_key: str) -> bytes:
+    """
+    토큰 캐시 키에 사용할 시크릿 키 다이제스트를 계산합니다.
+
+    Args:
+        secret_key: JWT 시크릿 키
+
+    Returns:
+        bytes: 시크릿 키의 SHA-256 다이제스트
+    """
+    return hashlib.sha256(secret_key.encode("utf-8")).digest()
+
+
 def create_access_token(data: Dict[str, Any], settings: Settings) -> str:
     """
     JWT 액세스 토큰을 생성합니다.
@@ -81,13 +136,11 @@ def create_access_token(data: Dict[str, Any], settings: Settings) -> str:
     # 페이로드 복사본 생성 (원본 데이터 보존)
     payload = data.copy()
 
-    now = datetime.now(timezone.utc)
-    payload.update(
-        {"iat": now, "exp": now + timedelta(minutes=settings.jwt_expiration_minutes)}
-    )
-    token = jwt.encode(
-        payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm
-    )
+    # PyJWT가 datetime을 다시 epoch 초로 변환하므로 처음부터 정수로 넣음
+    now = int(time.time())
+    payload.update({"iat": now, "exp": now + settings.jwt_expiration_minutes * 60})
+    key = _get_jwt_key(settings.jwt_secret_key, settings.jwt_algorithm)
+    token = jwt.encode(payload, key, algorithm=settings.jwt_algorithm)
 
     return token
 
@@ -96,6 +149,8 @@ def verify_access_token(token: str, settings: Settings) -> Dict[str, Any]:
     """
     JWT 액세스 토큰을 검증하고 페이로드를 반환합니다.
 
+    검증에 성공한 토큰은 최대 30초간 캐시하며, 캐시 적중 시 exp만 다시 확인합니다.
+
     Args:
         token: 검증할 JWT 토큰 문자열
         settings: 애플리케이션 설정 (JWT 시크릿 키, 알고리즘 포함)
@@ -115,8 +170,32 @@ def verify_access_token(token: str, settings: Settings) -> Dict[str, Any]:
         >>> payload["sub"]
         'testuser'
     """
-    payload = jwt.decode(
-        token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm]
+    # 시크릿 키/알고리즘이 다른 설정에서는 캐시를 공유하지 않도록 키에 포함
+    # (시크릿 키는 평문 대신 다이제스트로 보관)
+    cache_key = (
+        _secret_digest(settings.jwt_secret_key),
+        settings.jwt_algorithm,
+        hashlib.sha256(token.encode("utf-8")).digest()[:16],
     )
+    with _token_cache_lock:
+        cached = _token_cache.get(cache_key)
+
+    if cached is not None:
+        if cached["exp"] > time.time():
+            # 호출한 쪽이 수정해도 캐시된 페이로드가 바뀌지 않도록 복사본 반환
+            return dict(cached)
+        # 캐시 TTL 안에 토큰이 만료된 경우: 캐시를 버리고 정식 검증으로 만료 예외 발생
+        with _token_cache_lock:
+            _token_cache.pop(cache_key, None)
+
+    key = _get_jwt_key(settings.jwt_secret_key, settings.jwt_algorithm)
+    # 서명 비교는 PyJWT 내부에서 hmac.compare_digest(상수 시간 비교)로 수행됨
+    # 토큰/서명을 직접 비교해야 하는 경우에도 == 대신 hmac.compare_digest를 사용할 것
+    payload = jwt.decode(token, key, algorithms=[settings.jwt_algorithm])
+
+    # exp가 없는 토큰은 만료 시점을 알 수 없으므로 캐시하지 않음
+    if "exp" in payload:
+        with _token_cache_lock:
+            _token_cache[cache_key] = dict(payload)
 
     return payload
@@ -4,30 +4,86 @@ SQLAlchemy 데이터베이스 설정
 SQLAlchemy 엔진, 세션, Base 클래스를 정의합니다.
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import DateTime, create_engine, event
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.sql.expression import FunctionElement
 
 from app.core.config import get_settings
 
 settings = get_settings()
 
 # SQLite 사용 시 check_same_thread 비활성화
-# Connection Pool 설정 (V1 Stress 테스트를 위해 증가)
+# Connection Pool 크기/타임아웃은 Settings(DB_POOL_* 환경 변수)로 조정
 engine = create_engine(
     settings.database_url,
     connect_args={"check_same_thread": False},
-    pool_size=50,  # 기본 connection pool 크기 (기본값: 5 → 50)
-    max_overflow=100,  # 추가 가능한 connection 수 (기본값: 10 → 100)
-    pool_timeout=60,  # connection 대기 timeout 초 (기본값: 30 → 60)
-    pool_pre_ping=True,  # connection 유효성 자동 체크
-    pool_recycle=3600,  # 1시간마다 connection 재생성 (stale connection 방지)
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_pre_ping=settings.db_pool_pre_ping,
+    pool_recycle=settings.db_pool_recycle,
+    # 최근 반납된 connection부터 재사용하여 유휴 connection은 자연스럽게 정리되도록 함
+    pool_use_lifo=True,
 )
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def _set_sqlite_pragma(dbapi_connection, connection_record):
+    """
+    SQLite 커넥션 생성 시 동시성/성능 관련 PRAGMA를 설정합니다.
+
+    - journal_mode=WAL: 읽기가 쓰기를 막지 않도록 WAL 모드 사용 (DB 파일에 유지됨)
+    - synchronous=NORMAL: WAL 모드에서 안전한 수준으로 fsync 횟수 감소
+    - temp_store=MEMORY: 임시 테이블/인덱스를 메모리에 생성
+    - mmap_size: DB 파일을 메모리 맵으로 읽어 read 시스템 콜 감소 (256MB)
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
+
+if engine.dialect.name == "sqlite":
+    event.listen(engine, "connect", _set_sqlite_pragma)
+
+# expire_on_commit=False: 커밋 후 응답 직렬화 시 속성마다 SELECT가 다시 나가지 않도록 함
+# (세션은 요청 단위로 닫히므로 오래된 값을 읽을 위험이 작음)
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
 
 Base = declarative_base()
 
 
+class utcnow(FunctionElement):
+    """
+    DB 서버에서 계산하는 현재 UTC 시각 (모델의 server_default / onupdate 용)
+
+    애플리케이션에서 datetime을 만들어 바인딩하지 않고 INSERT/UPDATE 문 안에서 계산합니다.
+    """
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _default_utcnow(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "sqlite")
+def _sqlite_utcnow(element, compiler, **kw):
+    # CURRENT_TIMESTAMP는 초 단위이므로 밀리초까지 포함하는 형식 사용
+    return "STRFTIME('%Y-%m-%d %H:%M:%f', 'now')"
+
+
+@compiles(utcnow, "postgresql")
+def _postgresql_utcnow(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
 def get_db():
     """
     FastAPI 의존성 주입용 데이터베이스 세션 제너레이터
@@ -1,53 +1,202 @@
 """
 Redis 클라이언트 연결 관리
+
+클라이언트(커넥션 풀)는 애플리케이션 시작 시 한 번 생성하여 app.state에 보관하고,
+요청마다 같은 인스턴스를 재사용합니다.
 """
 
-from typing import Generator
+import asyncio
+import socket
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Awaitable, Callable, Iterator
+
+from aioredlock import Aioredlock
+from fastapi import Request
+from redis import BlockingConnectionPool, Redis
+from redis.asyncio import BlockingConnectionPool as AsyncBlockingConnectionPool
+from redis.asyncio import Redis as AsyncRedis
+from redis.cache import CacheConfig
+from redis.exceptions import RedisError
+
+from app.core.config import RedisNode, Settings, get_settings
+
+# 유휴 커넥션 keepalive 프로브 주기 (초), 플랫폼이 지원하는 옵션만 설정
+# (TCP_NODELAY는 redis-py가 모든 소켓에 이미 설정하므로 별도 옵션 불필요)
+_KEEPALIVE_OPTIONS = {
+    getattr(socket, name): value
+    for name, value in (
+        ("TCP_KEEPIDLE", 30),
+        ("TCP_KEEPINTVL", 10),
+        ("TCP_KEEPCNT", 3),
+    )
+    if hasattr(socket, name)
+}
+
+
+def _node_worker_count(settings: Settings) -> int:
+    """
+    노드 요청용 스레드풀 크기
+
+    동기 엔드포인트 스레드(threadpool_size)마다 모든 노드에 요청을 동시에 보내므로
+    스레드 수 × 노드 수만큼 잡아 팬아웃이 스레드풀에서 대기하지 않도록 합니다.
+    (ThreadPoolExecutor는 필요할 때만 스레드를 만들므로 최대치가 커도 유휴 비용은 없음)
+    """
+    return settings.threadpool_size * max(len(settings.redis_node_list), 1)
+
+
+# 다중 노드에 동기 요청을 동시에 보내기 위한 공유 스레드풀 (요청마다 생성하지 않고 재사용)
+_NODE_EXECUTOR = ThreadPoolExecutor(
+    max_workers=_node_worker_count(get_settings()), thread_name_prefix="redis-node"
+)
+
+
+def _pool_options(settings: Settings) -> dict:
+    """
+    커넥션 풀 공통 옵션
+
+    - max_connections: 클라이언트당 최대 커넥션 수 (동시 실행 스레드 수 이상)
+    - timeout: 커넥션이 모두 사용 중일 때 예외 대신 대기할 최대 시간
+    - socket_timeout / socket_connect_timeout: 응답 없는 노드에서 요청 스레드가 묶이지 않도록 제한
+    - socket_keepalive: 유휴 커넥션이 중간 장비에서 끊기지 않도록 TCP keepalive 사용
+    - health_check_interval: 오래 쉬었던 커넥션은 사용 전에 PING으로 확인
+    """
+    return {
+        "db": settings.redis_db,
+        "password": settings.redis_password if settings.redis_password else None,
+        "decode_responses": True,
+        "max_connections": settings.redis_max_connections,
+        "timeout": settings.redis_socket_timeout,
+        "socket_timeout": settings.redis_socket_timeout,
+        "socket_connect_timeout": settings.redis_socket_timeout,
+        "socket_keepalive": True,
+        "socket_keepalive_options": _KEEPALIVE_OPTIONS,
+        "health_check_interval": 30,
+    }
+
+
+def _client_cache_options(settings: Settings) -> dict:
+    """
+    서버 지원 클라이언트 캐시(RESP3 CLIENT TRACKING) 옵션
 
-from fastapi import Depends
-from redis import Redis
+    활성화하면 GET/HMGET 같은 읽기 명령의 결과를 클라이언트 메모리에 보관하고,
+    키가 변경되면 Redis가 보내는 무효화 push 메시지로 해당 항목을 지웁니다.
+    같은 상품의 재고/가격을 반복 조회할 때 Redis 왕복 없이 응답합니다.
+    재고 감소는 Lua 스크립트(EVALSHA)로 실행되어 캐시되지 않습니다.
+
+    redis-py는 Redis 7.4 미만 서버에서 연결을 거부하므로 설정으로 켤 때만 사용합니다.
+    """
+    if settings.redis_client_cache_size <= 0:
+        return {}
+    return {
+        "protocol": 3,
+        "cache_config": CacheConfig(max_size=settings.redis_client_cache_size),
+    }
+
+
+def _create_client(
+    host: str, port: int, settings: Settings, **extra_options
+) -> Redis:
+    """
+    BlockingConnectionPool 기반 동기 Redis 클라이언트 생성
+
+    기본 ConnectionPool은 커넥션이 모두 사용 중이면 즉시 ConnectionError를 내므로,
+    순간적인 요청 폭주 시에도 실패 대신 잠시 대기하도록 BlockingConnectionPool을 사용합니다.
+
+    Args:
+        host: Redis 호스트
+        port: Redis 포트
+        settings: 애플리케이션 설정 객체
+        **extra_options: 커넥션 풀에 추가로 전달할 옵션
+
+    Returns:
+        Redis 클라이언트 인스턴스
+    """
+    pool = BlockingConnectionPool(
+        host=host, port=port, **_pool_options(settings), **extra_options
+    )
+    return Redis(connection_pool=pool)
+
+
+def _create_async_client(host: str, port: int, settings: Settings) -> AsyncRedis:
+    """
+    BlockingConnectionPool 기반 비동기(redis.asyncio) Redis 클라이언트 생성
+
+    Args:
+        host: Redis 호스트
+        port: Redis 포트
+        settings: 애플리케이션 설정 객체
 
-from app.core.config import Settings, get_settings
+    Returns:
+        비동기 Redis 클라이언트 인스턴스
+    """
+    pool = AsyncBlockingConnectionPool(host=host, port=port, **_pool_options(settings))
+    return AsyncRedis(connection_pool=pool)
 
 
 def create_redis_client(settings: Settings) -> Redis:
     """
     Redis 클라이언트 생성
 
+    redis_client_cache_size가 설정되면 상품 조회 경로의 반복 읽기를
+    클라이언트 캐시로 처리합니다 (Redlock 노드와 비동기 클라이언트는 사용하지 않음).
+
     Args:
         settings: 애플리케이션 설정 객체
 
     Returns:
         Redis 클라이언트 인스턴스
     """
-    return Redis(
-        host=settings.redis_host,
-        port=settings.redis_port,
-        db=settings.redis_db,
-        password=settings.redis_password if settings.redis_password else None,
-        decode_responses=True,
+    return _create_client(
+        settings.redis_host,
+        settings.redis_port,
+        settings,
+        **_client_cache_options(settings),
     )
 
 
-def get_redis_client(
-    settings: Settings = Depends(get_settings),
-) -> Generator[Redis, None, None]:
+def get_redis_client(request: Request) -> Redis:
     """
-    FastAPI 의존성 주입용 Redis 클라이언트 생성 함수
+    FastAPI 의존성 주입용 Redis 클라이언트 반환 함수
+
+    요청마다 클라이언트를 새로 만들지 않고, lifespan에서 생성한 공유 클라이언트를 반환합니다.
 
     Args:
-        settings: 애플리케이션 설정 (의존성 주입)
+        request: 현재 요청 (app.state 접근용)
 
-    Yields:
+    Returns:
         Redis 클라이언트 인스턴스
     """
-    client = create_redis_client(settings)
-    try:
-        yield client
-    finally:
-        # Redis 클라이언트는 connection pool을 사용하므로 명시적 close 필요 없음
-        # 필요시 client.close() 호출 가능
-        pass
+    return request.app.state.redis
+
+
+def create_async_redis_client(settings: Settings) -> AsyncRedis:
+    """
+    비동기(redis.asyncio) Redis 클라이언트 생성
+
+    async 엔드포인트에서 Redis 왕복 동안 이벤트 루프를 막지 않기 위해 사용합니다.
+
+    Args:
+        settings: 애플리케이션 설정 객체
+
+    Returns:
+        비동기 Redis 클라이언트 인스턴스
+    """
+    return _create_async_client(settings.redis_host, settings.redis_port, settings)
+
+
+def get_async_redis_client(request: Request) -> AsyncRedis:
+    """
+    FastAPI 의존성 주입용 비동기 Redis 클라이언트 반환 함수
+
+    lifespan에서 생성한 공유 클라이언트를 반환합니다.
+
+    Args:
+        request: 현재 요청 (app.state 접근용)
+
+    Returns:
+        비동기 Redis 클라이언트 인스턴스
+    """
+    return request.app.state.async_redis
 
 
 def create_redis_nodes(settings: Settings) -> list[Redis]:
@@ -61,38 +210,214 @@ def create_redis_nodes(settings: Settings) -> list[Redis]:
         Redis 클라이언트 인스턴스 리스트
     """
     if not settings.redis_nodes:
-        # 노드 설정이 없으면 단일 Redis 클라이언트 반환
-        return [create_redis_client(settings)]
-
-    redis_clients = []
-    for node in settings.redis_node_list:
-        client = Redis(
-            host=node["host"],
-            port=node["port"],
-            db=settings.redis_db,
-            password=settings.redis_password if settings.redis_password else None,
-            decode_responses=True,
+        # 노드 설정이 없으면 단일 Redis 노드 사용 (클라이언트 캐시 없이 생성)
+        return [_create_client(settings.redis_host, settings.redis_port, settings)]
+
+    return [
+        _create_client(node.host, node.port, settings)
+        for node in settings.redis_node_list
+    ]
+
+
+def get_redis_nodes(request: Request) -> list[Redis]:
+    """
+    FastAPI 의존성 주입용 다중 Redis 클라이언트 반환 함수
+
+    lifespan에서 생성한 공유 클라이언트 리스트를 반환합니다.
+
+    Args:
+        request: 현재 요청 (app.state 접근용)
+
+    Returns:
+        Redis 클라이언트 인스턴스 리스트
+    """
+    return request.app.state.redis_nodes
+
+
+def create_async_redis_nodes(settings: Settings) -> list[AsyncRedis]:
+    """
+    Redlock을 위한 다중 비동기(redis.asyncio) Redis 클라이언트 생성
+
+    async 엔드포인트에서 이벤트 루프를 막지 않고 노드에 동시에 요청하기 위해 사용합니다.
+    동기 클라이언트와 마찬가지로 BlockingConnectionPool을 사용합니다.
+
+    Args:
+        settings: 애플리케이션 설정 객체
+
+    Returns:
+        비동기 Redis 클라이언트 인스턴스 리스트
+    """
+    nodes = settings.redis_node_list or (
+        RedisNode(settings.redis_host, settings.redis_port),
+    )
+
+    return [_create_async_client(node.host, node.port, settings) for node in nodes]
+
+
+def get_async_redis_nodes(request: Request) -> list[AsyncRedis]:
+    """
+    FastAPI 의존성 주입용 다중 비동기 Redis 클라이언트 반환 함수
+
+    lifespan에서 생성한 공유 클라이언트 리스트를 반환합니다.
+
+    Args:
+        request: 현재 요청 (app.state 접근용)
+
+    Returns:
+        비동기 Redis 클라이언트 인스턴스 리스트
+    """
+    return request.app.state.async_redis_nodes
+
+
+def create_lock_manager(settings: Settings) -> Aioredlock:
+    """
+    aioredlock 락 매니저 생성
+
+    락 매니저는 노드별 커넥션 풀을 내부에 보관하므로 요청마다 만들고 정리하면
+    매번 노드 연결을 새로 맺게 됩니다. 애플리케이션 시작 시 한 번 생성하여 재사용합니다.
+    (커넥션은 첫 락 요청 시점에 맺어짐)
+
+    Args:
+        settings: 애플리케이션 설정 객체
+
+    Returns:
+        Aioredlock 락 매니저 인스턴스
+    """
+    redis_connections = [
+        f"redis://{node.host}:{node.port}/0" for node in settings.redis_node_list
+    ]
+
+    if not redis_connections:
+        # 노드 정보가 없으면 기본 단일 Redis 사용
+        redis_connections.append(
+            f"redis://{settings.redis_host}:{settings.redis_port}/{settings.redis_db}"
         )
-        redis_clients.append(client)
 
-    return redis_clients
+    return Aioredlock(
+        redis_connections,
+        retry_count=settings.lock_retry_attempts,
+        retry_delay_min=settings.lock_retry_delay_ms / 1000.0,
+        # 재시도 간격에 충분한 지터 폭을 줘서 경합 중인 클라이언트들이 같은 시점에 몰리지 않게 함
+        retry_delay_max=settings.lock_retry_delay_ms / 1000.0 * 4,
+    )
+
+
+def get_lock_manager(request: Request) -> Aioredlock:
+    """
+    FastAPI 의존성 주입용 aioredlock 락 매니저 반환 함수
+
+    lifespan에서 생성한 공유 락 매니저를 반환합니다.
+
+    Args:
+        request: 현재 요청 (app.state 접근용)
+
+    Returns:
+        Aioredlock 락 매니저 인스턴스
+    """
+    return request.app.state.lock_manager
+
+
+def quorum_size(redis_nodes: list) -> int:
+    """
+    Redlock 쿼럼(과반수) 크기를 반환합니다.
+
+    Args:
+        redis_nodes: Redis 클라이언트 리스트
 
+    Returns:
+        과반수 노드 수 (N // 2 + 1)
+    """
+    return len(redis_nodes) // 2 + 1
 
-def get_redis_nodes(
-    settings: Settings = Depends(get_settings),
-) -> Generator[list[Redis], None, None]:
+
+def run_on_nodes(fn: Callable[[Redis], Any], redis_nodes: list[Redis]) -> list:
     """
-    FastAPI 의존성 주입용 다중 Redis 클라이언트 생성 함수
+    모든 노드에 fn을 동시에 실행하고 노드 순서대로 결과를 반환합니다.
+
+    노드마다 순차적으로 왕복하면 지연이 N·RTT가 되므로 공유 스레드풀로 병렬 전송하여
+    약 1·RTT로 줄입니다. 노드가 하나면 스레드 전환 없이 바로 실행합니다.
+
+    Redis 오류(연결 실패, 타임아웃 등)만 노드 실패로 처리하고,
+    그 외 예외(코드 버그)는 삼키지 않고 그대로 전파합니다.
 
     Args:
-        settings: 애플리케이션 설정 (의존성 주입)
+        fn: Redis 클라이언트 하나를 받아 명령을 실행하는 함수
+        redis_nodes: Redis 클라이언트 리스트
+
+    Returns:
+        노드 순서대로 정렬된 결과 리스트 (Redis 오류가 발생한 노드는 None)
+    """
+    if len(redis_nodes) == 1:
+        try:
+            return [fn(redis_nodes[0])]
+        except RedisError:
+            return [None]
+
+    futures = [_NODE_EXECUTOR.submit(fn, redis) for redis in redis_nodes]
+    results = []
+    for future in futures:
+        try:
+            results.append(future.result())
+        except RedisError:
+            results.append(None)
+    return results
+
+
+def iter_on_nodes(fn: Callable[[Redis], Any], redis_nodes: list[Redis]) -> Iterator:
+    """
+    모든 노드에 fn을 동시에 실행하고 응답이 도착하는 순서대로 결과를 내보냅니다.
+
+    쿼럼 판단이 끝나면 호출하는 쪽에서 반복을 멈춰 느린 노드의 응답을 기다리지 않을 수
+    있습니다 (이미 전송된 요청은 스레드풀에서 마저 끝나고 결과는 버려짐).
+    응답을 모두 받아야 하는 쓰기(감소/롤백/락 해제)에는 run_on_nodes를 사용합니다.
+
+    Args:
+        fn: Redis 클라이언트 하나를 받아 명령을 실행하는 함수
+        redis_nodes: Redis 클라이언트 리스트
 
     Yields:
-        Redis 클라이언트 인스턴스 리스트
+        노드별 결과 (완료 순서, Redis 오류가 발생한 노드는 None)
+    """
+    futures = [_NODE_EXECUTOR.submit(fn, redis) for redis in redis_nodes]
+    for future in as_completed(futures):
+        try:
+            yield future.result()
+        except RedisError:
+            yield None
+
+
+async def run_on_nodes_async(
+    fn: Callable[[AsyncRedis], Awaitable[Any]], redis_nodes: list[AsyncRedis]
+) -> list:
+    """
+    run_on_nodes의 비동기(redis.asyncio) 버전입니다.
+
+    모든 노드의 코루틴을 asyncio.gather로 동시에 실행합니다.
+
+    Args:
+        fn: 비동기 Redis 클라이언트 하나를 받아 명령 코루틴을 반환하는 함수
+        redis_nodes: 비동기 Redis 클라이언트 리스트
+
+    Returns:
+        노드 순서대로 정렬된 결과 리스트 (Redis 오류가 발생한 노드는 None)
+    """
+    results = await asyncio.gather(
+        *(fn(redis) for redis in redis_nodes), return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, BaseException) and not isinstance(result, RedisError):
+            raise result
+    return [None if isinstance(result, RedisError) else result for result in results]
+
+
+async def warm_up_async_clients(redis_clients: list[AsyncRedis]) -> None:
+    """
+    비동기 Redis 클라이언트마다 PING을 보내 커넥션을 미리 하나씩 맺어 둡니다.
+
+    첫 요청이 TCP 연결/핸드셰이크 비용을 치르지 않도록 애플리케이션 시작 시 호출합니다.
+    응답하지 않는 노드는 건너뜁니다 (요청 처리 시 다시 연결을 시도함).
+
+    Args:
+        redis_clients: 비동기 Redis 클라이언트 리스트
     """
-    clients = create_redis_nodes(settings)
-    try:
-        yield clients
-    finally:
-        # Redis 클라이언트는 connection pool을 사용하므로 명시적 close 필요 없음
-        pass
+    await run_on_nodes_async(lambda redis: redis.ping(), redis_clients)
@@ -1,22 +1,121 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+import anyio.to_thread
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response
 
 from app.api.routes import auth, products, purchases, purchases_redlock
+from app.core.config import get_settings
+from app.core.exceptions import (
+    InsufficientStockException,
+    InvalidCredentialsException,
+    LockAcquisitionException,
+    ProductAlreadyExistsException,
+    ProductNotFoundException,
+    UserAlreadyExistsException,
+    UserNotFoundException,
+)
+from app.db.redis_client import (
+    create_async_redis_client,
+    create_async_redis_nodes,
+    create_lock_manager,
+    create_redis_client,
+    create_redis_nodes,
+    warm_up_async_clients,
+)
+from app.services.inventory_service import InventoryService
+from app.services.redlock_manual_service import RedlockManualService
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    애플리케이션 시작/종료 시 공유 리소스를 준비하고 정리합니다.
+
+    Redis 클라이언트(커넥션 풀)는 요청마다 만들지 않고 여기서 한 번 생성하여
+    app.state에 보관합니다.
+    """
+    settings = get_settings()
+
+    # 구매/인증 엔드포인트는 동기(def)이므로 스레드풀에서 실행됨
+    # Redis 락 대기 중에도 다른 요청이 처리되도록 동시 실행 스레드 수를 늘림
+    anyio.to_thread.current_default_thread_limiter().total_tokens = (
+        settings.threadpool_size
+    )
+
+    app.state.redis = create_redis_client(settings)
+    app.state.async_redis = create_async_redis_client(settings)
+    app.state.redis_nodes = create_redis_nodes(settings)
+    app.state.async_redis_nodes = create_async_redis_nodes(settings)
+    app.state.lock_manager = create_lock_manager(settings)
+    await warm_up_async_clients(
+        [app.state.async_redis, *app.state.async_redis_nodes]
+    )
+    InventoryService.load_scripts(app.state.redis)
+    RedlockManualService.load_scripts(app.state.redis_nodes)
+
+    yield
 
+    app.state.redis.close()
+    await app.state.async_redis.aclose(close_connection_pool=True)
+    for node in app.state.redis_nodes:
+        node.close()
+    for node in app.state.async_redis_nodes:
+        await node.aclose(close_connection_pool=True)
+    await app.state.lock_manager.destroy()
+
+
+# response_model이 지정된 엔드포인트는 FastAPI가 Pydantic으로 바로 JSON bytes를 만듦
+# default_response_class를 지정하면 이 경로가 꺼지고 dict 변환 + json 직렬화를 두 번 거치게 됨
 app = FastAPI(
     title="Redis Lock Inventory API",
     description="Redis 기반 비관적 락을 활용한 재고 관리 시스템",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
+# 인증은 쿠키가 아닌 Authorization 헤더(Bearer)로 하므로 credentials는 Origin을
+# 명시한 경우에만 허용함 (와일드카드 + credentials 조합은 요청마다 Origin을 되돌려 씀)
+_cors_origins = get_settings().cors_origin_list
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
+    allow_origins=_cors_origins,
+    allow_credentials="*" not in _cors_origins,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+# 도메인 예외 → HTTP 상태 코드
+# 엔드포인트마다 try/except로 변환하지 않고 전역 핸들러 하나로 처리
+HTTP_STATUS_BY_EXCEPTION: dict[type[Exception], int] = {
+    UserAlreadyExistsException: status.HTTP_409_CONFLICT,
+    ProductAlreadyExistsException: status.HTTP_409_CONFLICT,
+    ProductNotFoundException: status.HTTP_404_NOT_FOUND,
+    InsufficientStockException: status.HTTP_400_BAD_REQUEST,
+    LockAcquisitionException: status.HTTP_400_BAD_REQUEST,
+    # 인증 의존성(get_current_user)에서 발생하는 예외
+    InvalidCredentialsException: status.HTTP_401_UNAUTHORIZED,
+    UserNotFoundException: status.HTTP_401_UNAUTHORIZED,
+}
+
+
+async def domain_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+    """도메인 예외를 HTTPException과 같은 형식({"detail": ...})의 응답으로 변환합니다."""
+    status_code = HTTP_STATUS_BY_EXCEPTION[type(exc)]
+    headers = (
+        {"WWW-Authenticate": "Bearer"}
+        if status_code == status.HTTP_401_UNAUTHORIZED
+        else None
+    )
+    return JSONResponse(
+        status_code=status_code, content={"detail": str(exc)}, headers=headers
+    )
+
+
+for exception_class in HTTP_STATUS_BY_EXCEPTION:
+    app.add_exception_handler(exception_class, domain_exception_handler)
+
 # 라우터 등록
 app.include_router(auth.router, prefix="/api/auth", tags=["authentication"])
 app.include_router(products.router, prefix="/api", tags=["products"])
@@ -34,7 +133,11 @@ async def root():
     }
 
 
+# 헬스체크 응답은 항상 같으므로 미리 직렬화한 바이트를 그대로 반환
+_HEALTH_RESPONSE_BODY = b'{"status":"healthy"}'
+
+
 @app.get("/health")
 async def health_check():
     """헬스체크 엔드포인트 (Docker 헬스체크용)"""
-    return {"status": "healthy"}
+    return Response(content=_HEALTH_RESPONSE_BODY, media_type="application/json")
@@ -2,9 +2,8 @@
 Product 모델
 """
 
-from datetime import datetime
 from sqlalchemy import Column, Integer, String, Text, DateTime
-from app.db.database import Base
+from app.db.database import Base, utcnow
 
 
 class Product(Base):
@@ -22,15 +21,17 @@ class Product(Base):
     """
 
     __tablename__ = "products"
+    # INSERT 시 DB가 채운 일시를 RETURNING으로 함께 받아옴 (별도 SELECT 없음)
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     name = Column(String(100), nullable=False, index=True)
     description = Column(Text, nullable=True)
     price = Column(Integer, nullable=False)
     stock = Column(Integer, nullable=False)  # 현재 재고 (Redis와 동기화)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
     updated_at = Column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime, server_default=utcnow(), onupdate=utcnow(), nullable=False
     )
 
     def __repr__(self) -> str:
@@ -2,10 +2,9 @@
 Purchase 모델
 """
 
-from datetime import datetime
-from sqlalchemy import Column, Integer, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
-from app.db.database import Base
+from app.db.database import Base, utcnow
 
 
 class Purchase(Base):
@@ -24,13 +23,19 @@ class Purchase(Base):
     """
 
     __tablename__ = "purchases"
+    __table_args__ = (
+        # 사용자별 구매 이력을 최신순으로 조회할 때 사용 (GET /purchases/me)
+        Index("ix_purchases_user_id_purchased_at", "user_id", "purchased_at"),
+    )
+    # INSERT 시 DB가 채운 일시를 RETURNING으로 함께 받아옴 (별도 SELECT 없음)
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     product_id = Column(Integer, ForeignKey("products.id"), nullable=False, index=True)
     quantity = Column(Integer, nullable=False)
     total_price = Column(Integer, nullable=False)
-    purchased_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    purchased_at = Column(DateTime, server_default=utcnow(), nullable=False)
 
     # Relationships
     user = relationship("User", backref="purchases")
@@ -2,9 +2,8 @@
 User 모델
 """
 
-from datetime import datetime
 from sqlalchemy import Column, Integer, String, DateTime
-from app.db.database import Base
+from app.db.database import Base, utcnow
 
 
 class User(Base):
@@ -21,16 +20,18 @@ class User(Base):
     """
 
     __tablename__ = "users"
+    # INSERT 시 DB가 채운 일시를 RETURNING으로 함께 받아옴 (별도 SELECT 없음)
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     username = Column(String(50), unique=True, nullable=False, index=True)
     email = Column(String(100), unique=True, nullable=True, index=True)
     hashed_password = Column(String(255), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
     updated_at = Column(
         DateTime,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=utcnow(),
+        onupdate=utcnow(),
         nullable=False,
     )
 
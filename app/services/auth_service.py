@@ -4,7 +4,12 @@
 사용자 등록, 로그인, 토큰 기반 사용자 조회 기능을 제공합니다.
 """
 
+import threading
+from typing import Optional
+
 import jwt
+from cachetools import TTLCache
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 
 from app.core.config import Settings
@@ -17,11 +22,33 @@ from app.core.exceptions import (
 from app.models.user import User
 
 
+# username으로 사용자를 조회하는 문장은 모듈 로드 시 한 번만 구성하여 재사용
+# (호출마다 쿼리 객체/절을 새로 만들지 않고, 컴파일된 SQL은 SQLAlchemy 캐시에서 재사용됨)
+_USER_BY_USERNAME = select(User).where(User.username == bindparam("username"))
+
+# username → 사용자 캐시
+# 인증이 필요한 요청마다 users 테이블을 조회하지 않도록 세션에서 분리한 User를 보관합니다.
+# 동기 엔드포인트는 스레드풀에서 실행되므로 Lock으로 보호합니다.
+_user_cache: TTLCache = TTLCache(maxsize=5_000, ttl=60)
+_user_cache_lock = threading.Lock()
+
+
+def clear_user_cache() -> None:
+    """username → 사용자 캐시를 비웁니다."""
+    with _user_cache_lock:
+        _user_cache.clear()
+
+
 class AuthService:
     """인증 관련 비즈니스 로직을 처리하는 서비스 클래스"""
 
     @staticmethod
-    def register_user(username: str, password: str, db: Session) -> User:
+    def register_user(
+        username: str,
+        password: str,
+        db: Session,
+        settings: Optional[Settings] = None,
+    ) -> User:
         """
         새 사용자를 등록합니다.
 
@@ -29,6 +56,7 @@ class AuthService:
             username: 사용자명
             password: 평문 비밀번호
             db: 데이터베이스 세션
+            settings: 애플리케이션 설정 (bcrypt cost), 없으면 bcrypt 기본값 사용
 
         Returns:
             User: 생성된 사용자 객체
@@ -41,15 +69,18 @@ class AuthService:
             >>> user.username
             'john'
         """
-        existing_user = db.query(User).filter(User.username == username).first()
+        existing_user = db.execute(
+            _USER_BY_USERNAME, {"username": username}
+        ).scalar_one_or_none()
         if existing_user:
             raise UserAlreadyExistsException(username)
 
-        hashed_password = hash_password(password)
+        rounds = settings.bcrypt_rounds if settings is not None else None
+        hashed_password = hash_password(password, rounds=rounds)
         new_user = User(username=username, hashed_password=hashed_password)
         db.add(new_user)
+        # id와 생성/수정 일시는 INSERT(flush) 시점에 채워지므로 커밋 후 refresh로 다시 조회하지 않음
         db.commit()
-        db.refresh(new_user)
 
         return new_user
 
@@ -71,7 +102,9 @@ class AuthService:
             >>> user.username if user else None
             'john'
         """
-        user: User | None = db.query(User).filter(User.username == username).first()
+        user: User | None = db.execute(
+            _USER_BY_USERNAME, {"username": username}
+        ).scalar_one_or_none()
         if not user:
             return None
         if not verify_password(password, user.hashed_password):
@@ -83,6 +116,8 @@ class AuthService:
         """
         JWT 토큰에서 현재 사용자를 조회합니다.
 
+        토큰 검증 후 조회한 사용자는 최대 60초간 username 기준으로 캐시합니다.
+
         Args:
             token: JWT 액세스 토큰
             db: 데이터베이스 세션
@@ -115,8 +150,21 @@ class AuthService:
         username = payload.get("sub")
         if not username:
             raise InvalidCredentialsException("Token payload missing 'sub' claim")
-        user = db.query(User).filter(User.username == username).first()
+
+        with _user_cache_lock:
+            user = _user_cache.get(username)
+        if user is not None:
+            return user
+
+        user = db.execute(
+            _USER_BY_USERNAME, {"username": username}
+        ).scalar_one_or_none()
         if not user:
             raise UserNotFoundException(username)
 
+        # 세션에서 분리하여 다른 요청의 세션 커밋/종료와 무관하게 재사용
+        db.expunge(user)
+        with _user_cache_lock:
+            _user_cache[username] = user
+
         return user
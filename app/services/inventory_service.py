@@ -1,17 +1,163 @@
 """Redis 락을 이용한 재고 관리 서비스."""
 
+import asyncio
+import os
+import random
 import time
-import uuid
-from typing import Optional
+from collections import Counter
+from typing import NamedTuple, Optional
 
 from redis import Redis
+from redis.asyncio import Redis as AsyncRedis
+from redis.commands.core import AsyncScript, Script
+from redis.exceptions import RedisError
 
 from app.core.config import Settings
 
 
+# Lua 스크립트는 모듈 로드 시 한 번만 만들어 SHA1을 미리 계산해 둠
+# 호출 시 EVALSHA로 40바이트 SHA만 전송하므로 Redis가 매번 본문을 파싱하지 않음
+# (서버에 스크립트가 없으면 redis-py가 SCRIPT LOAD 후 자동으로 재시도)
+# 전송/로드 크기를 줄이기 위해 설명은 Lua 주석 대신 아래 Python 주석으로 둠
+
+# 락 획득 + 원자적 재고 감소 + 락 해제를 합친 스크립트
+#
+# ✅ Lua 스크립트 사용 이유:
+# ------------------------------------------------------------------
+# 1. 원자성: GET + 재고 확인 + DECRBY가 단일 연산으로 실행
+# 2. Race Condition 방지: Redis는 단일 스레드이므로 스크립트 실행 중
+#    다른 명령이 끼어들 수 없음
+# 3. 네트워크 왕복 감소: SET NX(락) → EVAL(감소) → EVAL(해제)
+#    3번의 왕복 → 1번으로 감소
+#
+# ❌ Python 코드로 구현 시 문제점:
+# ------------------------------------------------------------------
+# current_stock = redis.get(f"stock:{product_id}")     # ① GET 연산
+# if int(current_stock) >= quantity:                   # ② 비교 연산
+#     redis.decrby(f"stock:{product_id}", quantity)    # ③ DECRBY 연산
+#
+# 문제 시나리오 (락이 있어도 발생 가능):
+# T1: 프로세스 A가 ①에서 GET → 재고 10
+# T2: 프로세스 B가 ①에서 GET → 재고 10
+# T3: 프로세스 A가 ②에서 확인 (10 >= 5) → ③에서 DECRBY 5 → 재고 5
+# T4: 프로세스 B가 ②에서 확인 (10 >= 8) → ③에서 DECRBY 8 → 재고 -3 💥
+# 결과: 재고가 음수가 되는 데이터 무결성 문제 발생
+#
+# 📝 스크립트 상세 설명:
+# ------------------------------------------------------------------
+# KEYS[1] = "stock:{product_id}", KEYS[2] = "lock:stock:{product_id}"
+# ARGV[1] = quantity, ARGV[2] = lock_id, ARGV[3] = 락 TTL(초)
+#
+# 반환값: {결과 코드, 재고} (InventoryService.DECREASE_* 코드 참고)
+#
+# ① 락 획득 (NX: 키가 없을 때만, EX: 데드락 방지용 TTL)
+#    다른 클라이언트가 락(StockKeys.lock)을 점유 중이면 {-3} 반환 (재시도 대상)
+# ② 현재 재고 조회, 키가 없으면 락 해제 후 {-2} 반환 (상품 없음)
+# ③ tonumber()로 문자열 → 숫자 변환 (Redis는 모든 값을 문자열로 저장)
+# ④ 재고가 충분하면 DECRBY 후 {0, 남은 재고} 반환,
+#    부족하면 {-1, 현재 재고} 반환 (실패 원인 파악용 GET 왕복이 필요 없음)
+# ⑤ 반환 전 락 해제 (스크립트 안에서 획득한 락이므로 소유권 확인 불필요)
+_DECREASE_STOCK_LUA = b"""
+if not redis.call("SET", KEYS[2], ARGV[2], "NX", "EX", ARGV[3]) then
+    return {-3}
+end
+local current_stock = redis.call("GET", KEYS[1])
+if not current_stock then
+    redis.call("DEL", KEYS[2])
+    return {-2}
+end
+current_stock = tonumber(current_stock)
+local quantity = tonumber(ARGV[1])
+local result = {-1, current_stock}
+if current_stock >= quantity then
+    redis.call("DECRBY", KEYS[1], quantity)
+    result = {0, current_stock - quantity}
+end
+redis.call("DEL", KEYS[2])
+return result
+"""
+
+# 재고 조회, 없으면 초기화 (GET → SET NX → GET 세 번의 왕복을 한 번으로)
+# 다른 프로세스가 먼저 초기화했더라도 SET NX는 덮어쓰지 않으므로 항상 실제 값을 반환
+_GET_OR_INIT_STOCK_LUA = b"""
+local stock = redis.call("GET", KEYS[1])
+if stock then
+    return tonumber(stock)
+end
+redis.call("SET", KEYS[1], ARGV[1], "NX")
+return tonumber(redis.call("GET", KEYS[1]))
+"""
+
+# bytes 스크립트는 인코더가 필요 없으므로 특정 클라이언트에 묶지 않고 생성
+_DECREASE_STOCK_SCRIPT = Script(None, _DECREASE_STOCK_LUA)
+_GET_OR_INIT_STOCK_SCRIPT = Script(None, _GET_OR_INIT_STOCK_LUA)
+
+# redis.asyncio 클라이언트용 (SHA는 동기 버전과 같으므로 load_scripts 결과를 공유)
+_DECREASE_STOCK_ASYNC_SCRIPT = AsyncScript(None, _DECREASE_STOCK_LUA)
+
+
+class StockKeys(NamedTuple):
+    """상품 하나의 재고/락 Redis 키 (요청당 한 번만 생성)."""
+
+    stock: bytes
+    lock: bytes
+
+    @classmethod
+    def from_id(cls, product_id: int) -> "StockKeys":
+        # bytes 키는 redis-py가 전송 시 다시 인코딩하지 않음
+        return cls(b"stock:%d" % product_id, b"lock:stock:%d" % product_id)
+
+
+def retry_delay(attempt: int, settings: Settings) -> float:
+    """
+    락 재시도 대기 시간을 계산합니다 (지수 백오프 + 지터).
+
+    대기 중인 클라이언트들이 동시에 깨어나 같은 키로 몰리지 않도록
+    지연을 시도마다 두 배로 늘리고(상한 적용) 무작위 지터를 곱합니다.
+
+    Args:
+        attempt: 0부터 시작하는 시도 횟수
+        settings: 애플리케이션 설정
+
+    Returns:
+        대기 시간 (초)
+    """
+    base_delay = settings.lock_retry_delay_ms / 1000.0  # ms를 초로 변환
+    max_delay = settings.lock_retry_max_delay_ms / 1000.0
+    delay = min(max_delay, base_delay * 2**attempt)
+    return delay * random.uniform(0.5, 1.5)
+
+
 class InventoryService:
     """비관적 락을 이용한 재고 관리 서비스."""
 
+    # decrease_stock 결과 코드
+    DECREASE_SUCCESS = 0
+    DECREASE_INSUFFICIENT_STOCK = -1
+    DECREASE_PRODUCT_NOT_FOUND = -2
+    DECREASE_LOCK_NOT_ACQUIRED = -3
+
+    @staticmethod
+    def load_scripts(redis: Redis) -> None:
+        """
+        Redis에 Lua 스크립트를 미리 등록합니다 (SCRIPT LOAD).
+
+        첫 구매 요청이 NOSCRIPT 응답 후 재시도하는 왕복을 없애기 위해
+        애플리케이션 시작 시 호출합니다. Redis가 응답하지 않으면 건너뜁니다
+        (스크립트는 첫 호출 시 EVALSHA의 NOSCRIPT 재시도로 등록됨).
+
+        Args:
+            redis: Redis 클라이언트
+        """
+        try:
+            for script in (
+                _DECREASE_STOCK_SCRIPT,
+                _GET_OR_INIT_STOCK_SCRIPT,
+            ):
+                redis.script_load(script.script)
+        except RedisError:
+            pass
+
     @staticmethod
     def initialize_stock(product_id: int, quantity: int, redis: Redis) -> bool:
         """
@@ -28,7 +174,7 @@ class InventoryService:
         Returns:
             성공 시 True (재고 초기화됨), 이미 존재하면 False
         """
-        stock_key = f"stock:{product_id}"
+        stock_key = StockKeys.from_id(product_id).stock
         # NX 옵션: 키가 없을 때만 설정 (SETNX)
         result = redis.set(stock_key, quantity, nx=True)
         return bool(result)
@@ -45,9 +191,29 @@ class InventoryService:
         Returns:
             현재 재고 수량, 상품이 없으면 None
         """
-        stock = redis.get(f"stock:{product_id}")
+        stock = redis.get(StockKeys.from_id(product_id).stock)
         return int(stock) if stock else None
 
+    @staticmethod
+    def get_or_initialize_stock(product_id: int, quantity: int, redis: Redis) -> int:
+        """
+        Redis 재고를 조회하고, 없으면 주어진 수량으로 초기화합니다.
+
+        조회와 SETNX 초기화를 Lua 스크립트 하나로 처리하므로 키가 없을 때도
+        왕복은 한 번입니다. 이미 다른 프로세스가 초기화한 값은 덮어쓰지 않습니다.
+
+        Args:
+            product_id: 상품 ID
+            quantity: 재고가 없을 때 초기화할 수량
+            redis: Redis 클라이언트
+
+        Returns:
+            현재(또는 초기화된) 재고 수량
+        """
+        return _GET_OR_INIT_STOCK_SCRIPT(
+            keys=[StockKeys.from_id(product_id).stock], args=[quantity], client=redis
+        )
+
     @staticmethod
     def increase_stock(product_id: int, quantity: int, redis: Redis) -> bool:
         """
@@ -62,192 +228,158 @@ class InventoryService:
             redis: Redis 클라이언트
 
         Returns:
-            성공 시 True, 키가 없으면 False
+            성공 시 True, Redis 오류(연결 실패 등) 시 False
         """
-        stock_key = f"stock:{product_id}"
+        stock_key = StockKeys.from_id(product_id).stock
         try:
             redis.incrby(stock_key, quantity)
             return True
-        except Exception:
+        except RedisError:
             return False
 
     @staticmethod
-    def _get_lock_key(product_id: int) -> str:
+    async def increase_stock_async(
+        product_id: int, quantity: int, redis: AsyncRedis
+    ) -> bool:
         """
-        상품의 락 키를 생성합니다.
+        increase_stock의 비동기(redis.asyncio) 버전입니다.
 
         Args:
             product_id: 상품 ID
+            quantity: 증가시킬 수량
+            redis: 비동기 Redis 클라이언트
 
         Returns:
-            락 키 문자열
+            성공 시 True, 실패 시 False
         """
-        return f"lock:stock:{product_id}"
+        try:
+            await redis.incrby(StockKeys.from_id(product_id).stock, quantity)
+            return True
+        except RedisError:
+            return False
 
     @staticmethod
-    def _acquire_lock(
-        product_id: int, redis: Redis, settings: Settings
-    ) -> Optional[str]:
+    def decrease_stock(
+        product_id: int, quantity: int, redis: Redis, settings: Settings
+    ) -> tuple[int, Optional[int]]:
         """
-        TTL을 설정하여 SETNX로 락을 획득합니다.
+        비관적 락과 재시도 메커니즘으로 재고를 감소시킵니다.
+
+        락 획득, 재고 확인/감소, 락 해제를 하나의 Lua 스크립트로 실행하므로
+        시도 한 번이 Redis 왕복 한 번입니다.
+
+        플로우 (스크립트 내부):
+        1. 락 획득 (SET NX EX), 이미 점유 중이면 지연 후 재시도
+        2. 재고 가용성 확인
+        3. 재고 원자적 감소
+        4. 락 해제
 
         Args:
             product_id: 상품 ID
+            quantity: 감소시킬 수량
             redis: Redis 클라이언트
             settings: 애플리케이션 설정
 
         Returns:
-            획득 성공 시 락 ID (UUID), 이미 락이 점유 중이면 None
+            (결과 코드, 재고) 튜플
+            - DECREASE_SUCCESS: 재고는 감소 후 남은 수량
+            - DECREASE_INSUFFICIENT_STOCK: 재고는 감소 시도 시점의 현재 수량
+            - DECREASE_PRODUCT_NOT_FOUND: 재고는 None
+            - DECREASE_LOCK_NOT_ACQUIRED: 재고는 None (락 획득 재시도 초과)
         """
-        lock_key = InventoryService._get_lock_key(product_id)
-        lock_id = str(uuid.uuid4())
+        # 키는 재시도 루프 밖에서 한 번만 만들고 모든 시도에서 재사용
+        keys = StockKeys.from_id(product_id)
 
-        # NX: 키가 없을 때만 설정
-        # EX: 데드락 방지를 위한 만료 시간(TTL) 설정
-        acquired = redis.set(
-            lock_key, lock_id, nx=True, ex=settings.lock_timeout_seconds
-        )
+        # 락 획득을 위한 재시도 메커니즘
+        max_retries = settings.lock_retry_attempts
 
-        return lock_id if acquired else None
+        for attempt in range(max_retries):
+            lock_id = os.urandom(8).hex()
+            code, *stock = _DECREASE_STOCK_SCRIPT(
+                keys=keys,
+                args=[quantity, lock_id, settings.lock_timeout_seconds],
+                client=redis,
+            )
+
+            if code != InventoryService.DECREASE_LOCK_NOT_ACQUIRED:
+                # 성공, 재고 부족 또는 상품 없음
+                return code, stock[0] if stock else None
+
+            # 락 획득 실패, 지연 후 재시도
+            if attempt < max_retries - 1:
+                time.sleep(retry_delay(attempt, settings))
+
+        # 최대 재시도 횟수 초과
+        return InventoryService.DECREASE_LOCK_NOT_ACQUIRED, None
 
     @staticmethod
-    def _release_lock(product_id: int, lock_id: str, redis: Redis) -> bool:
+    async def decrease_stock_async(
+        product_id: int, quantity: int, redis: AsyncRedis, settings: Settings
+    ) -> tuple[int, Optional[int]]:
         """
-        원자성을 보장하는 Lua 스크립트로 락을 해제합니다.
+        decrease_stock의 비동기(redis.asyncio) 버전입니다.
 
-        락 ID가 일치하는 경우에만 해제합니다 (다른 클라이언트의 락을
-        실수로 해제하는 것을 방지).
+        같은 Lua 스크립트를 사용하며, 락 재시도 대기 중에도 이벤트 루프가
+        다른 요청을 처리할 수 있도록 asyncio.sleep으로 대기합니다.
 
         Args:
             product_id: 상품 ID
-            lock_id: 소유권 확인용 락 ID
-            redis: Redis 클라이언트
+            quantity: 감소시킬 수량
+            redis: 비동기 Redis 클라이언트
+            settings: 애플리케이션 설정
 
         Returns:
-            락 해제 성공 시 True, 실패 시 False
-        """
-        # Lua 스크립트로 원자성 보장: GET + 비교 + DEL을 하나의 트랜잭션으로
-        release_script = """
-        if redis.call("GET", KEYS[1]) == ARGV[1] then
-            return redis.call("DEL", KEYS[1])
-        else
-            return 0
-        end
+            (결과 코드, 재고) 튜플 (decrease_stock과 동일)
         """
+        keys = StockKeys.from_id(product_id)
+        max_retries = settings.lock_retry_attempts
 
-        lock_key = InventoryService._get_lock_key(product_id)
-        result = redis.eval(release_script, 1, lock_key, lock_id)
+        for attempt in range(max_retries):
+            lock_id = os.urandom(8).hex()
+            code, *stock = await _DECREASE_STOCK_ASYNC_SCRIPT(
+                keys=keys,
+                args=[quantity, lock_id, settings.lock_timeout_seconds],
+                client=redis,
+            )
 
-        return bool(result)
+            if code != InventoryService.DECREASE_LOCK_NOT_ACQUIRED:
+                return code, stock[0] if stock else None
+
+            if attempt < max_retries - 1:
+                await asyncio.sleep(retry_delay(attempt, settings))
+
+        return InventoryService.DECREASE_LOCK_NOT_ACQUIRED, None
 
     @staticmethod
-    def decrease_stock(
-        product_id: int, quantity: int, redis: Redis, settings: Settings
-    ) -> bool:
+    def combine_node_results(
+        results: list[Optional[list]], quorum: int
+    ) -> tuple[int, Optional[int]]:
         """
-        비관적 락과 재시도 메커니즘으로 재고를 감소시킵니다.
+        여러 Redis 노드의 재고 감소 결과를 하나의 (결과 코드, 재고)로 합칩니다.
 
-        플로우:
-        1. 락 획득 시도 (재시도 포함)
-        2. 재고 가용성 확인
-        3. 재고 원자적 감소
-        4. 락 해제
+        Redlock 경로에서 노드마다 실행한 감소 스크립트 결과를 쿼럼으로 판단합니다.
+        쿼럼 이상의 노드가 감소에 성공하면 DECREASE_SUCCESS를, 아니면 가장 많은
+        노드가 보고한 실패 원인을 반환하므로 실패 원인을 알기 위한 재조회가 필요 없습니다.
 
         Args:
-            product_id: 상품 ID
-            quantity: 감소시킬 수량
-            redis: Redis 클라이언트
-            settings: 애플리케이션 설정
+            results: 노드별 스크립트 결과 ([코드, 재고] 또는 [코드], 요청 실패 시 None)
+            quorum: 성공으로 판단할 최소 노드 수
 
         Returns:
-            재고 감소 성공 시 True, 실패 시 False
-            (재고 부족 또는 상품 없음)
-        """
-        # 원자적 재고 감소를 위한 Lua 스크립트
-        #
-        # ✅ Lua 스크립트 사용 이유:
-        # ------------------------------------------------------------------
-        # 1. 원자성: GET + 재고 확인 + DECRBY가 단일 연산으로 실행
-        # 2. Race Condition 방지: Redis는 단일 스레드이므로 스크립트 실행 중
-        #    다른 명령이 끼어들 수 없음
-        # 3. 네트워크 왕복 감소: 3번의 왕복 → 1번으로 감소
-        #
-        # ❌ Python 코드로 구현 시 문제점:
-        # ------------------------------------------------------------------
-        # current_stock = redis.get(f"stock:{product_id}")     # ① GET 연산
-        # if int(current_stock) >= quantity:                   # ② 비교 연산
-        #     redis.decrby(f"stock:{product_id}", quantity)    # ③ DECRBY 연산
-        #
-        # 문제 시나리오 (락이 있어도 발생 가능):
-        # T1: 프로세스 A가 ①에서 GET → 재고 10
-        # T2: 프로세스 B가 ①에서 GET → 재고 10
-        # T3: 프로세스 A가 ②에서 확인 (10 >= 5) → ③에서 DECRBY 5 → 재고 5
-        # T4: 프로세스 B가 ②에서 확인 (10 >= 8) → ③에서 DECRBY 8 → 재고 -3 💥
-        # 결과: 재고가 음수가 되는 데이터 무결성 문제 발생
-        #
-        # 📝 Lua 스크립트 상세 설명:
-        # ------------------------------------------------------------------
-        decrease_script = """
-        -- ① Redis에서 현재 재고 조회 (KEYS[1] = "stock:{product_id}")
-        local current_stock = redis.call("GET", KEYS[1])
-
-        -- ② 상품이 존재하지 않는 경우 (키가 없음)
-        if not current_stock then
-            return -2  -- 에러 코드: 상품 없음
-        end
-
-        -- ③ 문자열 → 숫자 변환 (Redis는 모든 값을 문자열로 저장)
-        -- tonumber(): Lua 내장 함수로 문자열을 숫자로 변환
-        -- 예: "10" (문자열) → 10 (숫자)
-        -- 필요한 이유: Redis는 String 타입만 저장하므로 산술 연산 시 변환 필수
-        current_stock = tonumber(current_stock)
-
-        -- ④ Python에서 전달받은 quantity도 문자열이므로 숫자로 변환
-        -- ARGV[1]: Python의 quantity 파라미터 (redis.eval()의 세 번째 인자)
-        local quantity = tonumber(ARGV[1])
-
-        -- ⑤ 재고 충분성 확인 (비교 연산)
-        if current_stock >= quantity then
-            -- ⑥ 재고 감소: DECRBY는 원자적으로 값을 감소시킴
-            -- DECRBY stock:1 5 → 현재 값에서 5를 뺌
-            redis.call("DECRBY", KEYS[1], quantity)
-
-            -- ⑦ 성공: 남은 재고 반환 (0 이상의 값)
-            -- Python에서 result >= 0으로 성공 판단
-            return current_stock - quantity
-        else
-            -- ⑧ 실패: 재고 부족 (에러 코드 -1 반환)
-            return -1
-        end
+            (결과 코드, 재고) 튜플 (decrease_stock과 동일, 재고는 가장 많은 노드가 돌려준 값)
+            응답한 노드가 없으면 (DECREASE_LOCK_NOT_ACQUIRED, None)
         """
-
-        # 락 획득을 위한 재시도 메커니즘
-        max_retries = settings.lock_retry_attempts
-        retry_delay = settings.lock_retry_delay_ms / 1000.0  # ms를 초로 변환
-
-        for attempt in range(max_retries):
-            # 락 획득 시도
-            lock_id = InventoryService._acquire_lock(product_id, redis, settings)
-
-            if lock_id is not None:
-                try:
-                    # 락 획득 성공, 재고 감소 수행
-                    stock_key = f"stock:{product_id}"
-                    result = redis.eval(decrease_script, 1, stock_key, quantity)
-
-                    if result >= 0:
-                        # 성공: 재고 감소, result는 남은 재고
-                        return True
-                    else:
-                        # -1: 재고 부족, -2: 상품 없음
-                        return False
-                finally:
-                    # 항상 락 해제
-                    InventoryService._release_lock(product_id, lock_id, redis)
-            else:
-                # 락 획득 실패, 지연 후 재시도
-                if attempt < max_retries - 1:
-                    time.sleep(retry_delay)
-
-        # 최대 재시도 횟수 초과
-        return False
+        stocks_by_code: dict[int, list[Optional[int]]] = {}
+        for code, *stock in filter(None, results):
+            stocks_by_code.setdefault(code, []).append(stock[0] if stock else None)
+
+        success = InventoryService.DECREASE_SUCCESS
+        if len(stocks_by_code.get(success, ())) >= quorum:
+            code = success
+        else:
+            failures = {c: v for c, v in stocks_by_code.items() if c != success}
+            if not failures:
+                return InventoryService.DECREASE_LOCK_NOT_ACQUIRED, None
+            code = max(failures, key=lambda c: len(failures[c]))
+
+        return code, Counter(stocks_by_code[code]).most_common(1)[0][0]
@@ -1,9 +1,12 @@
 """상품 관리 서비스."""
 
-import uuid
+import os
 from typing import Optional
 
+import anyio.to_thread
 from redis import Redis
+from redis.asyncio import Redis as AsyncRedis
+from sqlalchemy import bindparam, insert, select, update
 from sqlalchemy.orm import Session
 
 from app.core.config import Settings
@@ -12,6 +15,49 @@ from app.models import Product
 from app.services.inventory_service import InventoryService
 
 
+# 상품 ID로 조회하는 문장은 모듈 로드 시 한 번만 구성하여 재사용
+# (호출마다 Query 객체/절을 새로 만들지 않고, 컴파일된 SQL은 SQLAlchemy 캐시에서 재사용됨)
+_STOCK_BY_ID = select(Product.stock).where(Product.id == bindparam("product_id"))
+_PRICE_BY_ID = select(Product.price).where(Product.id == bindparam("product_id"))
+_NAME_AND_PRICE_BY_ID = select(Product.name, Product.price).where(
+    Product.id == bindparam("product_id")
+)
+
+# 상품 생성 락 해제 (Lua 스크립트로 원자적 해제)
+#
+# ❌ Python 코드로 락 해제 시 문제점 (Race Condition 발생):
+# ------------------------------------------------------------------
+# if redis.get(lock_key) == lock_id:    # ① GET 연산
+#     redis.delete(lock_key)            # ② DELETE 연산
+#
+# 문제 시나리오:
+# T1: 프로세스 A가 ①에서 GET → lock_id 확인 (일치)
+# T2: 프로세스 A의 락이 TTL 만료로 자동 삭제됨 ⏰
+# T3: 프로세스 B가 같은 lock_key로 새로운 락 획득 🔒
+# T4: 프로세스 A가 ②에서 DELETE 실행 → 프로세스 B의 락을 삭제! 💥
+# 결과: 동시성 보장 실패 (여러 프로세스가 동시에 임계 영역 진입)
+#
+# ✅ Lua 스크립트 사용 이유:
+# ------------------------------------------------------------------
+# 1. 원자성 보장: GET + 비교 + DEL이 단일 연산으로 실행
+# 2. Race Condition 방지: Redis는 단일 스레드이므로 스크립트 실행 중
+#    다른 명령이 끼어들 수 없음
+# 3. 안전성: lock_id가 일치할 때만 삭제 (내가 획득한 락만 해제)
+# 4. 성능: 3번의 네트워크 왕복 → 1번으로 감소
+#
+# redis.eval(script, num_keys, *keys_and_args) 파라미터:
+# - script: Lua 스크립트 문자열
+# - num_keys: KEYS 배열 크기 (여기서는 1개)
+# - keys_and_args: KEYS[1] = lock_key, ARGV[1] = lock_id
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+else
+    return 0
+end
+"""
+
+
 class ProductService:
     """상품 생성, 조회 및 재고 동기화 서비스."""
 
@@ -30,7 +76,8 @@ class ProductService:
 
         분산 환경에서 동시 상품 생성을 방지하기 위해 비관적 락을 사용합니다.
         - 상품명 기반 분산 락으로 중복 생성 방지
-        - DB-Redis 원자성 보장 (Redis 실패 시 DB 롤백)
+        - DB-Redis 원자성 보장 (Redis 재고 초기화 성공 후에만 DB 커밋,
+          실패 시 DB 트랜잭션 롤백)
 
         Args:
             name: 상품명
@@ -49,7 +96,7 @@ class ProductService:
         """
         # 상품명 기반 분산 락 획득
         lock_key = f"lock:product:create:{name}"
-        lock_id = str(uuid.uuid4())
+        lock_id = os.urandom(8).hex()
         acquired = redis.set(
             lock_key, lock_id, nx=True, ex=settings.lock_timeout_seconds
         )
@@ -59,79 +106,64 @@ class ProductService:
                 f"Another product creation in progress for name: {name}. Please try again."
             )
 
-        product = None
+        product_id = None
+        stock_initialized = False
         try:
             # 상품명 중복 체크
             existing = db.query(Product).filter(Product.name == name).first()
             if existing:
                 raise ProductAlreadyExistsException(name)
 
-            # DB에 상품 생성
+            # DB에 상품 INSERT (flush로 ID만 받고 커밋은 Redis 초기화 성공 후로 미룸)
+            # id/created_at/updated_at은 INSERT ... RETURNING으로 채워지므로 refresh 불필요
             product = Product(
                 name=name, description=description, price=price, stock=stock
             )
             db.add(product)
-            db.commit()
-            db.refresh(product)
-
-            # Redis에 실시간 재고 초기화
-            success = InventoryService.initialize_stock(product.id, stock, redis)
-            if not success:
-                # Redis 초기화 실패 시 롤백 (이미 재고가 존재하는 경우)
+            db.flush()
+            product_id = product.id
+
+            # Redis 후처리를 파이프라인으로 묶어 한 번의 왕복으로 전송
+            # - 실시간 재고 초기화 (SET NX, InventoryService.initialize_stock과 동일)
+            # - 구매 경로에서 DB 조회 없이 가격을 읽도록 상품 정보 캐시
+            pipe = redis.pipeline(transaction=False)
+            pipe.set(f"stock:{product_id}", stock, nx=True)
+            ProductService._cache_product(product_id, name, price, pipe)
+            stock_initialized, _ = pipe.execute()
+
+            if not stock_initialized:
+                # 이미 재고 키가 존재하면 커밋하지 않고 롤백
                 raise Exception(
-                    f"Failed to initialize stock in Redis for product {product.id}"
+                    f"Failed to initialize stock in Redis for product {product_id}"
                 )
 
+            db.commit()
+
             return product
 
-        except Exception as e:
-            # 롤백: DB에서 상품 삭제 (이미 커밋된 경우)
-            if product and product.id:
-                db.delete(product)
-                db.commit()
+        except Exception:
+            # 롤백: 커밋 전이므로 INSERT는 트랜잭션 롤백으로 취소됨
+            db.rollback()
+            if product_id is not None:
+                # 이 호출이 만든 Redis 키만 정리 (기존 재고 키는 건드리지 않음)
+                keys = [f"product:{product_id}"]
+                if stock_initialized:
+                    keys.append(f"stock:{product_id}")
+                redis.delete(*keys)
             raise
 
         finally:
-            # 항상 락 해제 (Lua 스크립트로 원자적 해제)
-            #
-            # ❌ Python 코드로 락 해제 시 문제점 (Race Condition 발생):
-            # ------------------------------------------------------------------
-            # if redis.get(lock_key) == lock_id:    # ① GET 연산
-            #     redis.delete(lock_key)            # ② DELETE 연산
-            #
-            # 문제 시나리오:
-            # T1: 프로세스 A가 ①에서 GET → lock_id 확인 (일치)
-            # T2: 프로세스 A의 락이 TTL 만료로 자동 삭제됨 ⏰
-            # T3: 프로세스 B가 같은 lock_key로 새로운 락 획득 🔒
-            # T4: 프로세스 A가 ②에서 DELETE 실행 → 프로세스 B의 락을 삭제! 💥
-            # 결과: 동시성 보장 실패 (여러 프로세스가 동시에 임계 영역 진입)
-            #
-            # ✅ Lua 스크립트 사용 이유:
-            # ------------------------------------------------------------------
-            # 1. 원자성 보장: GET + 비교 + DEL이 단일 연산으로 실행
-            # 2. Race Condition 방지: Redis는 단일 스레드이므로 스크립트 실행 중
-            #    다른 명령이 끼어들 수 없음
-            # 3. 안전성: lock_id가 일치할 때만 삭제 (내가 획득한 락만 해제)
-            # 4. 성능: 3번의 네트워크 왕복 → 1번으로 감소
-            #
-            # redis.eval(script, num_keys, *keys_and_args) 파라미터:
-            # - script: Lua 스크립트 문자열
-            # - num_keys: KEYS 배열 크기 (여기서는 1개)
-            # - keys_and_args: KEYS[1] = lock_key, ARGV[1] = lock_id
-            release_script = """
-            if redis.call("GET", KEYS[1]) == ARGV[1] then
-                return redis.call("DEL", KEYS[1])
-            else
-                return 0
-            end
-            """
-            redis.eval(release_script, 1, lock_key, lock_id)
+            # 커밋(또는 롤백)이 끝난 뒤에 락을 해제해야 같은 이름의 중복 생성을 막을 수 있음
+            redis.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, lock_id)
 
     @staticmethod
     def get_product(product_id: int, db: Session) -> Optional[Product]:
         """
         상품 ID로 상품을 조회합니다.
 
+        기본 키 조회이므로 Session.get을 사용합니다. 같은 세션에서 이미
+        로드(또는 생성)된 상품은 identity map에서 바로 반환되어 SELECT가 나가지 않습니다.
+
         Args:
             product_id: 상품 ID
             db: DB 세션
@@ -139,7 +171,220 @@ class ProductService:
         Returns:
             Product 객체 또는 None
         """
-        return db.query(Product).filter(Product.id == product_id).first()
+        return db.get(Product, product_id)
+
+    @staticmethod
+    def get_db_stock(product_id: int, db: Session) -> Optional[int]:
+        """
+        DB에 저장된 상품 재고만 조회합니다.
+
+        stock 컬럼만 SELECT하므로 Product ORM 객체를 생성하지 않습니다.
+        (재고 조회 API처럼 다른 컬럼이 필요 없는 경로에서 사용)
+
+        Args:
+            product_id: 상품 ID
+            db: DB 세션
+
+        Returns:
+            DB 재고 수량, 상품이 없으면 None
+        """
+        return db.execute(
+            _STOCK_BY_ID, {"product_id": product_id}
+        ).scalar_one_or_none()
+
+    @staticmethod
+    def get_price(product_id: int, db: Session) -> Optional[int]:
+        """
+        상품 가격만 조회합니다.
+
+        price 컬럼만 SELECT하므로 Product ORM 객체를 생성하지 않습니다.
+        (구매 처리처럼 총액 계산에 가격만 필요한 경로에서 사용)
+
+        Args:
+            product_id: 상품 ID
+            db: DB 세션
+
+        Returns:
+            상품 가격, 상품이 없으면 None
+        """
+        return db.execute(
+            _PRICE_BY_ID, {"product_id": product_id}
+        ).scalar_one_or_none()
+
+    @staticmethod
+    def create_products_bulk(
+        products: list[dict], db: Session, redis: Redis
+    ) -> list[Product]:
+        """
+        여러 상품을 한 번의 트랜잭션과 한 번의 Redis 파이프라인으로 생성합니다.
+
+        CSV 임포트나 시드 스크립트처럼 상품을 대량으로 등록할 때 사용합니다.
+        상품마다 락 획득/INSERT/커밋/SETNX를 반복하지 않고,
+        - 상품명 중복은 IN 조회 한 번으로 확인 (상품명 락 생략)
+        - INSERT ... RETURNING 한 번으로 전체 행 생성
+        - 재고 초기화(SET NX)와 상품 캐시를 한 번의 파이프라인으로 전송
+        - Redis 초기화 성공 후에만 한 번 커밋 (실패 시 DB 트랜잭션 롤백)
+        합니다. 상품명 락을 잡지 않으므로 같은 이름을 동시에 단건 생성하는
+        요청과는 중복을 막지 못합니다 (관리용 일괄 등록 전용).
+
+        Args:
+            products: 상품 정보 리스트 (name, price, stock, description(선택))
+            db: DB 세션
+            redis: Redis 클라이언트
+
+        Returns:
+            생성된 Product 객체 리스트 (입력 순서와 동일)
+
+        Raises:
+            ProductAlreadyExistsException: 입력 또는 DB에 같은 상품명이 있는 경우
+            Exception: Redis 재고 초기화 실패 시 (생성한 상품은 모두 롤백)
+        """
+        if not products:
+            return []
+
+        names = set()
+        for product in products:
+            if product["name"] in names:
+                raise ProductAlreadyExistsException(product["name"])
+            names.add(product["name"])
+
+        existing = db.execute(
+            select(Product.name).where(Product.name.in_(names)).limit(1)
+        ).scalar_one_or_none()
+        if existing is not None:
+            raise ProductAlreadyExistsException(existing)
+
+        # INSERT ... RETURNING으로 ID만 받고 커밋은 Redis 초기화 성공 후로 미룸
+        # (create_product와 같은 순서: Redis 실패 시 DB 트랜잭션 롤백)
+        created = []
+        stock_initialized = []
+        try:
+            created = db.scalars(
+                insert(Product).returning(Product, sort_by_parameter_order=True),
+                products,
+            ).all()
+
+            pipe = redis.pipeline(transaction=False)
+            for product in created:
+                pipe.set(f"stock:{product.id}", product.stock, nx=True)
+                ProductService._cache_product(
+                    product.id, product.name, product.price, pipe
+                )
+            stock_initialized = pipe.execute()[::2]
+
+            if not all(stock_initialized):
+                # 이미 재고 키가 존재하는 상품이 있으면 커밋하지 않고 롤백
+                raise Exception("Failed to initialize stock in Redis for bulk products")
+
+            db.commit()
+
+            return created
+
+        except Exception:
+            # 이 호출이 만든 Redis 키만 정리 (기존 재고 키는 건드리지 않음)
+            # 롤백하면 생성한 객체가 세션에서 분리되므로 키는 롤백 전에 만들어 둠
+            keys = [f"product:{product.id}" for product in created]
+            keys.extend(
+                f"stock:{product.id}"
+                for product, initialized in zip(created, stock_initialized)
+                if initialized
+            )
+            # 롤백: 커밋 전이므로 INSERT는 트랜잭션 롤백으로 취소됨
+            db.rollback()
+            if keys:
+                redis.delete(*keys)
+            raise
+
+    @staticmethod
+    def _cache_product(product_id: int, name: str, price: int, redis: Redis) -> None:
+        """
+        상품 정보를 Redis 해시(product:{id})에 저장합니다.
+
+        재고는 stock:{id} 키가 원본이므로 해시에는 변하지 않는 정보만 저장합니다.
+
+        Args:
+            product_id: 상품 ID
+            name: 상품명
+            price: 가격
+            redis: Redis 클라이언트
+        """
+        redis.hset(f"product:{product_id}", mapping={"name": name, "price": price})
+
+    @staticmethod
+    def get_price_cached(product_id: int, db: Session, redis: Redis) -> Optional[int]:
+        """
+        상품 가격을 Redis 캐시에서 먼저 조회하고, 없으면 DB에서 조회합니다.
+
+        구매 처리 경로에서 매 요청마다 DB를 조회하지 않도록 사용합니다.
+        캐시에 없으면(서버 재시작 전 생성된 상품 등) DB 조회 후 캐시를 채웁니다.
+
+        Args:
+            product_id: 상품 ID
+            db: DB 세션
+            redis: Redis 클라이언트
+
+        Returns:
+            상품 가격, 상품이 없으면 None
+        """
+        cached_price = redis.hget(f"product:{product_id}", "price")
+        if cached_price is not None:
+            return int(cached_price)
+
+        product = ProductService._get_name_and_price(product_id, db)
+        if product is None:
+            return None
+
+        ProductService._cache_product(product_id, product.name, product.price, redis)
+        return product.price
+
+    @staticmethod
+    async def get_price_cached_async(
+        product_id: int, db: Session, redis: AsyncRedis
+    ) -> Optional[int]:
+        """
+        get_price_cached의 비동기(redis.asyncio) 버전입니다.
+
+        캐시 미스 시 DB 조회는 이벤트 루프를 막지 않도록 스레드풀에서 실행합니다.
+
+        Args:
+            product_id: 상품 ID
+            db: DB 세션
+            redis: 비동기 Redis 클라이언트
+
+        Returns:
+            상품 가격, 상품이 없으면 None
+        """
+        cached_price = await redis.hget(f"product:{product_id}", "price")
+        if cached_price is not None:
+            return int(cached_price)
+
+        product = await anyio.to_thread.run_sync(
+            ProductService._get_name_and_price, product_id, db
+        )
+        if product is None:
+            return None
+
+        await redis.hset(
+            f"product:{product_id}",
+            mapping={"name": product.name, "price": product.price},
+        )
+        return product.price
+
+    @staticmethod
+    def _get_name_and_price(product_id: int, db: Session):
+        """
+        상품 캐시를 채우기 위해 상품명과 가격 컬럼만 조회합니다.
+
+        Args:
+            product_id: 상품 ID
+            db: DB 세션
+
+        Returns:
+            (name, price) Row, 상품이 없으면 None
+        """
+        return db.execute(
+            _NAME_AND_PRICE_BY_ID, {"product_id": product_id}
+        ).one_or_none()
 
     @staticmethod
     def get_product_with_stock(
@@ -167,20 +412,10 @@ class ProductService:
             return None
 
         db_stock = product.stock
-        redis_stock = InventoryService.get_stock(product_id, redis)
-
-        # Redis에 재고가 없으면 DB stock으로 초기화 (SETNX 사용)
-        if redis_stock is None:
-            success = InventoryService.initialize_stock(product_id, db_stock, redis)
-            if success:
-                # 초기화 성공
-                redis_stock = db_stock
-            else:
-                # 다른 프로세스가 이미 초기화함, Redis에서 다시 읽기
-                redis_stock = InventoryService.get_stock(product_id, redis)
-                if redis_stock is None:
-                    # 여전히 없으면 DB 값 사용 (예외 상황)
-                    redis_stock = db_stock
+        # Redis에 재고가 없으면 DB stock으로 초기화 (SETNX, 한 번의 왕복)
+        redis_stock = InventoryService.get_or_initialize_stock(
+            product_id, db_stock, redis
+        )
 
         return {
             "product": product,
@@ -192,7 +427,9 @@ class ProductService:
     @staticmethod
     def list_products(db: Session, skip: int = 0, limit: int = 100) -> list[Product]:
         """
-        상품 목록을 조회합니다.
+        상품 목록을 ID 순으로 조회합니다.
+
+        페이지 경계가 요청마다 달라지지 않도록 기본 키로 정렬합니다.
 
         Args:
             db: DB 세션
@@ -202,29 +439,37 @@ class ProductService:
         Returns:
             Product 객체 리스트
         """
-        return db.query(Product).offset(skip).limit(limit).all()
+        return (
+            db.query(Product).order_by(Product.id).offset(skip).limit(limit).all()
+        )
 
     @staticmethod
-    def sync_stock_to_db(product_id: int, redis_stock: int, db: Session) -> bool:
+    def sync_stock_to_db(
+        product_id: int, redis_stock: int, db: Session, commit: bool = True
+    ) -> bool:
         """
         Redis의 재고를 DB에 동기화합니다.
 
         구매 완료 후 호출하여 DB stock을 업데이트합니다.
+        상품을 먼저 SELECT하지 않고 단일 UPDATE 문으로 갱신하며,
+        영향받은 행 수로 상품 존재 여부를 판단합니다.
 
         Args:
             product_id: 상품 ID
             redis_stock: Redis의 현재 재고
             db: DB 세션
+            commit: False면 커밋하지 않고 호출하는 쪽의 트랜잭션에 포함시킴
 
         Returns:
             성공 시 True, 실패 시 False
         """
-        product = ProductService.get_product(product_id, db)
-        if product is None:
+        result = db.execute(
+            update(Product).where(Product.id == product_id).values(stock=redis_stock)
+        )
+        if result.rowcount == 0:
             return False
 
-        product.stock = redis_stock
-        db.commit()
-        db.refresh(product)
+        if commit:
+            db.commit()
 
         return True
@@ -4,7 +4,17 @@
 Redis 비관적 락과 트랜잭션을 활용한 안전한 상품 구매 처리를 담당합니다.
 """
 
+import asyncio
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import Awaitable, Callable, Optional
+
+import anyio.to_thread
+from aioredlock import Aioredlock
 from redis import Redis
+from redis.asyncio import Redis as AsyncRedis
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from app.core.config import Settings
@@ -20,9 +30,57 @@ from app.services.redlock_aioredlock_service import RedlockAioredlockService
 from app.services.redlock_manual_service import RedlockManualService
 
 
+logger = logging.getLogger(__name__)
+
+# DB 트랜잭션 실패 시 Redis 재고 복구(보상 트랜잭션)를 백그라운드에서 실행하는 스레드풀
+# 이미 실패한 요청의 응답이 복구용 Redis 왕복을 기다리지 않도록 함
+_COMPENSATION_EXECUTOR = ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix="stock-compensation"
+)
+# 실행 중인 비동기 보상 태스크 (완료 전에 가비지 컬렉션되지 않도록 참조 유지)
+_COMPENSATION_TASKS: set[asyncio.Task] = set()
+
+
 class PurchaseService:
     """구매 처리 서비스 클래스"""
 
+    @staticmethod
+    def _insert_purchase(
+        user_id: int,
+        product_id: int,
+        quantity: int,
+        price: int,
+        db: Session,
+    ) -> Purchase:
+        """
+        Purchase 레코드를 INSERT ... RETURNING 한 번으로 생성합니다.
+
+        id와 purchased_at(서버 기본값)을 INSERT 결과로 바로 받으므로
+        add → flush → 커밋 후 refresh 로 이어지는 추가 조회가 없습니다.
+        커밋은 호출하는 쪽에서 수행합니다.
+
+        Args:
+            user_id: 구매자 사용자 ID
+            product_id: 구매할 상품 ID
+            quantity: 구매 수량
+            price: 상품 단가
+            db: SQLAlchemy 데이터베이스 세션
+
+        Returns:
+            Purchase: 생성된 구매 레코드 (세션에 로드된 상태)
+        """
+        stmt = (
+            insert(Purchase)
+            .values(
+                user_id=user_id,
+                product_id=product_id,
+                quantity=quantity,
+                total_price=price * quantity,
+            )
+            .returning(Purchase)
+        )
+        return db.scalars(stmt).one()
+
     @staticmethod
     def purchase_product(
         user_id: int,
@@ -36,7 +94,7 @@ class PurchaseService:
         상품을 구매합니다 (비관적 락 기반 재고 관리).
 
         프로세스:
-        1. 상품 존재 확인 (DB 조회)
+        1. 상품 존재 확인 및 가격 조회 (Redis 상품 캐시, 없으면 DB 조회)
         2. Redis 비관적 락으로 재고 감소 시도
         3. 성공 시:
            - Purchase 레코드 생성 (SQLite)
@@ -60,65 +118,374 @@ class PurchaseService:
             InsufficientStockException: 재고가 부족한 경우
             LockAcquisitionException: 락 획득에 실패한 경우 (재시도 초과)
         """
-        product = ProductService.get_product(product_id, db)
-        if product is None:
+        price = ProductService.get_price_cached(product_id, db, redis)
+        if price is None:
+            raise ProductNotFoundException(product_id)
+
+        result, stock = InventoryService.decrease_stock(
+            product_id, quantity, redis, settings
+        )
+        PurchaseService._raise_for_decrease_result(
+            result, stock, product_id, quantity, settings
+        )
+
+        # 3. DB 트랜잭션: Purchase 레코드 생성 + Product.stock 업데이트
+        try:
+            return PurchaseService._record_purchase(
+                user_id, product_id, quantity, price, stock, db
+            )
+        except Exception:
+            # DB 트랜잭션 실패 시 감소시킨 Redis 재고 복구 (보상 트랜잭션, 백그라운드)
+            PurchaseService._compensate_stock(product_id, quantity, redis)
+            raise
+
+    @staticmethod
+    async def purchase_product_async(
+        user_id: int,
+        product_id: int,
+        quantity: int,
+        db: Session,
+        redis: AsyncRedis,
+        settings: Settings,
+    ) -> Purchase:
+        """
+        purchase_product의 비동기(redis.asyncio) 버전입니다.
+
+        Redis 왕복(가격 캐시 조회, 재고 감소)은 이벤트 루프에서 대기하므로
+        한 워커가 여러 구매 요청의 네트워크 대기를 겹쳐서 처리할 수 있습니다.
+        동기 세션을 사용하는 DB 트랜잭션은 이벤트 루프를 막지 않도록 스레드풀에서 실행합니다.
+
+        Args:
+            user_id: 구매자 사용자 ID
+            product_id: 구매할 상품 ID
+            quantity: 구매 수량
+            db: SQLAlchemy 데이터베이스 세션
+            redis: 비동기 Redis 클라이언트
+            settings: 애플리케이션 설정 (락 타임아웃, 재시도 등)
+
+        Returns:
+            Purchase: 생성된 구매 레코드
+
+        Raises:
+            ProductNotFoundException: 상품을 찾을 수 없는 경우
+            InsufficientStockException: 재고가 부족한 경우
+            LockAcquisitionException: 락 획득에 실패한 경우 (재시도 초과)
+        """
+        price = await ProductService.get_price_cached_async(product_id, db, redis)
+        if price is None:
             raise ProductNotFoundException(product_id)
 
-        stock_decreased = InventoryService.decrease_stock(
+        result, stock = await InventoryService.decrease_stock_async(
             product_id, quantity, redis, settings
         )
+        PurchaseService._raise_for_decrease_result(
+            result, stock, product_id, quantity, settings
+        )
+
+        try:
+            return await anyio.to_thread.run_sync(
+                PurchaseService._record_purchase,
+                user_id,
+                product_id,
+                quantity,
+                price,
+                stock,
+                db,
+            )
+        except Exception:
+            # DB 트랜잭션 실패 시 감소시킨 Redis 재고 복구 (보상 트랜잭션, 백그라운드)
+            PurchaseService._compensate_stock_async(product_id, quantity, redis)
+            raise
+
+    @staticmethod
+    def _compensate_stock(product_id: int, quantity: int, redis: Redis) -> Future:
+        """
+        감소시킨 Redis 재고를 백그라운드 스레드에서 복구합니다 (보상 트랜잭션).
+
+        요청은 복구 완료를 기다리지 않고 바로 실패 응답을 반환하며,
+        복구에 실패하면 로그를 남깁니다.
+
+        Args:
+            product_id: 상품 ID
+            quantity: 복구할 수량
+            redis: Redis 클라이언트
+
+        Returns:
+            복구 결과(increase_stock 반환값)를 담는 Future
+        """
+        future = _COMPENSATION_EXECUTOR.submit(
+            InventoryService.increase_stock, product_id, quantity, redis
+        )
+        future.add_done_callback(
+            lambda done: PurchaseService._log_compensation_failure(
+                done, product_id, quantity
+            )
+        )
+        return future
+
+    @staticmethod
+    def _compensate_stock_async(
+        product_id: int, quantity: int, redis: AsyncRedis
+    ) -> asyncio.Task:
+        """
+        _compensate_stock의 비동기(redis.asyncio) 버전입니다.
+
+        복구를 이벤트 루프의 태스크로 예약하고 완료를 기다리지 않습니다.
+
+        Args:
+            product_id: 상품 ID
+            quantity: 복구할 수량
+            redis: 비동기 Redis 클라이언트
+
+        Returns:
+            복구 태스크
+        """
+        task = asyncio.create_task(
+            InventoryService.increase_stock_async(product_id, quantity, redis)
+        )
+        _COMPENSATION_TASKS.add(task)
+        task.add_done_callback(_COMPENSATION_TASKS.discard)
+        task.add_done_callback(
+            lambda done: PurchaseService._log_compensation_failure(
+                done, product_id, quantity
+            )
+        )
+        return task
+
+    @staticmethod
+    def _log_compensation_failure(
+        done: Future | asyncio.Task, product_id: int, quantity: int
+    ) -> None:
+        """보상 트랜잭션이 재고를 복구하지 못했으면 수동 조치를 위해 로그를 남깁니다."""
+        if done.cancelled() or done.exception() is not None or not done.result():
+            logger.error(
+                "Failed to restore Redis stock: product_id=%s, quantity=%s",
+                product_id,
+                quantity,
+            )
+
+    @staticmethod
+    def _raise_for_decrease_result(
+        result: int,
+        stock: Optional[int],
+        product_id: int,
+        quantity: int,
+        settings: Settings,
+        lock_error: Optional[tuple[str, str]] = None,
+    ) -> None:
+        """
+        InventoryService.decrease_stock 결과 코드에 맞는 예외를 발생시킵니다.
 
-        if not stock_decreased:
-            # 재고 감소 실패 원인 파악
-            current_stock = InventoryService.get_stock(product_id, redis)
-
-            if current_stock is None:
-                # Redis에 재고 정보가 없음 (드문 경우, DB와 동기화 필요)
-                raise ProductNotFoundException(product_id)
-            elif current_stock < quantity:
-                # 재고 부족
-                raise InsufficientStockException(product_id, quantity, current_stock)
-            else:
-                # 락 획득 실패 (재시도 횟수 초과)
-                raise LockAcquisitionException(
+        Redlock 서비스의 재고 감소도 같은 결과 코드를 반환하므로 모든 구매 경로에서 사용합니다.
+
+        재고 감소 실패 원인은 Lua 스크립트의 결과 코드로 바로 판단합니다 (추가 GET 없음).
+
+        Args:
+            result: decrease_stock 결과 코드
+            stock: decrease_stock이 반환한 재고
+            product_id: 상품 ID
+            quantity: 구매 수량
+            settings: 애플리케이션 설정
+            lock_error: 락 획득 실패 시 사용할 (리소스, 메시지)
+                (None이면 단일 Redis 락 기준 리소스와 메시지 사용)
+
+        Raises:
+            ProductNotFoundException: Redis에 재고 정보가 없는 경우
+            InsufficientStockException: 재고가 부족한 경우
+            LockAcquisitionException: 락 획득에 실패한 경우 (재시도 초과)
+        """
+        if result == InventoryService.DECREASE_PRODUCT_NOT_FOUND:
+            # Redis에 재고 정보가 없음 (드문 경우, DB와 동기화 필요)
+            raise ProductNotFoundException(product_id)
+        elif result == InventoryService.DECREASE_INSUFFICIENT_STOCK:
+            # 재고 부족 (stock은 감소 시도 시점의 재고)
+            raise InsufficientStockException(product_id, quantity, stock)
+        elif result == InventoryService.DECREASE_LOCK_NOT_ACQUIRED:
+            # 락 획득 실패 (재시도 횟수 초과)
+            if lock_error is None:
+                lock_error = (
                     f"stock:{product_id}",
                     f"Failed to acquire lock after {settings.lock_retry_attempts} retries",
                 )
+            raise LockAcquisitionException(*lock_error)
+
+    @staticmethod
+    def _end_read_transaction(db: Session) -> None:
+        """
+        가격 조회로 시작된 읽기 트랜잭션을 끝내 DB 커넥션을 풀에 반납합니다.
+
+        Redlock 경로는 여러 노드에 락/재고 감소를 요청하는 동안 DB를 사용하지 않으므로
+        그동안 커넥션을 붙잡지 않고, _record_purchase에서 새 트랜잭션으로 다시 얻습니다.
 
-        # 3. DB 트랜잭션 시작: Purchase 레코드 생성 + Product.stock 업데이트
+        Args:
+            db: SQLAlchemy 데이터베이스 세션
+        """
+        if db.in_transaction():
+            db.commit()
+
+    @staticmethod
+    def _record_purchase(
+        user_id: int,
+        product_id: int,
+        quantity: int,
+        price: int,
+        remaining_stock: int,
+        db: Session,
+    ) -> Purchase:
+        """
+        재고 감소 후 Purchase 레코드 생성과 DB 재고 동기화를 하나의 트랜잭션으로 처리합니다.
+
+        실패 시 DB를 롤백하고 예외를 다시 발생시킵니다 (Redis 보상은 호출하는 쪽에서 처리).
+
+        Args:
+            user_id: 구매자 사용자 ID
+            product_id: 구매한 상품 ID
+            quantity: 구매 수량
+            price: 상품 단가
+            remaining_stock: 재고 감소 직후 Redis 재고
+            db: SQLAlchemy 데이터베이스 세션
+
+        Returns:
+            Purchase: 생성된 구매 레코드
+        """
         try:
-            # 3-1. Purchase 레코드 생성
-            total_price = product.price * quantity
-            purchase = Purchase(
-                user_id=user_id,
-                product_id=product_id,
-                quantity=quantity,
-                total_price=total_price,
+            # Purchase 레코드 생성 (INSERT ... RETURNING)
+            purchase = PurchaseService._insert_purchase(
+                user_id, product_id, quantity, price, db
             )
-            db.add(purchase)
 
-            # 3-2. DB의 Product.stock 업데이트 (Redis와 동기화)
-            current_redis_stock = InventoryService.get_stock(product_id, redis)
-            if current_redis_stock is not None:
-                ProductService.sync_stock_to_db(product_id, current_redis_stock, db)
+            # DB의 Product.stock 업데이트 (Redis와 동기화)
+            # Lua 스크립트가 돌려준 감소 직후 재고를 사용하므로 추가 GET 없음
+            # INSERT와 같은 트랜잭션에 넣어 커밋(fsync)은 아래에서 한 번만 수행
+            ProductService.sync_stock_to_db(
+                product_id, remaining_stock, db, commit=False
+            )
 
-            # 3-3. 커밋
             db.commit()
-            db.refresh(purchase)
 
             return purchase
 
-        except Exception as e:
-            # DB 트랜잭션 실패 시 롤백
+        except Exception:
             db.rollback()
+            raise
+
+    @staticmethod
+    def _purchase_with_redlock(
+        user_id: int,
+        product_id: int,
+        quantity: int,
+        db: Session,
+        decrease_stock: Callable[[int, int], tuple[int, Optional[int]]],
+        settings: Settings,
+        lock_error_message: str,
+    ) -> Purchase:
+        """
+        Redlock 구매 경로의 공통 흐름입니다 (동기).
+
+        가격 조회 → DB 커넥션 반납 → 재고 감소 → 결과 코드 확인 → 구매 기록 순서로 처리하며,
+        경로마다 다른 재고 감소 방식은 decrease_stock으로 받습니다.
+
+        Args:
+            user_id: 구매자 사용자 ID
+            product_id: 구매할 상품 ID
+            quantity: 구매 수량
+            db: SQLAlchemy 데이터베이스 세션
+            decrease_stock: (product_id, quantity)를 받아 (결과 코드, 재고)를 반환하는 함수
+            settings: 애플리케이션 설정
+            lock_error_message: 락 획득 실패 시 LockAcquisitionException 메시지
+
+        Returns:
+            Purchase: 생성된 구매 레코드
+        """
+        price = PurchaseService._get_price_for_redlock(product_id, db)
+
+        result, stock = decrease_stock(product_id, quantity)
+        PurchaseService._raise_for_decrease_result(
+            result,
+            stock,
+            product_id,
+            quantity,
+            settings,
+            lock_error=(f"lock:stock:{product_id}", lock_error_message),
+        )
+
+        # DB 트랜잭션: Purchase 레코드 생성 + Product.stock 업데이트
+        # (감소 스크립트가 돌려준 남은 재고를 사용하므로 노드 재조회 없음)
+        return PurchaseService._record_purchase(
+            user_id, product_id, quantity, price, stock, db
+        )
 
-            try:
-                InventoryService.increase_stock(product_id, quantity, redis)
-            except Exception:
-                pass
+    @staticmethod
+    async def _purchase_with_redlock_async(
+        user_id: int,
+        product_id: int,
+        quantity: int,
+        db: Session,
+        decrease_stock: Callable[[int, int], Awaitable[tuple[int, Optional[int]]]],
+        settings: Settings,
+        lock_error_message: str,
+    ) -> Purchase:
+        """
+        _purchase_with_redlock의 비동기 버전입니다 (decrease_stock이 코루틴 함수).
 
-            # 원래 예외를 다시 발생시킴
-            raise e
+        동기 DB 작업(가격 조회, 구매 기록)은 이벤트 루프를 막지 않도록 스레드에서 실행합니다.
+
+        Args:
+            user_id: 구매자 사용자 ID
+            product_id: 구매할 상품 ID
+            quantity: 구매 수량
+            db: SQLAlchemy 데이터베이스 세션
+            decrease_stock: (product_id, quantity)를 받아 (결과 코드, 재고)를 반환하는 코루틴 함수
+            settings: 애플리케이션 설정
+            lock_error_message: 락 획득 실패 시 LockAcquisitionException 메시지
+
+        Returns:
+            Purchase: 생성된 구매 레코드
+        """
+        price = await anyio.to_thread.run_sync(
+            PurchaseService._get_price_for_redlock, product_id, db
+        )
+
+        result, stock = await decrease_stock(product_id, quantity)
+        PurchaseService._raise_for_decrease_result(
+            result,
+            stock,
+            product_id,
+            quantity,
+            settings,
+            lock_error=(f"lock:stock:{product_id}", lock_error_message),
+        )
+
+        return await anyio.to_thread.run_sync(
+            PurchaseService._record_purchase,
+            user_id,
+            product_id,
+            quantity,
+            price,
+            stock,
+            db,
+        )
+
+    @staticmethod
+    def _get_price_for_redlock(product_id: int, db: Session) -> int:
+        """
+        Redlock 경로용 가격 조회 후 읽기 트랜잭션을 끝내 DB 커넥션을 반납합니다.
+
+        Args:
+            product_id: 상품 ID
+            db: SQLAlchemy 데이터베이스 세션
+
+        Returns:
+            상품 가격
+
+        Raises:
+            ProductNotFoundException: 상품을 찾을 수 없는 경우
+        """
+        price = ProductService.get_price(product_id, db)
+        if price is None:
+            raise ProductNotFoundException(product_id)
+        PurchaseService._end_read_transaction(db)
+        return price
 
     @staticmethod
     async def purchase_with_redlock_aioredlock(
@@ -126,14 +493,15 @@ class PurchaseService:
         product_id: int,
         quantity: int,
         db: Session,
-        redis_nodes: list[Redis],
+        redis_nodes: list[AsyncRedis],
+        lock_manager: Aioredlock,
         settings: Settings,
     ) -> Purchase:
         """
         상품을 구매합니다 (aioredlock 라이브러리 기반 Redlock 알고리즘).
 
         프로세스:
-        1. 상품 존재 확인 (DB 조회)
+        1. 상품 존재 확인 및 가격 조회 (price 컬럼만 DB 조회 후 커넥션 반납)
         2. aioredlock 라이브러리로 Redlock 락 획득 및 재고 감소
         3. 성공 시:
            - Purchase 레코드 생성 (SQLite)
@@ -146,7 +514,8 @@ class PurchaseService:
             product_id: 구매할 상품 ID
             quantity: 구매 수량
             db: SQLAlchemy 데이터베이스 세션
-            redis_nodes: Redis 클라이언트 리스트 (다중 노드)
+            redis_nodes: 비동기 Redis 클라이언트 리스트 (다중 노드)
+            lock_manager: 공유 aioredlock 락 매니저
             settings: 애플리케이션 설정
 
         Returns:
@@ -157,55 +526,21 @@ class PurchaseService:
             InsufficientStockException: 재고가 부족한 경우
             LockAcquisitionException: 락 획득에 실패한 경우
         """
-        product = ProductService.get_product(product_id, db)
-        if product is None:
-            raise ProductNotFoundException(product_id)
-
-        stock_decreased = await RedlockAioredlockService.decrease_stock_with_redlock(
-            product_id, quantity, redis_nodes, settings
+        return await PurchaseService._purchase_with_redlock_async(
+            user_id,
+            product_id,
+            quantity,
+            db,
+            partial(
+                RedlockAioredlockService.decrease_stock_with_redlock,
+                redis_nodes=redis_nodes,
+                lock_manager=lock_manager,
+                settings=settings,
+            ),
+            settings,
+            f"Failed to acquire Redlock after {settings.lock_retry_attempts} retries",
         )
 
-        if not stock_decreased:
-            # 재고 감소 실패 원인 파악
-            current_stock = RedlockAioredlockService.get_stock(product_id, redis_nodes)
-
-            if current_stock is None:
-                raise ProductNotFoundException(product_id)
-            elif current_stock < quantity:
-                raise InsufficientStockException(product_id, quantity, current_stock)
-            else:
-                raise LockAcquisitionException(
-                    f"lock:stock:{product_id}",
-                    f"Failed to acquire Redlock after {settings.lock_retry_attempts} retries",
-                )
-
-        # DB 트랜잭션: Purchase 레코드 생성 + Product.stock 업데이트
-        try:
-            total_price = product.price * quantity
-            purchase = Purchase(
-                user_id=user_id,
-                product_id=product_id,
-                quantity=quantity,
-                total_price=total_price,
-            )
-            db.add(purchase)
-
-            current_redis_stock = RedlockAioredlockService.get_stock(
-                product_id, redis_nodes
-            )
-            if current_redis_stock is not None:
-                ProductService.sync_stock_to_db(product_id, current_redis_stock, db)
-
-            db.commit()
-            db.refresh(purchase)
-
-            return purchase
-
-        except Exception as e:
-            db.rollback()
-            # Note: Redlock 환경에서는 롤백 로직이 복잡하므로 일단 스킵
-            raise e
-
     @staticmethod
     def purchase_with_redlock_manual(
         user_id: int,
@@ -219,7 +554,7 @@ class PurchaseService:
         상품을 구매합니다 (수동 쿼럼 구현 Redlock 알고리즘, 동기).
 
         프로세스:
-        1. 상품 존재 확인 (DB 조회)
+        1. 상품 존재 확인 및 가격 조회 (price 컬럼만 DB 조회 후 커넥션 반납)
         2. 수동 쿼럼 구현으로 Redlock 락 획득 및 재고 감소
         3. 성공 시:
            - Purchase 레코드 생성 (SQLite)
@@ -243,68 +578,34 @@ class PurchaseService:
             InsufficientStockException: 재고가 부족한 경우
             LockAcquisitionException: 락 획득에 실패한 경우
         """
-        product = ProductService.get_product(product_id, db)
-        if product is None:
-            raise ProductNotFoundException(product_id)
-
-        stock_decreased = RedlockManualService.decrease_stock_sync(
-            product_id, quantity, redis_nodes, settings
+        return PurchaseService._purchase_with_redlock(
+            user_id,
+            product_id,
+            quantity,
+            db,
+            partial(
+                RedlockManualService.decrease_stock_sync,
+                redis_nodes=redis_nodes,
+                settings=settings,
+            ),
+            settings,
+            "Failed to acquire manual Redlock after retries",
         )
 
-        if not stock_decreased:
-            # 재고 감소 실패 원인 파악
-            current_stock = RedlockManualService.get_stock(product_id, redis_nodes)
-
-            if current_stock is None:
-                raise ProductNotFoundException(product_id)
-            elif current_stock < quantity:
-                raise InsufficientStockException(product_id, quantity, current_stock)
-            else:
-                raise LockAcquisitionException(
-                    f"lock:stock:{product_id}",
-                    f"Failed to acquire manual Redlock after retries",
-                )
-
-        # DB 트랜잭션: Purchase 레코드 생성 + Product.stock 업데이트
-        try:
-            total_price = product.price * quantity
-            purchase = Purchase(
-                user_id=user_id,
-                product_id=product_id,
-                quantity=quantity,
-                total_price=total_price,
-            )
-            db.add(purchase)
-
-            current_redis_stock = RedlockManualService.get_stock(
-                product_id, redis_nodes
-            )
-            if current_redis_stock is not None:
-                ProductService.sync_stock_to_db(product_id, current_redis_stock, db)
-
-            db.commit()
-            db.refresh(purchase)
-
-            return purchase
-
-        except Exception as e:
-            db.rollback()
-            raise e
-
     @staticmethod
     async def purchase_with_redlock_manual_async(
         user_id: int,
         product_id: int,
         quantity: int,
         db: Session,
-        redis_nodes: list[Redis],
+        redis_nodes: list[AsyncRedis],
         settings: Settings,
     ) -> Purchase:
         """
         상품을 구매합니다 (수동 쿼럼 구현 Redlock 알고리즘, 비동기).
 
         프로세스:
-        1. 상품 존재 확인 (DB 조회)
+        1. 상품 존재 확인 및 가격 조회 (price 컬럼만 DB 조회 후 커넥션 반납)
         2. 수동 쿼럼 구현으로 Redlock 락 획득 및 재고 감소 (비동기)
         3. 성공 시:
            - Purchase 레코드 생성 (SQLite)
@@ -317,7 +618,7 @@ class PurchaseService:
             product_id: 구매할 상품 ID
             quantity: 구매 수량
             db: SQLAlchemy 데이터베이스 세션
-            redis_nodes: Redis 클라이언트 리스트 (다중 노드)
+            redis_nodes: 비동기 Redis 클라이언트 리스트 (다중 노드)
             settings: 애플리케이션 설정
 
         Returns:
@@ -328,50 +629,16 @@ class PurchaseService:
             InsufficientStockException: 재고가 부족한 경우
             LockAcquisitionException: 락 획득에 실패한 경우
         """
-        product = ProductService.get_product(product_id, db)
-        if product is None:
-            raise ProductNotFoundException(product_id)
-
-        stock_decreased = await RedlockManualService.decrease_stock_async(
-            product_id, quantity, redis_nodes, settings
+        return await PurchaseService._purchase_with_redlock_async(
+            user_id,
+            product_id,
+            quantity,
+            db,
+            partial(
+                RedlockManualService.decrease_stock_async,
+                redis_nodes=redis_nodes,
+                settings=settings,
+            ),
+            settings,
+            "Failed to acquire manual Redlock (async) after retries",
         )
-
-        if not stock_decreased:
-            # 재고 감소 실패 원인 파악
-            current_stock = RedlockManualService.get_stock(product_id, redis_nodes)
-
-            if current_stock is None:
-                raise ProductNotFoundException(product_id)
-            elif current_stock < quantity:
-                raise InsufficientStockException(product_id, quantity, current_stock)
-            else:
-                raise LockAcquisitionException(
-                    f"lock:stock:{product_id}",
-                    f"Failed to acquire manual Redlock (async) after retries",
-                )
-
-        # DB 트랜잭션: Purchase 레코드 생성 + Product.stock 업데이트
-        try:
-            total_price = product.price * quantity
-            purchase = Purchase(
-                user_id=user_id,
-                product_id=product_id,
-                quantity=quantity,
-                total_price=total_price,
-            )
-            db.add(purchase)
-
-            current_redis_stock = RedlockManualService.get_stock(
-                product_id, redis_nodes
-            )
-            if current_redis_stock is not None:
-                ProductService.sync_stock_to_db(product_id, current_redis_stock, db)
-
-            db.commit()
-            db.refresh(purchase)
-
-            return purchase
-
-        except Exception as e:
-            db.rollback()
-            raise e
@@ -2,12 +2,21 @@
 Redlock 알고리즘을 이용한 분산 락 재고 관리 서비스 (aioredlock 라이브러리 사용)
 """
 
+from collections import Counter
 from typing import Optional
 
 from aioredlock import Aioredlock, LockError
 from redis import Redis
+from redis.asyncio import Redis as AsyncRedis
 
 from app.core.config import Settings
+from app.db.redis_client import quorum_size, run_on_nodes, run_on_nodes_async
+from app.services.inventory_service import InventoryService, StockKeys
+from app.services.redlock_scripts import (
+    DECREASE_STOCK_ASYNC_SCRIPT,
+    ROLLBACK_STOCK_ASYNC_SCRIPT,
+    decreased_nodes,
+)
 
 
 class RedlockAioredlockService:
@@ -34,20 +43,16 @@ class RedlockAioredlockService:
         Returns:
             성공 시 True
         """
-        stock_key = f"stock:{product_id}"
-        success_count = 0
+        stock_key = StockKeys.from_id(product_id).stock
+        quorum = quorum_size(redis_nodes)
 
-        for redis in redis_nodes:
-            try:
-                result = redis.set(stock_key, quantity, nx=True)
-                if result:
-                    success_count += 1
-            except Exception:
-                continue
+        # 모든 노드에 동시에 초기화 (응답하지 않는 노드는 None)
+        results = run_on_nodes(
+            lambda redis: redis.set(stock_key, quantity, nx=True), redis_nodes
+        )
 
         # 쿼럼 이상의 노드에서 성공하면 OK
-        quorum = len(redis_nodes) // 2 + 1
-        return success_count >= quorum
+        return sum(1 for result in results if result) >= quorum
 
     @staticmethod
     def get_stock(product_id: int, redis_nodes: list[Redis]) -> Optional[int]:
@@ -63,25 +68,19 @@ class RedlockAioredlockService:
         Returns:
             현재 재고 수량, 쿼럼을 만족하지 못하면 None
         """
-        stock_key = f"stock:{product_id}"
-        stock_values = []
-
-        for redis in redis_nodes:
-            try:
-                stock = redis.get(stock_key)
-                if stock is not None:
-                    stock_values.append(int(stock))
-            except Exception:
-                continue
+        stock_key = StockKeys.from_id(product_id).stock
+        quorum = quorum_size(redis_nodes)
+        # 모든 노드를 동시에 조회 (노드 수와 관계없이 약 한 번의 왕복)
+        results = run_on_nodes(lambda redis: redis.get(stock_key), redis_nodes)
+        stock_values = [int(stock) for stock in results if stock is not None]
 
         if not stock_values:
             return None
 
         # 쿼럼 확인: 과반수 이상의 노드에서 같은 값을 읽었는지 확인
-        quorum = len(redis_nodes) // 2 + 1
         if len(stock_values) >= quorum:
             # 가장 빈번한 값 반환 (일반적으로 모든 노드가 동일한 값을 가짐)
-            return max(set(stock_values), key=stock_values.count)
+            return Counter(stock_values).most_common(1)[0][0]
 
         return None
 
@@ -89,9 +88,10 @@ class RedlockAioredlockService:
     async def decrease_stock_with_redlock(
         product_id: int,
         quantity: int,
-        redis_nodes: list[Redis],
+        redis_nodes: list[AsyncRedis],
+        lock_manager: Aioredlock,
         settings: Settings,
-    ) -> bool:
+    ) -> tuple[int, Optional[int]]:
         """
         aioredlock 라이브러리를 사용하여 Redlock 알고리즘으로 재고를 감소시킵니다.
 
@@ -102,36 +102,22 @@ class RedlockAioredlockService:
         4. 유효 시간 내에 재고 감소 수행
         5. 모든 노드에서 락 해제
 
+        재고 감소/롤백은 redis.asyncio 클라이언트로 모든 노드에 동시에 요청하므로
+        이벤트 루프를 막지 않습니다.
+
         Args:
             product_id: 상품 ID
             quantity: 감소시킬 수량
-            redis_nodes: Redis 클라이언트 리스트
+            redis_nodes: 비동기 Redis 클라이언트 리스트
+            lock_manager: 공유 aioredlock 락 매니저 (create_lock_manager로 생성)
             settings: 애플리케이션 설정
 
         Returns:
-            재고 감소 성공 시 True, 실패 시 False
+            (결과 코드, 재고) 튜플 (InventoryService.decrease_stock과 동일)
+            - 락 획득 재시도를 초과하면 DECREASE_LOCK_NOT_ACQUIRED
         """
-        # aioredlock 설정
-        # Redis 연결 정보 생성
-        redis_connections = []
-        for node_info in settings.redis_node_list:
-            redis_url = f"redis://{node_info['host']}:{node_info['port']}/0"
-            redis_connections.append(redis_url)
-
-        if not redis_connections:
-            # 노드 정보가 없으면 기본 단일 Redis 사용
-            redis_url = f"redis://{settings.redis_host}:{settings.redis_port}/{settings.redis_db}"
-            redis_connections.append(redis_url)
-
-        # Redlock 인스턴스 생성
-        lock_manager = Aioredlock(
-            redis_connections,
-            retry_count=settings.lock_retry_attempts,
-            retry_delay_min=settings.lock_retry_delay_ms / 1000.0,
-            retry_delay_max=settings.lock_retry_delay_ms / 1000.0 * 2,
-        )
-
         lock_key = f"lock:stock:{product_id}"
+        quorum = quorum_size(redis_nodes)
 
         try:
             # Redlock으로 락 획득 (비동기)
@@ -142,50 +128,30 @@ class RedlockAioredlockService:
 
             try:
                 # 락 획득 성공, 재고 감소 수행
-                decrease_script = """
-                local current_stock = redis.call("GET", KEYS[1])
-                if not current_stock then
-                    return -2
-                end
-                current_stock = tonumber(current_stock)
-                local quantity = tonumber(ARGV[1])
-                if current_stock >= quantity then
-                    redis.call("DECRBY", KEYS[1], quantity)
-                    return current_stock - quantity
-                else
-                    return -1
-                end
-                """
-
-                stock_key = f"stock:{product_id}"
-
-                # 쿼럼 이상의 노드에서 재고 감소 성공해야 함
-                success_count = 0
-                quorum = len(redis_nodes) // 2 + 1
-
-                for redis in redis_nodes:
-                    try:
-                        result = redis.eval(decrease_script, 1, stock_key, quantity)
-                        if result >= 0:
-                            success_count += 1
-                    except Exception:
-                        continue
-
-                # 쿼럼 확인
-                if success_count >= quorum:
-                    return True
-                else:
-                    # 쿼럼 실패 시 롤백 (재고 복구)
-                    rollback_script = """
-                    redis.call("INCRBY", KEYS[1], ARGV[1])
-                    return 1
-                    """
-                    for redis in redis_nodes:
-                        try:
-                            redis.eval(rollback_script, 1, stock_key, quantity)
-                        except Exception:
-                            continue
-                    return False
+                # 수동 Redlock과 같은 Lua 스크립트를 EVALSHA로 실행
+                # (시작 시 RedlockManualService.load_scripts로 노드에 미리 등록됨)
+                # 반환값: {0, 남은 재고}, {-1, 현재 재고} (재고 부족), {-2} (재고 키 없음)
+                stock_key = StockKeys.from_id(product_id).stock
+
+                # 쿼럼 이상의 노드에서 재고 감소 성공해야 함 (모든 노드에 병렬 요청)
+                results = await run_on_nodes_async(
+                    lambda redis: DECREASE_STOCK_ASYNC_SCRIPT(
+                        keys=[stock_key], args=[quantity], client=redis
+                    ),
+                    redis_nodes,
+                )
+
+                # 쿼럼 확인 (감소 후 재고/실패 원인도 스크립트 결과로 판단)
+                code, stock = InventoryService.combine_node_results(results, quorum)
+                if code != InventoryService.DECREASE_SUCCESS:
+                    # 쿼럼 실패 시 롤백 (실제로 감소한 노드만 재고 복구)
+                    await run_on_nodes_async(
+                        lambda redis: ROLLBACK_STOCK_ASYNC_SCRIPT(
+                            keys=[stock_key], args=[quantity], client=redis
+                        ),
+                        decreased_nodes(redis_nodes, results),
+                    )
+                return code, stock
 
             finally:
                 # 락 해제
@@ -193,7 +159,4 @@ class RedlockAioredlockService:
 
         except LockError:
             # 락 획득 실패 (재시도 횟수 초과)
-            return False
-        finally:
-            # Redlock 매니저 종료
-            await lock_manager.destroy()
+            return InventoryService.DECREASE_LOCK_NOT_ACQUIRED, None
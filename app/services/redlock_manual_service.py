@@ -3,12 +3,74 @@ Redlock 알고리즘을 이용한 분산 락 재고 관리 서비스 (수동 쿼
 """
 
 import asyncio
-import uuid
+import os
+import time
+from collections import Counter
 from typing import Optional
 
 from redis import Redis
+from redis.asyncio import Redis as AsyncRedis
+from redis.commands.core import AsyncScript, Script
+from redis.exceptions import RedisError
 
 from app.core.config import Settings
+from app.db.redis_client import quorum_size, run_on_nodes, run_on_nodes_async
+from app.services.inventory_service import InventoryService, StockKeys, retry_delay
+from app.services.redlock_scripts import (
+    DECREASE_STOCK_ASYNC_SCRIPT,
+    DECREASE_STOCK_SCRIPT,
+    ROLLBACK_STOCK_ASYNC_SCRIPT,
+    ROLLBACK_STOCK_SCRIPT,
+    decreased_nodes,
+)
+
+
+# Lua 스크립트는 모듈 로드 시 한 번만 만들어 SHA1을 미리 계산해 둠
+# 호출 시 EVALSHA로 실행하므로 노드가 매번 스크립트 본문을 파싱하지 않음
+# (노드에 스크립트가 없으면 redis-py가 SCRIPT LOAD 후 자동으로 재시도)
+
+# 노드 락 획득 + 재고 감소를 한 번의 왕복으로 실행
+# KEYS[1] = "stock:{product_id}", KEYS[2] = "lock:stock:{product_id}"
+# ARGV[1] = quantity, ARGV[2] = lock_id, ARGV[3] = 락 TTL(초)
+# - 다른 클라이언트가 락을 점유 중이면 {-3} (InventoryService.DECREASE_LOCK_NOT_ACQUIRED)
+# - 재고 키가 없거나 부족하면 획득한 락을 바로 해제하고 {-2} / {-1, 현재 재고}
+# - 감소에 성공하면 {0, 남은 재고}를 반환하고 락은 쿼럼 판단 후 해제할 때까지 유지
+_LOCK_AND_DECREASE_STOCK_LUA = b"""
+if not redis.call("SET", KEYS[2], ARGV[2], "NX", "EX", ARGV[3]) then
+    return {-3}
+end
+local current_stock = redis.call("GET", KEYS[1])
+if not current_stock then
+    redis.call("DEL", KEYS[2])
+    return {-2}
+end
+current_stock = tonumber(current_stock)
+local quantity = tonumber(ARGV[1])
+if current_stock >= quantity then
+    redis.call("DECRBY", KEYS[1], quantity)
+    return {0, current_stock - quantity}
+end
+redis.call("DEL", KEYS[2])
+return {-1, current_stock}
+"""
+
+_RELEASE_LOCK_LUA = b"""
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+else
+    return 0
+end
+"""
+
+# bytes 스크립트는 인코더가 필요 없으므로 특정 클라이언트에 묶지 않고 생성
+_LOCK_AND_DECREASE_STOCK_SCRIPT = Script(None, _LOCK_AND_DECREASE_STOCK_LUA)
+_RELEASE_LOCK_SCRIPT = Script(None, _RELEASE_LOCK_LUA)
+
+# redis.asyncio 클라이언트용 (SHA는 동기 버전과 같으므로 load_scripts 결과를 공유)
+_LOCK_AND_DECREASE_STOCK_ASYNC_SCRIPT = AsyncScript(
+    None, _LOCK_AND_DECREASE_STOCK_LUA
+)
+_RELEASE_LOCK_ASYNC_SCRIPT = AsyncScript(None, _RELEASE_LOCK_LUA)
 
 
 class RedlockManualService:
@@ -21,6 +83,29 @@ class RedlockManualService:
     - 동기/비동기 버전 모두 제공
     """
 
+    @staticmethod
+    def load_scripts(redis_nodes: list[Redis]) -> None:
+        """
+        모든 Redis 노드에 Lua 스크립트를 미리 등록합니다 (SCRIPT LOAD).
+
+        첫 구매 요청이 NOSCRIPT 응답 후 재시도하는 왕복을 없애기 위해
+        애플리케이션 시작 시 호출합니다. 응답하지 않는 노드는 건너뜁니다.
+
+        Args:
+            redis_nodes: Redis 클라이언트 리스트
+        """
+        for redis in redis_nodes:
+            try:
+                for script in (
+                    DECREASE_STOCK_SCRIPT,
+                    _LOCK_AND_DECREASE_STOCK_SCRIPT,
+                    ROLLBACK_STOCK_SCRIPT,
+                    _RELEASE_LOCK_SCRIPT,
+                ):
+                    redis.script_load(script.script)
+            except RedisError:
+                continue
+
     @staticmethod
     def initialize_stock(
         product_id: int, quantity: int, redis_nodes: list[Redis]
@@ -36,20 +121,16 @@ class RedlockManualService:
         Returns:
             성공 시 True
         """
-        stock_key = f"stock:{product_id}"
-        success_count = 0
+        stock_key = StockKeys.from_id(product_id).stock
+        quorum = quorum_size(redis_nodes)
 
-        for redis in redis_nodes:
-            try:
-                result = redis.set(stock_key, quantity, nx=True)
-                if result:
-                    success_count += 1
-            except Exception:
-                continue
+        # 모든 노드에 동시에 초기화 (응답하지 않는 노드는 None)
+        results = run_on_nodes(
+            lambda redis: redis.set(stock_key, quantity, nx=True), redis_nodes
+        )
 
         # 쿼럼 이상의 노드에서 성공하면 OK
-        quorum = len(redis_nodes) // 2 + 1
-        return success_count >= quorum
+        return sum(1 for result in results if result) >= quorum
 
     @staticmethod
     def get_stock(product_id: int, redis_nodes: list[Redis]) -> Optional[int]:
@@ -65,25 +146,19 @@ class RedlockManualService:
         Returns:
             현재 재고 수량, 쿼럼을 만족하지 못하면 None
         """
-        stock_key = f"stock:{product_id}"
-        stock_values = []
-
-        for redis in redis_nodes:
-            try:
-                stock = redis.get(stock_key)
-                if stock is not None:
-                    stock_values.append(int(stock))
-            except Exception:
-                continue
+        stock_key = StockKeys.from_id(product_id).stock
+        quorum = quorum_size(redis_nodes)
+        # 모든 노드를 동시에 조회 (노드 수와 관계없이 약 한 번의 왕복)
+        results = run_on_nodes(lambda redis: redis.get(stock_key), redis_nodes)
+        stock_values = [int(stock) for stock in results if stock is not None]
 
         if not stock_values:
             return None
 
         # 쿼럼 확인: 과반수 이상의 노드에서 같은 값을 읽었는지 확인
-        quorum = len(redis_nodes) // 2 + 1
         if len(stock_values) >= quorum:
             # 가장 빈번한 값 반환 (일반적으로 모든 노드가 동일한 값을 가짐)
-            return max(set(stock_values), key=stock_values.count)
+            return Counter(stock_values).most_common(1)[0][0]
 
         return None
 
@@ -93,10 +168,21 @@ class RedlockManualService:
         quantity: int,
         redis_nodes: list[Redis],
         settings: Settings,
-    ) -> bool:
+    ) -> tuple[int, Optional[int]]:
         """
         동기 방식으로 재고를 감소시킵니다 (수동 쿼럼 구현).
 
+        노드마다 락 획득과 재고 감소를 Lua 스크립트 하나로 실행하고, 모든 노드에
+        공유 스레드풀로 동시에 요청하므로 성공 경로는 감소 한 번 + 락 해제 한 번,
+        노드 수와 관계없이 약 두 번의 왕복입니다.
+
+        플로우:
+        1. 모든 노드에서 락 획득 + 재고 감소 (노드별로 원자적)
+        2. 쿼럼 이상의 노드에서 감소에 성공했는지 확인
+        3. 성공 시 락을 얻지 못한 소수 노드에도 감소 반영, 실패 시 감소한 노드만 롤백
+        4. 락을 보유한 노드(감소에 성공한 노드)의 락 해제
+        5. 쿼럼 이상의 노드에서 락을 얻지 못했으면 지수 백오프 + 지터 후 재시도
+
         Args:
             product_id: 상품 ID
             quantity: 감소시킬 수량
@@ -104,256 +190,246 @@ class RedlockManualService:
             settings: 애플리케이션 설정
 
         Returns:
-            재고 감소 성공 시 True, 실패 시 False
+            (결과 코드, 재고) 튜플 (InventoryService.decrease_stock과 동일)
+            - 재시도 횟수 안에 쿼럼 이상의 노드에서 락을 얻지 못하면 DECREASE_LOCK_NOT_ACQUIRED
         """
-        lock_key = f"lock:stock:{product_id}"
-        lock_id = str(uuid.uuid4())
-        quorum = len(redis_nodes) // 2 + 1
+        for attempt in range(settings.lock_retry_attempts):
+            code, stock = RedlockManualService._try_decrease_stock_sync(
+                product_id, quantity, redis_nodes, settings
+            )
+            if code != InventoryService.DECREASE_LOCK_NOT_ACQUIRED:
+                return code, stock
 
-        # 1. 모든 노드에 락 획득 시도
-        acquired_locks = []
-        for redis in redis_nodes:
-            try:
-                acquired = redis.set(
-                    lock_key,
-                    lock_id,
-                    nx=True,
-                    ex=settings.lock_timeout_seconds,
-                )
-                if acquired:
-                    acquired_locks.append(redis)
-            except Exception:
-                continue
+            # 락 경합, 다른 클라이언트와 같은 시점에 재시도하지 않도록 지연 후 재시도
+            if attempt < settings.lock_retry_attempts - 1:
+                time.sleep(retry_delay(attempt, settings))
 
-        # 2. 쿼럼 확인
-        if len(acquired_locks) < quorum:
-            # 쿼럼 실패: 획득한 락 모두 해제
-            RedlockManualService._release_locks(acquired_locks, lock_key, lock_id)
-            return False
+        return InventoryService.DECREASE_LOCK_NOT_ACQUIRED, None
+
+    @staticmethod
+    def _try_decrease_stock_sync(
+        product_id: int,
+        quantity: int,
+        redis_nodes: list[Redis],
+        settings: Settings,
+    ) -> tuple[int, Optional[int]]:
+        """decrease_stock_sync의 락 획득 + 재고 감소 1회 시도 (재시도 없음)"""
+        # 키는 노드마다 만들지 않고 bytes로 한 번만 생성
+        keys = StockKeys.from_id(product_id)
+        stock_key, lock_key = keys.stock, keys.lock
+        lock_id = os.urandom(8).hex()
+        quorum = quorum_size(redis_nodes)
+
+        # 1. 모든 노드에서 락 획득 + 재고 감소 (병렬)
+        results = run_on_nodes(
+            lambda redis: _LOCK_AND_DECREASE_STOCK_SCRIPT(
+                keys=keys,
+                args=[quantity, lock_id, settings.lock_timeout_seconds],
+                client=redis,
+            ),
+            redis_nodes,
+        )
+        # 감소에 성공한 노드만 락을 보유 (실패한 노드는 스크립트가 락을 해제함)
+        locked_nodes = decreased_nodes(redis_nodes, results)
 
         try:
-            # 3. 재고 감소 수행
-            decrease_script = """
-            local current_stock = redis.call("GET", KEYS[1])
-            if not current_stock then
-                return -2
-            end
-            current_stock = tonumber(current_stock)
-            local quantity = tonumber(ARGV[1])
-            if current_stock >= quantity then
-                redis.call("DECRBY", KEYS[1], quantity)
-                return current_stock - quantity
-            else
-                return -1
-            end
-            """
-
-            stock_key = f"stock:{product_id}"
-            success_count = 0
-
-            for redis in redis_nodes:
-                try:
-                    result = redis.eval(decrease_script, 1, stock_key, quantity)
-                    if result >= 0:
-                        success_count += 1
-                except Exception:
-                    continue
-
-            # 4. 재고 감소 쿼럼 확인
-            if success_count >= quorum:
-                return True
+            # 2. 쿼럼 확인 (감소 후 재고/실패 원인도 스크립트 결과로 판단)
+            code, stock = InventoryService.combine_node_results(results, quorum)
+            if code == InventoryService.DECREASE_SUCCESS:
+                # 락을 얻지 못한 소수 노드에도 감소를 반영해 노드 간 재고를 맞춤
+                run_on_nodes(
+                    lambda redis: DECREASE_STOCK_SCRIPT(
+                        keys=[stock_key], args=[quantity], client=redis
+                    ),
+                    RedlockManualService._lock_missed_nodes(redis_nodes, results),
+                )
             else:
-                # 롤백
-                rollback_script = """
-                redis.call("INCRBY", KEYS[1], ARGV[1])
-                return 1
-                """
-                for redis in redis_nodes:
-                    try:
-                        redis.eval(rollback_script, 1, stock_key, quantity)
-                    except Exception:
-                        continue
-                return False
+                # 3. 롤백: 실제로 감소한 노드만 복구 (병렬)
+                run_on_nodes(
+                    lambda redis: ROLLBACK_STOCK_SCRIPT(
+                        keys=[stock_key], args=[quantity], client=redis
+                    ),
+                    locked_nodes,
+                )
+            return code, stock
 
         finally:
-            # 5. 락 해제
-            RedlockManualService._release_locks(acquired_locks, lock_key, lock_id)
+            # 4. 락 해제
+            RedlockManualService._release_locks(locked_nodes, lock_key, lock_id)
+
+    @staticmethod
+    async def get_stock_async(
+        product_id: int, redis_nodes: list[AsyncRedis]
+    ) -> Optional[int]:
+        """
+        쿼럼 기반으로 재고를 조회합니다 (비동기).
+
+        모든 노드를 동시에 조회하며, 판단 기준은 get_stock과 같습니다.
+
+        Args:
+            product_id: 상품 ID
+            redis_nodes: 비동기 Redis 클라이언트 리스트
+
+        Returns:
+            현재 재고 수량, 쿼럼을 만족하지 못하면 None
+        """
+        stock_key = StockKeys.from_id(product_id).stock
+        quorum = quorum_size(redis_nodes)
+        results = await run_on_nodes_async(
+            lambda redis: redis.get(stock_key), redis_nodes
+        )
+        stock_values = [int(stock) for stock in results if stock is not None]
+
+        if not stock_values:
+            return None
+
+        if len(stock_values) >= quorum:
+            return Counter(stock_values).most_common(1)[0][0]
+
+        return None
 
     @staticmethod
     async def decrease_stock_async(
         product_id: int,
         quantity: int,
-        redis_nodes: list[Redis],
+        redis_nodes: list[AsyncRedis],
         settings: Settings,
-    ) -> bool:
+    ) -> tuple[int, Optional[int]]:
         """
         비동기 방식으로 재고를 감소시킵니다 (수동 쿼럼 구현).
 
+        redis.asyncio 클라이언트로 모든 노드에 동시에 요청하므로
+        이벤트 루프를 막거나 스레드풀을 거치지 않습니다.
+        플로우는 decrease_stock_sync와 같습니다 (노드별 락 획득 + 재고 감소를 한 스크립트로).
+        재시도 대기는 asyncio.sleep으로 하므로 대기 중에도 다른 요청을 처리합니다.
+
         Args:
             product_id: 상품 ID
             quantity: 감소시킬 수량
-            redis_nodes: Redis 클라이언트 리스트
+            redis_nodes: 비동기 Redis 클라이언트 리스트
             settings: 애플리케이션 설정
 
         Returns:
-            재고 감소 성공 시 True, 실패 시 False
+            (결과 코드, 재고) 튜플 (InventoryService.decrease_stock과 동일)
+            - 재시도 횟수 안에 쿼럼 이상의 노드에서 락을 얻지 못하면 DECREASE_LOCK_NOT_ACQUIRED
         """
-        lock_key = f"lock:stock:{product_id}"
-        lock_id = str(uuid.uuid4())
-        quorum = len(redis_nodes) // 2 + 1
-
-        # 1. 모든 노드에 락 획득 시도 (비동기적으로 병렬 처리)
-        async def try_acquire_lock(redis: Redis) -> Optional[Redis]:
-            """단일 노드에 락 획득 시도"""
-            try:
-                # 비동기 컨텍스트에서 동기 Redis 호출을 실행
-                loop = asyncio.get_event_loop()
-                acquired = await loop.run_in_executor(
-                    None,
-                    lambda: redis.set(
-                        lock_key,
-                        lock_id,
-                        nx=True,
-                        ex=settings.lock_timeout_seconds,
-                    ),
-                )
-                return redis if acquired else None
-            except Exception:
-                return None
-
-        # 병렬로 모든 노드에 락 획득 시도
-        tasks = [try_acquire_lock(redis) for redis in redis_nodes]
-        results = await asyncio.gather(*tasks)
-        acquired_locks = [redis for redis in results if redis is not None]
-
-        # 2. 쿼럼 확인
-        if len(acquired_locks) < quorum:
-            # 쿼럼 실패: 획득한 락 모두 해제
-            await RedlockManualService._release_locks_async(
-                acquired_locks, lock_key, lock_id
+        for attempt in range(settings.lock_retry_attempts):
+            code, stock = await RedlockManualService._try_decrease_stock_async(
+                product_id, quantity, redis_nodes, settings
             )
-            return False
+            if code != InventoryService.DECREASE_LOCK_NOT_ACQUIRED:
+                return code, stock
+
+            if attempt < settings.lock_retry_attempts - 1:
+                await asyncio.sleep(retry_delay(attempt, settings))
+
+        return InventoryService.DECREASE_LOCK_NOT_ACQUIRED, None
+
+    @staticmethod
+    async def _try_decrease_stock_async(
+        product_id: int,
+        quantity: int,
+        redis_nodes: list[AsyncRedis],
+        settings: Settings,
+    ) -> tuple[int, Optional[int]]:
+        """decrease_stock_async의 락 획득 + 재고 감소 1회 시도 (재시도 없음)"""
+        # 키는 노드마다 만들지 않고 bytes로 한 번만 생성
+        keys = StockKeys.from_id(product_id)
+        stock_key, lock_key = keys.stock, keys.lock
+        lock_id = os.urandom(8).hex()
+        quorum = quorum_size(redis_nodes)
+
+        # 1. 모든 노드에서 락 획득 + 재고 감소 (병렬)
+        results = await run_on_nodes_async(
+            lambda redis: _LOCK_AND_DECREASE_STOCK_ASYNC_SCRIPT(
+                keys=keys,
+                args=[quantity, lock_id, settings.lock_timeout_seconds],
+                client=redis,
+            ),
+            redis_nodes,
+        )
+        # 감소에 성공한 노드만 락을 보유 (실패한 노드는 스크립트가 락을 해제함)
+        locked_nodes = decreased_nodes(redis_nodes, results)
 
         try:
-            # 3. 재고 감소 수행
-            decrease_script = """
-            local current_stock = redis.call("GET", KEYS[1])
-            if not current_stock then
-                return -2
-            end
-            current_stock = tonumber(current_stock)
-            local quantity = tonumber(ARGV[1])
-            if current_stock >= quantity then
-                redis.call("DECRBY", KEYS[1], quantity)
-                return current_stock - quantity
-            else
-                return -1
-            end
-            """
-
-            stock_key = f"stock:{product_id}"
-
-            async def decrease_on_node(redis: Redis) -> bool:
-                """단일 노드에서 재고 감소"""
-                try:
-                    loop = asyncio.get_event_loop()
-                    result = await loop.run_in_executor(
-                        None,
-                        lambda: redis.eval(decrease_script, 1, stock_key, quantity),
-                    )
-                    return result >= 0
-                except Exception:
-                    return False
-
-            # 병렬로 모든 노드에서 재고 감소
-            decrease_tasks = [decrease_on_node(redis) for redis in redis_nodes]
-            decrease_results = await asyncio.gather(*decrease_tasks)
-            success_count = sum(decrease_results)
-
-            # 4. 재고 감소 쿼럼 확인
-            if success_count >= quorum:
-                return True
+            # 2. 쿼럼 확인 (감소 후 재고/실패 원인도 스크립트 결과로 판단)
+            code, stock = InventoryService.combine_node_results(results, quorum)
+            if code == InventoryService.DECREASE_SUCCESS:
+                # 락을 얻지 못한 소수 노드에도 감소를 반영해 노드 간 재고를 맞춤
+                await run_on_nodes_async(
+                    lambda redis: DECREASE_STOCK_ASYNC_SCRIPT(
+                        keys=[stock_key], args=[quantity], client=redis
+                    ),
+                    RedlockManualService._lock_missed_nodes(redis_nodes, results),
+                )
             else:
-                # 롤백
-                rollback_script = """
-                redis.call("INCRBY", KEYS[1], ARGV[1])
-                return 1
-                """
-
-                async def rollback_on_node(redis: Redis):
-                    """단일 노드에서 롤백"""
-                    try:
-                        loop = asyncio.get_event_loop()
-                        await loop.run_in_executor(
-                            None,
-                            lambda: redis.eval(rollback_script, 1, stock_key, quantity),
-                        )
-                    except Exception:
-                        pass
-
-                rollback_tasks = [rollback_on_node(redis) for redis in redis_nodes]
-                await asyncio.gather(*rollback_tasks)
-                return False
+                # 3. 롤백: 실제로 감소한 노드만 복구
+                await run_on_nodes_async(
+                    lambda redis: ROLLBACK_STOCK_ASYNC_SCRIPT(
+                        keys=[stock_key], args=[quantity], client=redis
+                    ),
+                    locked_nodes,
+                )
+            return code, stock
 
         finally:
-            # 5. 락 해제
+            # 4. 락 해제
             await RedlockManualService._release_locks_async(
-                acquired_locks, lock_key, lock_id
+                locked_nodes, lock_key, lock_id
             )
 
     @staticmethod
-    def _release_locks(redis_clients: list[Redis], lock_key: str, lock_id: str):
+    def _lock_missed_nodes(redis_nodes: list, results: list[Optional[list]]) -> list:
+        """
+        락을 얻지 못해 재고를 감소하지 않은 노드를 골라냅니다.
+
+        쿼럼 성공 후 이 노드들에도 감소를 반영하지 않으면 노드 간 재고가 어긋납니다.
+
+        Args:
+            redis_nodes: Redis 클라이언트 리스트
+            results: 노드 순서대로 정렬된 감소 스크립트 결과
+
+        Returns:
+            락 획득에 실패한 노드 리스트
+        """
+        return [
+            redis
+            for redis, result in zip(redis_nodes, results)
+            if result and result[0] == InventoryService.DECREASE_LOCK_NOT_ACQUIRED
+        ]
+
+    @staticmethod
+    def _release_locks(redis_clients: list[Redis], lock_key: bytes, lock_id: str):
         """
-        여러 Redis 노드에서 락을 해제합니다 (동기).
+        여러 Redis 노드에서 락을 해제합니다 (동기, 노드에 병렬 요청).
 
         Args:
             redis_clients: Redis 클라이언트 리스트
             lock_key: 락 키
             lock_id: 락 ID
         """
-        release_script = """
-        if redis.call("GET", KEYS[1]) == ARGV[1] then
-            return redis.call("DEL", KEYS[1])
-        else
-            return 0
-        end
-        """
-
-        for redis in redis_clients:
-            try:
-                redis.eval(release_script, 1, lock_key, lock_id)
-            except Exception:
-                continue
+        run_on_nodes(
+            lambda redis: _RELEASE_LOCK_SCRIPT(
+                keys=[lock_key], args=[lock_id], client=redis
+            ),
+            redis_clients,
+        )
 
     @staticmethod
     async def _release_locks_async(
-        redis_clients: list[Redis], lock_key: str, lock_id: str
+        redis_clients: list[AsyncRedis], lock_key: bytes, lock_id: str
     ):
         """
         여러 Redis 노드에서 락을 해제합니다 (비동기).
 
         Args:
-            redis_clients: Redis 클라이언트 리스트
+            redis_clients: 비동기 Redis 클라이언트 리스트
             lock_key: 락 키
             lock_id: 락 ID
         """
-        release_script = """
-        if redis.call("GET", KEYS[1]) == ARGV[1] then
-            return redis.call("DEL", KEYS[1])
-        else
-            return 0
-        end
-        """
-
-        async def release_on_node(redis: Redis):
-            """단일 노드에서 락 해제"""
-            try:
-                loop = asyncio.get_event_loop()
-                await loop.run_in_executor(
-                    None, lambda: redis.eval(release_script, 1, lock_key, lock_id)
-                )
-            except Exception:
-                pass
-
-        tasks = [release_on_node(redis) for redis in redis_clients]
-        await asyncio.gather(*tasks)
+        await run_on_nodes_async(
+            lambda redis: _RELEASE_LOCK_ASYNC_SCRIPT(
+                keys=[lock_key], args=[lock_id], client=redis
+            ),
+            redis_clients,
+        )
@@ -0,0 +1,61 @@
+"""
+Redlock 서비스들이 공유하는 노드 재고 스크립트와 결과 처리 헬퍼
+"""
+
+from typing import Optional
+
+from redis.commands.core import AsyncScript, Script
+
+from app.services.inventory_service import InventoryService
+
+
+# Lua 스크립트는 모듈 로드 시 한 번만 만들어 SHA1을 미리 계산해 둠
+# 호출 시 EVALSHA로 실행하므로 노드가 매번 스크립트 본문을 파싱하지 않음
+# (노드에 스크립트가 없으면 redis-py가 SCRIPT LOAD 후 자동으로 재시도)
+
+# 재고 감소: {0, 남은 재고}, 재고 부족 시 {-1, 현재 재고}, 재고 키가 없으면 {-2}
+# (InventoryService.DECREASE_* 코드와 같으며, 실패 원인 파악용 재조회가 필요 없음)
+DECREASE_STOCK_LUA = b"""
+local current_stock = redis.call("GET", KEYS[1])
+if not current_stock then
+    return {-2}
+end
+current_stock = tonumber(current_stock)
+local quantity = tonumber(ARGV[1])
+if current_stock >= quantity then
+    redis.call("DECRBY", KEYS[1], quantity)
+    return {0, current_stock - quantity}
+end
+return {-1, current_stock}
+"""
+
+ROLLBACK_STOCK_LUA = b"""
+redis.call("INCRBY", KEYS[1], ARGV[1])
+return 1
+"""
+
+# bytes 스크립트는 인코더가 필요 없으므로 특정 클라이언트에 묶지 않고 생성
+DECREASE_STOCK_SCRIPT = Script(None, DECREASE_STOCK_LUA)
+ROLLBACK_STOCK_SCRIPT = Script(None, ROLLBACK_STOCK_LUA)
+
+# redis.asyncio 클라이언트용 (SHA는 동기 버전과 같으므로 load_scripts 결과를 공유)
+DECREASE_STOCK_ASYNC_SCRIPT = AsyncScript(None, DECREASE_STOCK_LUA)
+ROLLBACK_STOCK_ASYNC_SCRIPT = AsyncScript(None, ROLLBACK_STOCK_LUA)
+
+
+def decreased_nodes(redis_nodes: list, results: list[Optional[list]]) -> list:
+    """
+    감소 스크립트 결과에서 실제로 재고가 감소한 노드만 골라냅니다 (롤백/락 해제 대상).
+
+    Args:
+        redis_nodes: Redis 클라이언트 리스트
+        results: 노드 순서대로 정렬된 감소 스크립트 결과
+
+    Returns:
+        재고가 감소한 노드 리스트
+    """
+    return [
+        redis
+        for redis, result in zip(redis_nodes, results)
+        if result and result[0] == InventoryService.DECREASE_SUCCESS
+    ]
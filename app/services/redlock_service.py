@@ -2,12 +2,27 @@
 Redlock 알고리즘을 이용한 분산 락 재고 관리 서비스
 """
 
+from collections import Counter
 from typing import Optional
 
+import anyio.to_thread
 from aioredlock import Aioredlock, LockError
 from redis import Redis
 
 from app.core.config import Settings
+from app.db.redis_client import (
+    create_lock_manager,
+    iter_on_nodes,
+    quorum_size,
+    run_on_nodes,
+)
+from app.services.inventory_service import InventoryService, StockKeys
+from app.services.redlock_manual_service import RedlockManualService
+from app.services.redlock_scripts import (
+    DECREASE_STOCK_SCRIPT,
+    ROLLBACK_STOCK_SCRIPT,
+    decreased_nodes,
+)
 
 
 class RedlockService:
@@ -30,20 +45,16 @@ class RedlockService:
         Returns:
             성공 시 True
         """
-        stock_key = f"stock:{product_id}"
-        success_count = 0
+        stock_key = StockKeys.from_id(product_id).stock
+        quorum = quorum_size(redis_nodes)
 
-        for redis in redis_nodes:
-            try:
-                result = redis.set(stock_key, quantity, nx=True)
-                if result:
-                    success_count += 1
-            except Exception:
-                continue
+        # 모든 노드에 동시에 초기화 (노드 수와 관계없이 약 한 번의 왕복)
+        results = run_on_nodes(
+            lambda redis: redis.set(stock_key, quantity, nx=True), redis_nodes
+        )
 
         # 쿼럼 이상의 노드에서 성공하면 OK
-        quorum = len(redis_nodes) // 2 + 1
-        return success_count >= quorum
+        return sum(1 for result in results if result) >= quorum
 
     @staticmethod
     def get_stock(product_id: int, redis_nodes: list[Redis]) -> Optional[int]:
@@ -59,27 +70,84 @@ class RedlockService:
         Returns:
             현재 재고 수량, 쿼럼을 만족하지 못하면 None
         """
-        stock_key = f"stock:{product_id}"
+        stock_key = StockKeys.from_id(product_id).stock
+        quorum = quorum_size(redis_nodes)
         stock_values = []
+        # 값별 응답 노드 수 (응답마다 리스트를 다시 세지 않도록 누적)
+        counts = Counter()
 
-        for redis in redis_nodes:
-            try:
-                stock = redis.get(stock_key)
-                if stock is not None:
-                    stock_values.append(int(stock))
-            except Exception:
+        # 모든 노드를 동시에 조회하고 응답이 오는 순서대로 확인
+        for stock in iter_on_nodes(lambda redis: redis.get(stock_key), redis_nodes):
+            if stock is None:
                 continue
+            stock = int(stock)
+            stock_values.append(stock)
+            counts[stock] += 1
+            # 과반수 노드가 같은 값을 반환했으면 결과가 정해졌으므로 나머지 응답은 기다리지 않음
+            if counts[stock] >= quorum:
+                return stock
+
+        # 쿼럼 확인 후 가장 많은 노드가 반환한 값 사용
+        return RedlockService._quorum_stock(stock_values, quorum)
+
+    @staticmethod
+    def get_stocks(
+        product_ids: list[int], redis_nodes: list[Redis]
+    ) -> dict[int, Optional[int]]:
+        """
+        여러 상품의 재고를 쿼럼 기반으로 한 번에 조회합니다.
+
+        노드마다 MGET 한 번으로 모든 상품의 재고를 읽고 모든 노드에 동시에 요청하므로,
+        상품 수와 관계없이 약 한 번의 왕복입니다. 상품별 판단 기준은 get_stock과 같습니다.
+
+        Args:
+            product_ids: 상품 ID 리스트
+            redis_nodes: Redis 클라이언트 리스트
 
-        if not stock_values:
+        Returns:
+            상품 ID별 재고 수량 (쿼럼을 만족하지 못한 상품은 None)
+        """
+        if not product_ids:
+            return {}
+
+        stock_keys = [
+            StockKeys.from_id(product_id).stock for product_id in product_ids
+        ]
+        quorum = quorum_size(redis_nodes)
+        results = run_on_nodes(lambda redis: redis.mget(stock_keys), redis_nodes)
+        # 응답한 노드의 결과만 사용 (Redis 오류가 발생한 노드는 None)
+        node_values = [values for values in results if values is not None]
+
+        stocks = {}
+        for index, product_id in enumerate(product_ids):
+            stock_values = [
+                int(values[index]) for values in node_values if values[index] is not None
+            ]
+            stocks[product_id] = RedlockService._quorum_stock(stock_values, quorum)
+        return stocks
+
+    @staticmethod
+    def _quorum_stock(stock_values: list[int], quorum: int) -> Optional[int]:
+        """
+        노드들이 반환한 재고 값 중 쿼럼 기준으로 사용할 값을 고릅니다.
+
+        Args:
+            stock_values: 재고 키가 있는 노드들이 반환한 재고 값
+            quorum: 쿼럼 크기
+
+        Returns:
+            가장 많은 노드가 반환한 재고 값, 쿼럼 미만의 노드만 응답했으면 None
+        """
+        if len(stock_values) < quorum:
             return None
 
-        # 쿼럼 확인: 과반수 이상의 노드에서 같은 값을 읽었는지 확인
-        quorum = len(redis_nodes) // 2 + 1
-        if len(stock_values) >= quorum:
-            # 가장 빈번한 값 반환 (일반적으로 모든 노드가 동일한 값을 가짐)
-            return max(set(stock_values), key=stock_values.count)
+        # 일반적으로 모든 노드가 같은 값을 가지므로 이 경우 Counter를 만들지 않음
+        first = stock_values[0]
+        if all(stock == first for stock in stock_values):
+            return first
 
-        return None
+        # 노드 간 값이 다르면 가장 빈번한 값 반환 (O(n))
+        return Counter(stock_values).most_common(1)[0][0]
 
     @staticmethod
     async def decrease_stock_with_redlock(
@@ -87,6 +155,7 @@ class RedlockService:
         quantity: int,
         redis_nodes: list[Redis],
         settings: Settings,
+        lock_manager: Optional[Aioredlock] = None,
     ) -> bool:
         """
         Redlock 알고리즘으로 분산 락을 획득하고 재고를 감소시킵니다.
@@ -103,31 +172,19 @@ class RedlockService:
             quantity: 감소시킬 수량
             redis_nodes: Redis 클라이언트 리스트
             settings: 애플리케이션 설정
+            lock_manager: 공유 aioredlock 락 매니저 (app.state.lock_manager)
+                없으면 이 호출에서만 쓸 매니저를 만들고 끝나면 종료합니다.
 
         Returns:
             재고 감소 성공 시 True, 실패 시 False
         """
-        # aioredlock 설정
-        # Redis 연결 정보 생성
-        redis_connections = []
-        for node_info in settings.redis_node_list:
-            redis_url = f"redis://{node_info['host']}:{node_info['port']}/0"
-            redis_connections.append(redis_url)
-
-        if not redis_connections:
-            # 노드 정보가 없으면 기본 단일 Redis 사용
-            redis_url = f"redis://{settings.redis_host}:{settings.redis_port}/{settings.redis_db}"
-            redis_connections.append(redis_url)
-
-        # Redlock 인스턴스 생성
-        lock_manager = Aioredlock(
-            redis_connections,
-            retry_count=settings.lock_retry_attempts,
-            retry_delay_min=settings.lock_retry_delay_ms / 1000.0,
-            retry_delay_max=settings.lock_retry_delay_ms / 1000.0 * 2,
-        )
+        # 공유 락 매니저가 있으면 노드 커넥션을 요청마다 새로 맺지 않고 재사용
+        owns_lock_manager = lock_manager is None
+        if owns_lock_manager:
+            lock_manager = create_lock_manager(settings)
 
         lock_key = f"lock:stock:{product_id}"
+        quorum = quorum_size(redis_nodes)
 
         try:
             # Redlock으로 락 획득 (비동기)
@@ -138,49 +195,33 @@ class RedlockService:
 
             try:
                 # 락 획득 성공, 재고 감소 수행
-                decrease_script = """
-                local current_stock = redis.call("GET", KEYS[1])
-                if not current_stock then
-                    return -2
-                end
-                current_stock = tonumber(current_stock)
-                local quantity = tonumber(ARGV[1])
-                if current_stock >= quantity then
-                    redis.call("DECRBY", KEYS[1], quantity)
-                    return current_stock - quantity
-                else
-                    return -1
-                end
-                """
-
-                stock_key = f"stock:{product_id}"
+                # Lua 스크립트는 EVALSHA로 실행 (수동 Redlock 서비스와 같은 스크립트)
+                # 반환값: {0, 남은 재고}, {-1, 현재 재고} (재고 부족), {-2} (재고 키 없음)
+                stock_key = StockKeys.from_id(product_id).stock
 
                 # 쿼럼 이상의 노드에서 재고 감소 성공해야 함
-                success_count = 0
-                quorum = len(redis_nodes) // 2 + 1
-
-                for redis in redis_nodes:
-                    try:
-                        result = redis.eval(decrease_script, 1, stock_key, quantity)
-                        if result >= 0:
-                            success_count += 1
-                    except Exception:
-                        continue
+                # 동기 클라이언트이므로 이벤트 루프를 막지 않도록 스레드에서 모든 노드에 병렬 요청
+                results = await anyio.to_thread.run_sync(
+                    run_on_nodes,
+                    lambda redis: DECREASE_STOCK_SCRIPT(
+                        keys=[stock_key], args=[quantity], client=redis
+                    ),
+                    redis_nodes,
+                )
+                success_count = RedlockService._count_decreased(results)
 
                 # 쿼럼 확인
                 if success_count >= quorum:
                     return True
                 else:
-                    # 쿼럼 실패 시 롤백 (재고 복구)
-                    rollback_script = """
-                    redis.call("INCRBY", KEYS[1], ARGV[1])
-                    return 1
-                    """
-                    for redis in redis_nodes:
-                        try:
-                            redis.eval(rollback_script, 1, stock_key, quantity)
-                        except Exception:
-                            continue
+                    # 쿼럼 실패 시 롤백 (실제로 감소한 노드만 재고 복구)
+                    await anyio.to_thread.run_sync(
+                        run_on_nodes,
+                        lambda redis: ROLLBACK_STOCK_SCRIPT(
+                            keys=[stock_key], args=[quantity], client=redis
+                        ),
+                        decreased_nodes(redis_nodes, results),
+                    )
                     return False
 
             finally:
@@ -191,8 +232,9 @@ class RedlockService:
             # 락 획득 실패 (재시도 횟수 초과)
             return False
         finally:
-            # Redlock 매니저 종료
-            await lock_manager.destroy()
+            # 이 호출에서 만든 Redlock 매니저만 종료
+            if owns_lock_manager:
+                await lock_manager.destroy()
 
     @staticmethod
     def decrease_stock_sync(
@@ -206,6 +248,7 @@ class RedlockService:
 
         이 메서드는 aioredlock을 사용하지 않고 수동으로 쿼럼 기반 락을 구현합니다.
         간단한 테스트나 동기 환경에서 사용할 수 있습니다.
+        노드당 왕복은 락 획득 + 재고 감소 한 번, 락 해제 한 번입니다.
 
         Args:
             product_id: 상품 ID
@@ -216,101 +259,27 @@ class RedlockService:
         Returns:
             재고 감소 성공 시 True, 실패 시 False
         """
-        import uuid
-
-        lock_key = f"lock:stock:{product_id}"
-        lock_id = str(uuid.uuid4())
-        quorum = len(redis_nodes) // 2 + 1
-
-        # 1. 모든 노드에 락 획득 시도
-        acquired_locks = []
-        for redis in redis_nodes:
-            try:
-                acquired = redis.set(
-                    lock_key,
-                    lock_id,
-                    nx=True,
-                    ex=settings.lock_timeout_seconds,
-                )
-                if acquired:
-                    acquired_locks.append(redis)
-            except Exception:
-                continue
-
-        # 2. 쿼럼 확인
-        if len(acquired_locks) < quorum:
-            # 쿼럼 실패: 획득한 락 모두 해제
-            RedlockService._release_locks(acquired_locks, lock_key, lock_id)
-            return False
-
-        try:
-            # 3. 재고 감소 수행
-            decrease_script = """
-            local current_stock = redis.call("GET", KEYS[1])
-            if not current_stock then
-                return -2
-            end
-            current_stock = tonumber(current_stock)
-            local quantity = tonumber(ARGV[1])
-            if current_stock >= quantity then
-                redis.call("DECRBY", KEYS[1], quantity)
-                return current_stock - quantity
-            else
-                return -1
-            end
-            """
-
-            stock_key = f"stock:{product_id}"
-            success_count = 0
-
-            for redis in redis_nodes:
-                try:
-                    result = redis.eval(decrease_script, 1, stock_key, quantity)
-                    if result >= 0:
-                        success_count += 1
-                except Exception:
-                    continue
-
-            # 4. 재고 감소 쿼럼 확인
-            if success_count >= quorum:
-                return True
-            else:
-                # 롤백
-                rollback_script = """
-                redis.call("INCRBY", KEYS[1], ARGV[1])
-                return 1
-                """
-                for redis in redis_nodes:
-                    try:
-                        redis.eval(rollback_script, 1, stock_key, quantity)
-                    except Exception:
-                        continue
-                return False
-
-        finally:
-            # 5. 락 해제
-            RedlockService._release_locks(acquired_locks, lock_key, lock_id)
+        # 노드마다 락 획득 + 재고 감소를 Lua 스크립트 하나(EVALSHA 한 번)로 실행하는
+        # 수동 Redlock 구현을 그대로 사용 (락 획득 → 감소 → 해제를 따로 왕복하지 않음)
+        # 쿼럼 실패 시에는 실제로 감소한 노드만 롤백하고, 락을 얻은 노드의 락만 해제함
+        code, _ = RedlockManualService._try_decrease_stock_sync(
+            product_id, quantity, redis_nodes, settings
+        )
+        return code == InventoryService.DECREASE_SUCCESS
 
     @staticmethod
-    def _release_locks(redis_clients: list[Redis], lock_key: str, lock_id: str):
+    def _count_decreased(results: list[Optional[list]]) -> int:
         """
-        여러 Redis 노드에서 락을 해제합니다.
+        감소 스크립트 결과 중 재고 감소에 성공한 노드 수를 셉니다.
 
         Args:
-            redis_clients: Redis 클라이언트 리스트
-            lock_key: 락 키
-            lock_id: 락 ID
-        """
-        release_script = """
-        if redis.call("GET", KEYS[1]) == ARGV[1] then
-            return redis.call("DEL", KEYS[1])
-        else
-            return 0
-        end
-        """
+            results: 노드 순서대로 정렬된 감소 스크립트 결과 (응답 없는 노드는 None)
 
-        for redis in redis_clients:
-            try:
-                redis.eval(release_script, 1, lock_key, lock_id)
-            except Exception:
-                continue
+        Returns:
+            재고 감소에 성공한 노드 수
+        """
+        return sum(
+            1
+            for result in results
+            if result and result[0] == InventoryService.DECREASE_SUCCESS
+        )
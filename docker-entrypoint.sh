@@ -12,4 +12,5 @@ echo "Migrations completed successfully!"
 echo "Starting FastAPI server..."
 
 # exec를 사용하여 PID 1로 uvicorn 실행 (신호 처리를 위해 중요)
-exec uvicorn app.main:app --host 0.0.0.0 --port 8080
\ No newline at end of file
+# uvicorn[standard]의 C 기반 HTTP 파서(httptools)와 uvloop 이벤트 루프를 명시적으로 사용
+exec uvicorn app.main:app --host 0.0.0.0 --port 8080 --http httptools --loop uvloop
\ No newline at end of file
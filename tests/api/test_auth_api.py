@@ -201,6 +201,31 @@ class TestGetMeAPI:
         assert data["username"] == username
         assert "created_at" in data
 
+    def test_get_me_cached_user(self, test_client):
+        """같은 사용자의 반복 요청은 캐시된 사용자로 응답하는지 테스트"""
+        from app.services.auth_service import _user_cache
+
+        username = "cacheuser"
+        password = "cachepass123"
+
+        test_client.post(
+            "/api/auth/register",
+            json={"username": username, "password": password},
+        )
+        login_response = test_client.post(
+            "/api/auth/login",
+            data={"username": username, "password": password},
+        )
+        headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+
+        first = test_client.get("/api/auth/me", headers=headers)
+        second = test_client.get("/api/auth/me", headers=headers)
+
+        assert first.status_code == 200
+        assert second.status_code == 200
+        assert first.json() == second.json()
+        assert len(_user_cache) == 1
+
     def test_get_me_without_token(self, test_client):
         """토큰 없이 /me 접근 시 실패 테스트 (401 Unauthorized)"""
         response = test_client.get("/api/auth/me")
@@ -217,3 +242,14 @@ class TestGetMeAPI:
 
         # 401 Unauthorized
         assert response.status_code == 401
+
+    def test_get_me_invalid_token_has_bearer_challenge(self, test_client):
+        """인증 실패 응답에 WWW-Authenticate 헤더가 포함되는지 테스트"""
+        response = test_client.get(
+            "/api/auth/me",
+            headers={"Authorization": "Bearer invalid.token.here"},
+        )
+
+        assert response.status_code == 401
+        assert response.headers["www-authenticate"] == "Bearer"
+        assert "detail" in response.json()
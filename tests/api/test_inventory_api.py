@@ -9,7 +9,11 @@ from fastapi.testclient import TestClient
 
 from app.main import app
 from app.db.database import get_db
-from app.db.redis_client import get_redis_client
+from app.db.redis_client import (
+    create_async_redis_client,
+    get_async_redis_client,
+    get_redis_client,
+)
 from app.core.config import get_settings
 
 
@@ -29,12 +33,21 @@ def test_client(test_db, redis_client, settings):
     def override_get_redis_client():
         yield redis_client
 
+    # 비동기 Redis 클라이언트 의존성 오버라이드 (요청마다 생성 후 정리)
+    async def override_get_async_redis_client():
+        client = create_async_redis_client(settings)
+        try:
+            yield client
+        finally:
+            await client.aclose(close_connection_pool=True)
+
     # Settings 의존성 오버라이드
     def override_get_settings():
         return settings
 
     app.dependency_overrides[get_db] = override_get_db
     app.dependency_overrides[get_redis_client] = override_get_redis_client
+    app.dependency_overrides[get_async_redis_client] = override_get_async_redis_client
     app.dependency_overrides[get_settings] = override_get_settings
 
     # TestClient 생성
@@ -157,6 +170,32 @@ class TestProductListAPI:
         assert isinstance(data, list)
         assert len(data) >= 2
 
+    def test_list_products_pagination(self, test_client, auth_headers):
+        """skip/limit 파라미터로 페이지 단위 조회 테스트 (200 OK)"""
+        for i in range(1, 4):
+            test_client.post(
+                "/api/products",
+                json={"name": f"Product {i}", "price": 10000 * i, "stock": i},
+                headers=auth_headers,
+            )
+
+        response = test_client.get(
+            "/api/products", params={"skip": 1, "limit": 1}, headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 1
+        assert data[0]["name"] == "Product 2"
+
+    def test_list_products_limit_too_large(self, test_client, auth_headers):
+        """limit 상한(100) 초과 시 실패 테스트 (422 Unprocessable Entity)"""
+        response = test_client.get(
+            "/api/products", params={"limit": 1000}, headers=auth_headers
+        )
+
+        assert response.status_code == 422
+
     def test_list_products_without_auth(self, test_client):
         """인증 없이 목록 조회 실패 테스트 (401 Unauthorized)"""
         response = test_client.get("/api/products")
@@ -314,6 +353,32 @@ class TestPurchaseAPI:
 
         assert response.status_code == 404
 
+    def test_purchase_async_success(self, test_client, auth_headers):
+        """비동기 구매 엔드포인트 성공 테스트 (201 Created)"""
+        create_response = test_client.post(
+            "/api/products",
+            json={"name": "MacBook Pro", "price": 2500000, "stock": 10},
+            headers=auth_headers,
+        )
+        product_id = create_response.json()["id"]
+
+        response = test_client.post(
+            "/api/purchases/async",
+            json={"product_id": product_id, "quantity": 2},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["product_id"] == product_id
+        assert data["total_price"] == 5000000
+
+        stock_response = test_client.get(
+            f"/api/products/{product_id}/stock", headers=auth_headers
+        )
+        assert stock_response.json()["redis_stock"] == 8
+        assert stock_response.json()["db_stock"] == 8
+
     def test_purchase_without_auth(self, test_client):
         """인증 없이 구매 실패 테스트 (401 Unauthorized)"""
         response = test_client.post(
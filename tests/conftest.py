@@ -9,6 +9,8 @@ from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
 
 from app.core.config import Settings
+from app.core.security import clear_token_cache
+from app.services.auth_service import clear_user_cache
 from app.db.redis_client import create_redis_client
 from app.db.database import Base
 from app.main import app
@@ -33,6 +35,16 @@ def settings():
     )
 
 
+@pytest.fixture(autouse=True)
+def _clear_auth_cache():
+    """테스트 간 인증 캐시가 공유되지 않도록 매 테스트 전후로 비움"""
+    clear_user_cache()
+    clear_token_cache()
+    yield
+    clear_user_cache()
+    clear_token_cache()
+
+
 @pytest.fixture(scope="function")
 def redis_client(settings):
     """
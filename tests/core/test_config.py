@@ -2,7 +2,7 @@
 설정(Config) 관련 테스트
 """
 
-from app.core.config import Settings
+from app.core.config import RedisNode, Settings
 
 
 def test_config_from_env(monkeypatch):
@@ -20,3 +20,69 @@ def test_config_from_env(monkeypatch):
     assert settings.redis_host == "test-redis"
     assert settings.redis_port == 6380
     assert settings.jwt_secret_key == "test-secret-key"
+
+
+def test_get_settings_is_cached():
+    """get_settings가 프로세스 전역 싱글톤을 반환하는지 테스트"""
+    from app.core.config import get_settings
+
+    assert get_settings() is get_settings()
+
+
+def test_redis_node_list_parsing():
+    """redis_nodes 문자열이 노드 목록으로 파싱되는지 테스트"""
+    settings = Settings(
+        redis_host="localhost",
+        redis_port=6380,
+        redis_db=0,
+        redis_password="",
+        redis_nodes="redis1:6381, redis2",
+        jwt_secret_key="test-secret-key",
+        jwt_algorithm="HS256",
+        jwt_expiration_minutes=30,
+    )
+
+    assert settings.redis_node_list == (
+        RedisNode("redis1", 6381),
+        RedisNode("redis2", 6380),
+    )
+    assert settings.redis_url == "redis://localhost:6380/0"
+
+
+def test_db_pool_settings_from_env(monkeypatch):
+    """DB 커넥션 풀 설정을 환경 변수로 조정할 수 있는지 테스트"""
+    monkeypatch.setenv("DB_POOL_SIZE", "20")
+    monkeypatch.setenv("DB_MAX_OVERFLOW", "5")
+
+    settings = Settings(
+        redis_host="localhost",
+        redis_port=6380,
+        redis_db=0,
+        redis_password="",
+        jwt_secret_key="test-secret-key",
+        jwt_algorithm="HS256",
+        jwt_expiration_minutes=30,
+    )
+
+    assert settings.db_pool_size == 20
+    assert settings.db_max_overflow == 5
+    assert settings.db_pool_timeout == 60
+
+
+def test_cors_origin_list_parsing():
+    """cors_allowed_origins 문자열이 Origin 목록으로 파싱되는지 테스트"""
+    settings = Settings(
+        redis_host="localhost",
+        redis_port=6380,
+        redis_db=0,
+        redis_password="",
+        jwt_secret_key="test-secret-key",
+        jwt_algorithm="HS256",
+        jwt_expiration_minutes=30,
+        cors_allowed_origins="https://a.example.com, https://b.example.com,",
+    )
+
+    assert settings.cors_origin_list == [
+        "https://a.example.com",
+        "https://b.example.com",
+    ]
@@ -64,6 +64,22 @@ class TestPasswordHashing:
         assert verify_password(password, hashed) is True
         assert verify_password("not_empty", hashed) is False
 
+    def test_hash_password_custom_rounds(self):
+        """지정한 bcrypt cost가 해시에 기록되고 검증되는지 테스트"""
+        password = "rounds_password"
+        hashed = hash_password(password, rounds=4)
+
+        assert hashed.startswith("$2b$04$")
+        assert verify_password(password, hashed) is True
+
+    def test_verify_password_bytes_hash(self):
+        """bytes로 전달된 해시도 검증되는지 테스트"""
+        password = "bytes_password"
+        hashed = hash_password(password).encode("utf-8")
+
+        assert verify_password(password, hashed) is True
+        assert verify_password("wrong_password", hashed) is False
+
 
 class TestJWTToken:
     """JWT 토큰 생성 및 검증 테스트 클래스"""
@@ -167,3 +183,47 @@ class TestJWTToken:
         # 다른 시크릿으로 생성된 토큰 검증 시 예외 발생
         with pytest.raises(jwt.InvalidTokenError):
             verify_access_token(wrong_token, test_settings)
+
+    def test_verify_access_token_cached(self, test_settings, monkeypatch):
+        """같은 토큰의 재검증은 서명 검증 없이 캐시된 페이로드를 반환하는지 테스트"""
+        token = create_access_token({"sub": "testuser"}, test_settings)
+        first = verify_access_token(token, test_settings)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("jwt.decode should not be called on cache hit")
+
+        monkeypatch.setattr(jwt, "decode", fail)
+
+        assert verify_access_token(token, test_settings) == first
+
+    def test_verify_access_token_cache_returns_copy(self, test_settings):
+        """반환된 페이로드를 수정해도 캐시된 페이로드는 바뀌지 않는지 테스트"""
+        token = create_access_token({"sub": "testuser"}, test_settings)
+        first = verify_access_token(token, test_settings)
+        first["sub"] = "attacker"
+
+        second = verify_access_token(token, test_settings)
+        second["role"] = "admin"
+
+        third = verify_access_token(token, test_settings)
+        assert third["sub"] == "testuser"
+        assert "role" not in third
+
+    def test_verify_access_token_cache_checks_expiry(self, test_settings, monkeypatch):
+        """캐시된 토큰이라도 만료 시각이 지나면 캐시를 사용하지 않고 다시 검증하는지 테스트"""
+        import time
+
+        token = create_access_token({"sub": "testuser"}, test_settings)
+        payload = verify_access_token(token, test_settings)
+
+        # 만료 시각 이후로 시간을 이동
+        expired_at = payload["exp"] + 1
+        monkeypatch.setattr(time, "time", lambda: expired_at)
+
+        def expired(*args, **kwargs):
+            raise jwt.ExpiredSignatureError("Signature has expired")
+
+        monkeypatch.setattr(jwt, "decode", expired)
+
+        with pytest.raises(jwt.ExpiredSignatureError):
+            verify_access_token(token, test_settings)
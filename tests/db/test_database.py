@@ -0,0 +1,22 @@
+"""
+데이터베이스 엔진 설정 테스트
+"""
+
+from sqlalchemy import create_engine, event, text
+
+from app.db.database import _set_sqlite_pragma
+
+
+def test_sqlite_pragma_enables_wal(tmp_path):
+    """SQLite 커넥션 생성 시 WAL 모드와 PRAGMA가 적용되는지 테스트"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'wal.db'}")
+    event.listen(engine, "connect", _set_sqlite_pragma)
+
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        # synchronous=NORMAL → 1
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1
+        # temp_store=MEMORY → 2
+        assert conn.execute(text("PRAGMA temp_store")).scalar() == 2
+
+    engine.dispose()
@@ -2,9 +2,23 @@
 Redis 연결 테스트
 """
 
-from redis import Redis
+import pytest
+from aioredlock import Aioredlock
+from redis import BlockingConnectionPool, Redis
+from redis.exceptions import ConnectionError as RedisConnectionError
 
-from app.db.redis_client import create_redis_client
+from app.core.config import RedisNode
+from app.db.redis_client import (
+    _node_worker_count,
+    create_async_redis_nodes,
+    create_redis_client,
+    create_redis_nodes,
+    iter_on_nodes,
+    quorum_size,
+    run_on_nodes,
+    run_on_nodes_async,
+    warm_up_async_clients,
+)
 
 
 def test_redis_ping(redis_client):
@@ -25,3 +39,150 @@ def test_create_redis_client(settings):
 
     # 정리
     client.close()
+
+
+def test_lifespan_creates_shared_clients():
+    """앱 시작 시 공유 Redis 클라이언트가 한 번 생성되는지 테스트"""
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    with TestClient(app):
+        assert isinstance(app.state.redis, Redis)
+        assert len(app.state.redis_nodes) >= 1
+        assert all(isinstance(node, Redis) for node in app.state.redis_nodes)
+        assert isinstance(app.state.lock_manager, Aioredlock)
+
+
+def test_create_redis_client_pool_options(settings):
+    """커넥션 풀이 설정값으로 구성되는지 테스트"""
+    client = create_redis_client(settings)
+    pool = client.connection_pool
+
+    assert isinstance(pool, BlockingConnectionPool)
+    assert pool.max_connections == settings.redis_max_connections
+    assert pool.timeout == settings.redis_socket_timeout
+    assert pool.connection_kwargs["socket_timeout"] == settings.redis_socket_timeout
+    assert pool.connection_kwargs["socket_keepalive"] is True
+    assert pool.connection_kwargs["socket_keepalive_options"]
+
+    client.close()
+
+
+def test_create_redis_client_cache_disabled_by_default(settings):
+    """클라이언트 캐시는 기본적으로 비활성화 (RESP2 유지)"""
+    client = create_redis_client(settings)
+    pool = client.connection_pool
+
+    assert pool.cache is None
+    assert "protocol" not in pool.connection_kwargs
+
+    client.close()
+
+
+def test_create_redis_client_cache_enabled(settings, monkeypatch):
+    """redis_client_cache_size 설정 시 RESP3 클라이언트 캐시 사용"""
+    monkeypatch.setattr(settings, "redis_client_cache_size", 100)
+
+    client = create_redis_client(settings)
+    pool = client.connection_pool
+
+    assert pool.connection_kwargs["protocol"] == 3
+    assert pool.cache.config.get_max_size() == 100
+
+    client.close()
+
+
+def test_node_worker_count_scales_with_nodes(settings, monkeypatch):
+    """노드 요청 스레드풀은 엔드포인트 스레드 수 × 노드 수로 잡음"""
+    monkeypatch.setattr(settings, "threadpool_size", 150)
+    monkeypatch.setattr(
+        settings, "_redis_node_list", (RedisNode("a", 1), RedisNode("b", 2))
+    )
+
+    assert _node_worker_count(settings) == 300
+
+
+def test_create_redis_nodes_fallback_without_cache(settings, monkeypatch):
+    """노드 설정이 없을 때의 단일 Redlock 노드는 클라이언트 캐시를 사용하지 않음"""
+    monkeypatch.setattr(settings, "redis_client_cache_size", 100)
+    monkeypatch.setattr(settings, "redis_nodes", "")
+
+    [node] = create_redis_nodes(settings)
+    pool = node.connection_pool
+
+    assert pool.cache is None
+    assert "protocol" not in pool.connection_kwargs
+
+    node.close()
+
+
+def test_run_on_nodes_preserves_order_and_failures():
+    """run_on_nodes는 노드 순서대로 결과를 반환하고 실패한 노드는 None"""
+
+    def fn(node):
+        if node == "down":
+            raise RedisConnectionError("node down")
+        return node.upper()
+
+    assert run_on_nodes(fn, ["a", "down", "c"]) == ["A", None, "C"]
+    assert run_on_nodes(fn, ["down"]) == [None]
+
+
+def test_iter_on_nodes_yields_every_node_result():
+    """iter_on_nodes는 완료 순서대로 모든 노드 결과를 내보내고 실패한 노드는 None"""
+
+    def fn(node):
+        if node == "down":
+            raise RedisConnectionError("node down")
+        return node.upper()
+
+    assert sorted(iter_on_nodes(fn, ["a", "down", "c"]), key=str) == ["A", "C", None]
+
+
+def test_run_on_nodes_propagates_non_redis_errors():
+    """Redis 오류가 아닌 예외(코드 버그)는 노드 실패로 삼키지 않고 전파"""
+
+    def fn(node):
+        raise TypeError("bug")
+
+    with pytest.raises(TypeError):
+        run_on_nodes(fn, ["a", "b", "c"])
+    with pytest.raises(TypeError):
+        run_on_nodes(fn, ["a"])
+
+
+@pytest.mark.asyncio
+async def test_run_on_nodes_async_preserves_order_and_failures():
+    """run_on_nodes_async도 노드 순서대로 결과를 반환하고 Redis 오류 노드는 None"""
+
+    async def fn(node):
+        if node == "down":
+            raise RedisConnectionError("node down")
+        if node == "bug":
+            raise TypeError("bug")
+        return node.upper()
+
+    assert await run_on_nodes_async(fn, ["a", "down", "c"]) == ["A", None, "C"]
+    with pytest.raises(TypeError):
+        await run_on_nodes_async(fn, ["a", "bug"])
+
+
+def test_quorum_size():
+    """쿼럼은 노드 과반수"""
+    assert [quorum_size([None] * n) for n in (1, 2, 3, 4, 5)] == [1, 2, 2, 3, 3]
+
+
+@pytest.mark.asyncio
+async def test_warm_up_async_clients(settings):
+    """시작 시 노드마다 커넥션을 하나씩 미리 맺어 둠"""
+    nodes = create_async_redis_nodes(settings)
+
+    try:
+        await warm_up_async_clients(nodes)
+        for node in nodes:
+            connection_counts = node.connection_pool.get_connection_count()
+            assert sum(count for count, _ in connection_counts) >= 1
+    finally:
+        for node in nodes:
+            await node.aclose(close_connection_pool=True)
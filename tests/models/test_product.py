@@ -103,7 +103,9 @@ class TestProductModel:
 
     def test_created_at_auto_set(self, db_session):
         """created_at이 자동으로 설정되는지 테스트"""
+        # DB 서버 기본값은 밀리초 단위이므로 하한도 밀리초로 절삭
         before_create = datetime.utcnow()
+        before_create = before_create.replace(microsecond=before_create.microsecond // 1000 * 1000)
 
         product = Product(
             name="Test Product",
@@ -139,7 +139,9 @@ class TestPurchaseModel:
 
     def test_purchased_at_auto_set(self, db_session, sample_user, sample_product):
         """purchased_at이 자동으로 설정되는지 테스트"""
+        # DB 서버 기본값은 밀리초 단위이므로 하한도 밀리초로 절삭
         before_purchase = datetime.utcnow()
+        before_purchase = before_purchase.replace(microsecond=before_purchase.microsecond // 1000 * 1000)
 
         purchase = Purchase(
             user_id=sample_user.id,
@@ -127,7 +127,9 @@ class TestUserModel:
 
     def test_created_at_auto_set(self, db_session):
         """created_at이 자동으로 설정되는지 테스트"""
+        # DB 서버 기본값은 밀리초 단위이므로 하한도 밀리초로 절삭
         before_create = datetime.utcnow()
+        before_create = before_create.replace(microsecond=before_create.microsecond // 1000 * 1000)
 
         user = User(
             username="testuser",
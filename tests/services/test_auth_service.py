@@ -43,6 +43,15 @@ class TestRegisterUser:
         # created_at이 설정되었는지 확인
         assert user.created_at is not None
 
+    def test_register_user_uses_configured_rounds(self, test_db, settings):
+        """설정된 bcrypt cost로 비밀번호가 해싱되는지 테스트"""
+        user = AuthService.register_user(
+            "roundsuser", "roundspass123", test_db, settings=settings
+        )
+
+        assert user.hashed_password.startswith(f"$2b${settings.bcrypt_rounds:02d}$")
+        assert verify_password("roundspass123", user.hashed_password)
+
     def test_register_user_duplicate_username(self, test_db, settings):
         """중복 사용자 등록 실패 테스트"""
         username = "duplicate_user"
@@ -130,6 +139,23 @@ class TestGetCurrentUser:
         assert current_user.id == registered_user.id
         assert current_user.username == username
 
+    def test_get_current_user_cached(self, test_db, settings, monkeypatch):
+        """두 번째 조회는 DB 대신 캐시된 사용자를 반환하는지 테스트"""
+        username = "cacheduser"
+        AuthService.register_user(username, "cachedpass123", test_db)
+        token = create_access_token({"sub": username}, settings)
+
+        first = AuthService.get_current_user(token, test_db, settings)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("DB should not be queried on cache hit")
+
+        monkeypatch.setattr(test_db, "execute", fail)
+        second = AuthService.get_current_user(token, test_db, settings)
+
+        assert second is first
+        assert second.username == username
+
     def test_get_current_user_invalid_token(self, test_db, settings):
         """잘못된 토큰으로 조회 실패 테스트"""
         invalid_token = "invalid.token.string"
@@ -189,3 +215,21 @@ class TestGetCurrentUser:
 
         # 예외 메시지에 사용자명이 포함되는지 확인
         assert username in str(exc_info.value)
+
+    def test_get_current_user_does_not_use_bcrypt(self, test_db, settings, monkeypatch):
+        """토큰 검증 경로는 HMAC 서명 검증만 사용하고 bcrypt를 호출하지 않는지 테스트"""
+        import bcrypt
+
+        username = "hmacuser"
+        AuthService.register_user(username, "hmacpass123", test_db)
+        token = create_access_token({"sub": username}, settings)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("bcrypt must not be called on the token path")
+
+        monkeypatch.setattr(bcrypt, "checkpw", fail)
+        monkeypatch.setattr(bcrypt, "hashpw", fail)
+
+        current_user = AuthService.get_current_user(token, test_db, settings)
+
+        assert current_user.username == username
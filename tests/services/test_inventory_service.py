@@ -1,13 +1,18 @@
 """Tests for InventoryService."""
 
-import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from unittest.mock import MagicMock
 
 import pytest
 from redis import Redis
+from redis.exceptions import ConnectionError as RedisConnectionError
 
 from app.core.config import Settings
-from app.services.inventory_service import InventoryService
+from app.services.inventory_service import (
+    InventoryService,
+    StockKeys,
+    _DECREASE_STOCK_SCRIPT,
+)
 
 
 class TestInventoryService:
@@ -43,96 +48,12 @@ class TestInventoryService:
 
         assert stock is None
 
-    def test_get_lock_key(self):
-        """Test: 락 키 생성 테스트"""
-        product_id = 1
-
-        lock_key = InventoryService._get_lock_key(product_id)
-
-        assert lock_key == "lock:stock:1"
-
-    def test_acquire_lock_success(self, redis_client: Redis, settings: Settings):
-        """Test: 락 획득 성공 테스트"""
-        product_id = 1
-
-        lock_id = InventoryService._acquire_lock(product_id, redis_client, settings)
-
-        assert lock_id is not None
-        assert isinstance(lock_id, str)
-        lock_key = f"lock:stock:{product_id}"
-        stored_lock_id = redis_client.get(lock_key)
-        assert stored_lock_id is not None
-        # Redis client has decode_responses=True, so it returns strings
-        assert stored_lock_id == lock_id
-
-    def test_acquire_lock_already_locked(
-        self, redis_client: Redis, settings: Settings
-    ):
-        """Test: 이미 락이 점유 중일 때 획득 실패"""
-        product_id = 1
-        lock_key = f"lock:stock:{product_id}"
-        redis_client.set(lock_key, "existing-lock-id", ex=10)
-
-        lock_id = InventoryService._acquire_lock(product_id, redis_client, settings)
-
-        assert lock_id is None
-
-    def test_release_lock_success(self, redis_client: Redis, settings: Settings):
-        """Test: 락 해제 성공 테스트 (올바른 lock_id)"""
-        product_id = 1
-        lock_id = InventoryService._acquire_lock(product_id, redis_client, settings)
-        assert lock_id is not None
-
-        result = InventoryService._release_lock(product_id, lock_id, redis_client)
-
-        assert result is True
-        lock_key = f"lock:stock:{product_id}"
-        assert redis_client.get(lock_key) is None
-
-    def test_release_lock_wrong_id(self, redis_client: Redis, settings: Settings):
-        """Test: Lua 스크립트 락 해제 테스트 (잘못된 lock_id로 해제 시도 실패)"""
-        product_id = 1
-        lock_id = InventoryService._acquire_lock(product_id, redis_client, settings)
-        assert lock_id is not None
-
-        wrong_lock_id = "wrong-lock-id"
-        result = InventoryService._release_lock(
-            product_id, wrong_lock_id, redis_client
-        )
-
-        assert result is False
-        lock_key = f"lock:stock:{product_id}"
-        assert redis_client.get(lock_key) is not None  # 락이 여전히 존재해야 함
-
-    def test_release_lock_no_lock(self, redis_client: Redis, settings: Settings):
-        """Test: 락이 없을 때 해제 시도"""
-        product_id = 1
-        lock_id = "some-lock-id"
-
-        result = InventoryService._release_lock(product_id, lock_id, redis_client)
+    def test_stock_keys_from_id(self):
+        """Test: 재고/락 키를 bytes로 한 번에 생성 (기존 문자열 키와 동일)"""
+        keys = StockKeys.from_id(1)
 
-        assert result is False
-
-    def test_lock_expiration(self, redis_client: Redis, settings: Settings):
-        """Test: 락 만료 테스트 (TTL)"""
-        product_id = 1
-        # 1초 TTL로 락 획득
-        original_timeout = settings.lock_timeout_seconds
-        settings.lock_timeout_seconds = 1
-
-        lock_id = InventoryService._acquire_lock(product_id, redis_client, settings)
-        assert lock_id is not None
-
-        lock_key = f"lock:stock:{product_id}"
-        assert redis_client.get(lock_key) is not None
-
-        # TTL 만료 대기
-        time.sleep(1.5)
-
-        assert redis_client.get(lock_key) is None
-
-        # 원래 설정 복구
-        settings.lock_timeout_seconds = original_timeout
+        assert keys.stock == b"stock:1"
+        assert keys.lock == b"lock:stock:1"
 
     def test_decrease_stock_success(self, redis_client: Redis, settings: Settings):
         """Test: 재고 감소 성공 테스트"""
@@ -141,11 +62,12 @@ class TestInventoryService:
         decrease_quantity = 10
         redis_client.set(f"stock:{product_id}", initial_stock)
 
-        result = InventoryService.decrease_stock(
+        result, stock = InventoryService.decrease_stock(
             product_id, decrease_quantity, redis_client, settings
         )
 
-        assert result is True
+        assert result == InventoryService.DECREASE_SUCCESS
+        assert stock == initial_stock - decrease_quantity
         remaining_stock = InventoryService.get_stock(product_id, redis_client)
         assert remaining_stock == initial_stock - decrease_quantity
 
@@ -158,11 +80,12 @@ class TestInventoryService:
         decrease_quantity = 10
         redis_client.set(f"stock:{product_id}", initial_stock)
 
-        result = InventoryService.decrease_stock(
+        result, stock = InventoryService.decrease_stock(
             product_id, decrease_quantity, redis_client, settings
         )
 
-        assert result is False
+        assert result == InventoryService.DECREASE_INSUFFICIENT_STOCK
+        assert stock == initial_stock  # 실패 시점의 현재 재고 반환
         remaining_stock = InventoryService.get_stock(product_id, redis_client)
         assert remaining_stock == initial_stock  # 재고가 그대로 유지되어야 함
 
@@ -173,11 +96,86 @@ class TestInventoryService:
         product_id = 999
         decrease_quantity = 10
 
-        result = InventoryService.decrease_stock(
+        result, stock = InventoryService.decrease_stock(
             product_id, decrease_quantity, redis_client, settings
         )
 
-        assert result is False
+        assert result == InventoryService.DECREASE_PRODUCT_NOT_FOUND
+        assert stock is None
+
+    def test_decrease_stock_lock_held(self, redis_client: Redis, settings: Settings):
+        """Test: 다른 클라이언트가 락을 점유 중이면 재시도 후 실패하고 락은 유지됨"""
+        product_id = 1
+        initial_stock = 100
+        lock_key = f"lock:stock:{product_id}"
+        redis_client.set(f"stock:{product_id}", initial_stock)
+        redis_client.set(lock_key, "other-client-lock-id", ex=10)
+
+        result, _ = InventoryService.decrease_stock(
+            product_id, 10, redis_client, settings
+        )
+
+        assert result == InventoryService.DECREASE_LOCK_NOT_ACQUIRED
+        assert InventoryService.get_stock(product_id, redis_client) == initial_stock
+        assert redis_client.get(lock_key) == "other-client-lock-id"
+
+    def test_decrease_stock_retry_backoff(
+        self, redis_client: Redis, settings: Settings, monkeypatch
+    ):
+        """Test: 락 충돌 시 재시도 지연이 지수적으로 늘어나고 상한을 넘지 않음"""
+        product_id = 1
+        redis_client.set(f"stock:{product_id}", 100)
+        redis_client.set(f"lock:stock:{product_id}", "other-client-lock-id", ex=10)
+        monkeypatch.setattr(settings, "lock_retry_attempts", 5)
+        monkeypatch.setattr(settings, "lock_retry_delay_ms", 100)
+        monkeypatch.setattr(settings, "lock_retry_max_delay_ms", 300)
+
+        delays = []
+        monkeypatch.setattr(
+            "app.services.inventory_service.time.sleep", delays.append
+        )
+        monkeypatch.setattr(
+            "app.services.inventory_service.random.uniform", lambda a, b: 1.0
+        )
+
+        result, _ = InventoryService.decrease_stock(
+            product_id, 10, redis_client, settings
+        )
+
+        assert result == InventoryService.DECREASE_LOCK_NOT_ACQUIRED
+        assert delays == pytest.approx([0.1, 0.2, 0.3, 0.3])
+
+    def test_decrease_stock_after_script_flush(
+        self, redis_client: Redis, settings: Settings
+    ):
+        """Test: 서버에 스크립트가 없어도(NOSCRIPT) 다시 등록 후 재고 감소"""
+        product_id = 1
+        redis_client.set(f"stock:{product_id}", 100)
+        redis_client.script_flush()
+
+        result, stock = InventoryService.decrease_stock(
+            product_id, 10, redis_client, settings
+        )
+
+        assert result == InventoryService.DECREASE_SUCCESS
+        assert stock == 90
+
+    def test_load_scripts(self, redis_client: Redis):
+        """Test: 시작 시 스크립트를 미리 등록"""
+        redis_client.script_flush()
+
+        InventoryService.load_scripts(redis_client)
+
+        assert redis_client.script_exists(_DECREASE_STOCK_SCRIPT.sha) == [True]
+
+    def test_load_scripts_redis_unavailable(self):
+        """Test: Redis가 응답하지 않아도 시작 시 스크립트 등록이 실패하지 않음"""
+        redis = MagicMock(spec=Redis)
+        redis.script_load.side_effect = RedisConnectionError("connection refused")
+
+        InventoryService.load_scripts(redis)
+
+        redis.script_load.assert_called_once()
 
     def test_concurrent_decrease_stock(self, redis_client: Redis, settings: Settings):
         """Test: 락 충돌 시 재시도 테스트 (동시성)"""
@@ -193,9 +191,10 @@ class TestInventoryService:
         settings.lock_retry_attempts = 10  # More retries for concurrent test
 
         def decrease_worker():
-            return InventoryService.decrease_stock(
+            result, _ = InventoryService.decrease_stock(
                 product_id, decrease_quantity, redis_client, settings
             )
+            return result == InventoryService.DECREASE_SUCCESS
 
         success_count = 0
         try:
@@ -228,9 +227,10 @@ class TestInventoryService:
         redis_client.set(f"stock:{product_id}", initial_stock)
 
         def decrease_worker():
-            return InventoryService.decrease_stock(
+            result, _ = InventoryService.decrease_stock(
                 product_id, decrease_quantity, redis_client, settings
             )
+            return result == InventoryService.DECREASE_SUCCESS
 
         success_count = 0
         with ThreadPoolExecutor(max_workers=num_threads) as executor:
@@ -243,3 +243,32 @@ class TestInventoryService:
         assert success_count == 5
         remaining_stock = InventoryService.get_stock(product_id, redis_client)
         assert remaining_stock == 0
+
+
+class TestCombineNodeResults:
+    """Test: Redlock 노드별 재고 감소 결과 합산"""
+
+    def test_success_quorum(self):
+        """Test: 쿼럼 이상 성공하면 성공 코드와 다수 노드의 남은 재고"""
+        results = [[0, 7], [0, 7], [-1, 2], None, [0, 7]]
+
+        assert InventoryService.combine_node_results(results, 3) == (
+            InventoryService.DECREASE_SUCCESS,
+            7,
+        )
+
+    def test_most_common_failure(self):
+        """Test: 쿼럼 미달이면 가장 많은 노드가 보고한 실패 원인"""
+        results = [[0, 7], [0, 7], [-1, 2], [-1, 2], [-2]]
+
+        assert InventoryService.combine_node_results(results, 3) == (
+            InventoryService.DECREASE_INSUFFICIENT_STOCK,
+            2,
+        )
+
+    def test_no_responses(self):
+        """Test: 응답한 노드가 없으면 락 획득 실패로 처리"""
+        assert InventoryService.combine_node_results([None, None, None], 2) == (
+            InventoryService.DECREASE_LOCK_NOT_ACQUIRED,
+            None,
+        )
@@ -3,10 +3,12 @@
 import asyncio
 import pytest
 from redis import Redis
+from redis.exceptions import ConnectionError as RedisConnectionError
 from sqlalchemy.orm import Session
 from unittest.mock import patch
 
 from app.core.config import Settings
+from app.core.exceptions import ProductAlreadyExistsException
 from app.models import Product
 from app.services.product_service import ProductService
 
@@ -47,7 +49,51 @@ class TestCreateProduct:
         # Redis 검증 2: 락 키는 삭제되어야 정상 (임시 동기화 수단)
         lock_key = f"lock:product:create:{name}"
         lock_value = redis_client.get(lock_key)
-        assert lock_value is None, "락 키는 finally 블록에서 삭제되어야 함"
+        assert lock_value is None, "락 키는 생성 완료 시 삭제되어야 함"
+
+    def test_create_product_stock_key_exists(
+        self, test_db: Session, redis_client: Redis, settings: Settings
+    ):
+        """Test: Redis 재고 키가 이미 있으면 DB 생성을 되돌리고 락을 해제"""
+        name = "MacBook Pro"
+        # 다음에 생성될 상품 ID(1)의 재고 키가 이미 존재하는 상황
+        redis_client.set("stock:1", 99)
+
+        with pytest.raises(Exception, match="Failed to initialize stock"):
+            ProductService.create_product(
+                name=name,
+                price=2500000,
+                stock=10,
+                db=test_db,
+                redis=redis_client,
+                settings=settings,
+            )
+
+        assert test_db.query(Product).count() == 0
+        assert redis_client.get("stock:1") == "99"
+        assert redis_client.exists("product:1") == 0
+        assert redis_client.get(f"lock:product:create:{name}") is None
+
+    def test_create_product_commit_failure(
+        self, test_db: Session, redis_client: Redis, settings: Settings
+    ):
+        """Test: Redis 초기화 후 DB 커밋이 실패하면 생성한 Redis 키를 정리"""
+        name = "MacBook Pro"
+
+        with patch.object(test_db, "commit", side_effect=RuntimeError("commit failed")):
+            with pytest.raises(RuntimeError, match="commit failed"):
+                ProductService.create_product(
+                    name=name,
+                    price=2500000,
+                    stock=10,
+                    db=test_db,
+                    redis=redis_client,
+                    settings=settings,
+                )
+
+        assert test_db.query(Product).count() == 0
+        assert redis_client.exists("stock:1", "product:1") == 0
+        assert redis_client.get(f"lock:product:create:{name}") is None
 
     def test_create_product_with_description(
         self, test_db: Session, redis_client: Redis, settings: Settings
@@ -94,6 +140,100 @@ class TestCreateProduct:
         assert int(redis_stock) == 0
 
 
+class TestCreateProductsBulk:
+    """Test: 상품 일괄 생성 테스트"""
+
+    def test_create_products_bulk_success(
+        self, test_db: Session, redis_client: Redis
+    ):
+        """Test: 일괄 생성 시 DB, Redis 재고, 상품 캐시가 모두 저장됨"""
+        products = ProductService.create_products_bulk(
+            [
+                {"name": "Product A", "price": 1000, "stock": 5},
+                {"name": "Product B", "price": 2000, "stock": 7, "description": "B"},
+            ],
+            test_db,
+            redis_client,
+        )
+
+        assert [p.name for p in products] == ["Product A", "Product B"]
+        assert all(p.id is not None for p in products)
+        assert test_db.query(Product).count() == 2
+        for product in products:
+            assert int(redis_client.get(f"stock:{product.id}")) == product.stock
+            assert int(redis_client.hget(f"product:{product.id}", "price")) == (
+                product.price
+            )
+
+    def test_create_products_bulk_duplicate_name(
+        self, test_db: Session, redis_client: Redis, settings: Settings
+    ):
+        """Test: 이미 존재하는 상품명이 있으면 아무것도 생성하지 않음"""
+        ProductService.create_product(
+            name="Product A",
+            price=1000,
+            stock=5,
+            db=test_db,
+            redis=redis_client,
+            settings=settings,
+        )
+
+        with pytest.raises(ProductAlreadyExistsException):
+            ProductService.create_products_bulk(
+                [
+                    {"name": "Product B", "price": 2000, "stock": 7},
+                    {"name": "Product A", "price": 1000, "stock": 5},
+                ],
+                test_db,
+                redis_client,
+            )
+
+        assert test_db.query(Product).count() == 1
+
+    def test_create_products_bulk_stock_key_exists(
+        self, test_db: Session, redis_client: Redis
+    ):
+        """Test: Redis 재고 초기화 실패 시 생성한 상품과 Redis 키를 모두 되돌림"""
+        # 두 번째로 생성될 상품 ID(2)의 재고 키가 이미 존재하는 상황
+        redis_client.set("stock:2", 99)
+
+        with pytest.raises(Exception, match="Failed to initialize stock"):
+            ProductService.create_products_bulk(
+                [
+                    {"name": "Product A", "price": 1000, "stock": 5},
+                    {"name": "Product B", "price": 2000, "stock": 7},
+                ],
+                test_db,
+                redis_client,
+            )
+
+        assert test_db.query(Product).count() == 0
+        assert redis_client.get("stock:1") is None
+        assert redis_client.get("stock:2") == "99"
+        assert redis_client.exists("product:1", "product:2") == 0
+
+    def test_create_products_bulk_redis_error(
+        self, test_db: Session, redis_client: Redis
+    ):
+        """Test: Redis 파이프라인 실패 시 커밋하지 않고 DB 트랜잭션을 롤백"""
+        with patch(
+            "redis.client.Pipeline.execute",
+            side_effect=RedisConnectionError("connection lost"),
+        ):
+            with pytest.raises(RedisConnectionError):
+                ProductService.create_products_bulk(
+                    [
+                        {"name": "Product A", "price": 1000, "stock": 5},
+                        {"name": "Product B", "price": 2000, "stock": 7},
+                    ],
+                    test_db,
+                    redis_client,
+                )
+
+        assert test_db.query(Product).count() == 0
+        assert redis_client.exists("stock:1", "stock:2") == 0
+
+
 class TestGetProduct:
     """Test: 상품 조회 테스트"""
 
@@ -118,11 +258,98 @@ class TestGetProduct:
         assert found_product.id == product.id
         assert found_product.name == product.name
 
+    def test_get_product_identity_map(
+        self, test_db: Session, redis_client: Redis, settings: Settings
+    ):
+        """Test: 같은 세션에서 이미 로드된 상품은 SELECT 없이 반환"""
+        product = ProductService.create_product(
+            name="Test Product",
+            price=10000,
+            stock=5,
+            db=test_db,
+            redis=redis_client,
+            settings=settings,
+        )
+        loaded = ProductService.get_product(product.id, test_db)
+
+        with patch.object(test_db, "execute") as mock_execute:
+            found_product = ProductService.get_product(loaded.id, test_db)
+
+        assert found_product is loaded
+        mock_execute.assert_not_called()
+
     def test_get_product_not_exists(self, test_db: Session):
         """Test: 존재하지 않는 상품 조회"""
         product = ProductService.get_product(999, test_db)
         assert product is None
 
+    def test_get_db_stock(
+        self, test_db: Session, redis_client: Redis, settings: Settings
+    ):
+        """Test: DB 재고만 조회"""
+        product = ProductService.create_product(
+            name="Test Product",
+            price=10000,
+            stock=5,
+            db=test_db,
+            redis=redis_client,
+            settings=settings,
+        )
+
+        assert ProductService.get_db_stock(product.id, test_db) == 5
+        assert ProductService.get_db_stock(999, test_db) is None
+
+    def test_get_price(
+        self, test_db: Session, redis_client: Redis, settings: Settings
+    ):
+        """Test: 상품 가격만 조회"""
+        product = ProductService.create_product(
+            name="Test Product",
+            price=10000,
+            stock=5,
+            db=test_db,
+            redis=redis_client,
+            settings=settings,
+        )
+
+        assert ProductService.get_price(product.id, test_db) == 10000
+        assert ProductService.get_price(999, test_db) is None
+
+    def test_get_price_cached(
+        self, test_db: Session, redis_client: Redis, settings: Settings
+    ):
+        """Test: 상품 생성 시 캐시된 가격을 DB 조회 없이 반환"""
+        product = ProductService.create_product(
+            name="Test Product",
+            price=10000,
+            stock=5,
+            db=test_db,
+            redis=redis_client,
+            settings=settings,
+        )
+
+        assert redis_client.hget(f"product:{product.id}", "price") == "10000"
+        with patch.object(test_db, "execute") as mock_execute:
+            price = ProductService.get_price_cached(product.id, test_db, redis_client)
+
+        assert price == 10000
+        mock_execute.assert_not_called()
+
+    def test_get_price_cached_miss(self, test_db: Session, redis_client: Redis):
+        """Test: 캐시에 없으면 DB에서 조회 후 캐시를 채움"""
+        product = Product(name="Test Product", price=10000, stock=5)
+        test_db.add(product)
+        test_db.commit()
+
+        price = ProductService.get_price_cached(product.id, test_db, redis_client)
+
+        assert price == 10000
+        assert redis_client.hgetall(f"product:{product.id}") == {
+            "name": "Test Product",
+            "price": "10000",
+        }
+        assert ProductService.get_price_cached(999, test_db, redis_client) is None
+
 
 class TestGetProductWithStock:
     """Test: 재고 정보 포함 상품 조회 테스트"""
@@ -178,6 +405,28 @@ class TestGetProductWithStock:
         assert result["redis_stock"] == 15
         assert result["synced"] is False
 
+    def test_get_product_with_stock_redis_missing(
+        self, test_db: Session, redis_client: Redis, settings: Settings
+    ):
+        """Test: Redis 재고가 없으면 DB 재고로 초기화"""
+        product = ProductService.create_product(
+            name="Evicted Product",
+            price=30000,
+            stock=20,
+            db=test_db,
+            redis=redis_client,
+            settings=settings,
+        )
+        redis_client.delete(f"stock:{product.id}")
+
+        result = ProductService.get_product_with_stock(
+            product.id, test_db, redis_client
+        )
+
+        assert result["redis_stock"] == 20
+        assert result["synced"] is True
+        assert redis_client.get(f"stock:{product.id}") == "20"
+
     def test_get_product_with_stock_not_exists(
         self, test_db: Session, redis_client: Redis
     ):
@@ -308,6 +557,26 @@ class TestSyncStockToDb:
         result = ProductService.sync_stock_to_db(999, 50, test_db)
         assert result is False
 
+    def test_sync_stock_to_db_without_commit(
+        self, test_db: Session, redis_client: Redis, settings: Settings
+    ):
+        """Test: commit=False면 호출하는 쪽 트랜잭션에 포함되어 롤백 시 함께 취소"""
+        product = ProductService.create_product(
+            name="No Commit Sync Product",
+            price=10000,
+            stock=100,
+            db=test_db,
+            redis=redis_client,
+            settings=settings,
+        )
+
+        result = ProductService.sync_stock_to_db(product.id, 80, test_db, commit=False)
+        test_db.rollback()
+
+        assert result is True
+        test_db.refresh(product)
+        assert product.stock == 100
+
     def test_sync_stock_to_db_multiple_times(
         self, test_db: Session, redis_client: Redis, settings: Settings
     ):
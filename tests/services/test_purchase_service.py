@@ -3,6 +3,8 @@
 구매 처리 서비스 테스트 (TDD)
 """
 
+import asyncio
+
 import pytest
 from concurrent.futures import ThreadPoolExecutor
 from redis import Redis
@@ -15,10 +17,13 @@ from app.core.exceptions import (
     InsufficientStockException,
     LockAcquisitionException,
 )
+from app.db.redis_client import create_async_redis_client
 from app.models import User, Product, Purchase
+from app.services import purchase_service
 from app.services.purchase_service import PurchaseService
 from app.services.product_service import ProductService
 from app.services.inventory_service import InventoryService
+from app.services.redlock_manual_service import RedlockManualService
 
 
 @pytest.fixture
@@ -48,6 +53,21 @@ def sample_product(
     return product
 
 
+@pytest.fixture
+def compensation_futures():
+    """백그라운드 보상 트랜잭션(재고 복구) Future를 모아 완료를 기다릴 수 있게 함"""
+    futures = []
+    compensate_stock = PurchaseService._compensate_stock
+
+    def record(*args):
+        future = compensate_stock(*args)
+        futures.append(future)
+        return future
+
+    with patch.object(PurchaseService, "_compensate_stock", side_effect=record):
+        yield futures
+
+
 class TestPurchaseProduct:
     """Test: 상품 구매 테스트"""
 
@@ -246,6 +266,139 @@ class TestPurchaseProduct:
         assert redis_stock == 0
 
 
+class TestPurchaseProductAsync:
+    """Test: 비동기(redis.asyncio) 구매 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_purchase_async_success(
+        self,
+        test_db: Session,
+        redis_client: Redis,
+        settings: Settings,
+        sample_user: User,
+        sample_product: Product,
+    ):
+        """Test: 비동기 구매 성공 (Redis + DB 모두 감소 확인)"""
+        initial_stock = sample_product.stock
+        async_redis = create_async_redis_client(settings)
+
+        try:
+            purchase = await PurchaseService.purchase_product_async(
+                user_id=sample_user.id,
+                product_id=sample_product.id,
+                quantity=5,
+                db=test_db,
+                redis=async_redis,
+                settings=settings,
+            )
+        finally:
+            await async_redis.aclose(close_connection_pool=True)
+
+        assert purchase.id is not None
+        assert purchase.total_price == sample_product.price * 5
+        assert purchase.purchased_at is not None
+
+        test_db.refresh(sample_product)
+        assert sample_product.stock == initial_stock - 5
+        redis_stock = InventoryService.get_stock(sample_product.id, redis_client)
+        assert redis_stock == initial_stock - 5
+
+    @pytest.mark.asyncio
+    async def test_purchase_async_insufficient_stock(
+        self,
+        test_db: Session,
+        redis_client: Redis,
+        settings: Settings,
+        sample_user: User,
+        sample_product: Product,
+    ):
+        """Test: 비동기 구매 재고 부족 시 예외 (재고 유지)"""
+        async_redis = create_async_redis_client(settings)
+
+        try:
+            with pytest.raises(InsufficientStockException) as exc_info:
+                await PurchaseService.purchase_product_async(
+                    user_id=sample_user.id,
+                    product_id=sample_product.id,
+                    quantity=sample_product.stock + 1,
+                    db=test_db,
+                    redis=async_redis,
+                    settings=settings,
+                )
+        finally:
+            await async_redis.aclose(close_connection_pool=True)
+
+        assert exc_info.value.available == sample_product.stock
+        redis_stock = InventoryService.get_stock(sample_product.id, redis_client)
+        assert redis_stock == sample_product.stock
+
+
+class TestPurchaseWithRedlockManual:
+    """Test: 수동 쿼럼 Redlock 구매 테스트"""
+
+    def test_db_transaction_released_during_redlock(
+        self,
+        test_db: Session,
+        settings: Settings,
+        sample_user: User,
+        sample_product: Product,
+    ):
+        """Test: 가격 조회 후 Redlock 재고 감소 동안 DB 트랜잭션(커넥션)을 잡고 있지 않음"""
+        in_transaction_during_decrease = []
+
+        def fake_decrease(product_id, quantity, redis_nodes, settings):
+            in_transaction_during_decrease.append(test_db.in_transaction())
+            return InventoryService.DECREASE_SUCCESS, 95
+
+        with patch.object(
+            RedlockManualService, "decrease_stock_sync", side_effect=fake_decrease
+        ):
+            purchase = PurchaseService.purchase_with_redlock_manual(
+                user_id=sample_user.id,
+                product_id=sample_product.id,
+                quantity=5,
+                db=test_db,
+                redis_nodes=[],
+                settings=settings,
+            )
+
+        assert in_transaction_during_decrease == [False]
+        assert purchase.total_price == sample_product.price * 5
+        test_db.refresh(sample_product)
+        assert sample_product.stock == 95
+
+    @pytest.mark.asyncio
+    async def test_lock_not_acquired_async(
+        self,
+        test_db: Session,
+        settings: Settings,
+        sample_user: User,
+        sample_product: Product,
+    ):
+        """Test: 비동기 Redlock 락 획득 실패 시 Redlock 락 키를 리소스로 보고"""
+
+        async def fake_decrease(product_id, quantity, redis_nodes, settings):
+            return InventoryService.DECREASE_LOCK_NOT_ACQUIRED, None
+
+        with patch.object(
+            RedlockManualService, "decrease_stock_async", side_effect=fake_decrease
+        ):
+            with pytest.raises(LockAcquisitionException) as exc_info:
+                await PurchaseService.purchase_with_redlock_manual_async(
+                    user_id=sample_user.id,
+                    product_id=sample_product.id,
+                    quantity=5,
+                    db=test_db,
+                    redis_nodes=[],
+                    settings=settings,
+                )
+
+        assert exc_info.value.resource == f"lock:stock:{sample_product.id}"
+        assert exc_info.value.reason == (
+            "Failed to acquire manual Redlock (async) after retries"
+        )
+
+
 class TestConcurrentPurchase:
     """Test: 동시 구매 요청 시나리오 (멀티스레드)
 
@@ -570,6 +723,7 @@ class TestPurchaseRollback:
         settings: Settings,
         sample_user: User,
         sample_product: Product,
+        compensation_futures,
     ):
         """Test: DB 트랜잭션 실패 시 Redis 재고가 롤백되는지 검증"""
         initial_stock = sample_product.stock
@@ -596,6 +750,9 @@ class TestPurchaseRollback:
 
             assert "DB commit failed" in str(exc_info.value)
 
+        # 백그라운드 보상 트랜잭션 완료 대기
+        assert [future.result(timeout=5) for future in compensation_futures] == [True]
+
         # 검증 1: Redis 재고가 원래 값으로 롤백되었는지 확인
         final_redis_stock = InventoryService.get_stock(sample_product.id, redis_client)
         assert (
@@ -624,6 +781,7 @@ class TestPurchaseRollback:
         settings: Settings,
         sample_user: User,
         sample_product: Product,
+        compensation_futures,
     ):
         """
         Test: Saga 패턴 보상 트랜잭션 검증 - 롤백 중 다른 프로세스의 재고 변경 보존
@@ -654,10 +812,12 @@ class TestPurchaseRollback:
 
         def commit_with_concurrent_decrease():
             # DB 커밋 전에 프로세스 B가 재고 감소
-            success = InventoryService.decrease_stock(
+            result, _ = InventoryService.decrease_stock(
                 sample_product.id, process_b_quantity, redis_client, settings
             )
-            assert success, "프로세스 B의 재고 감소 실패"
+            assert (
+                result == InventoryService.DECREASE_SUCCESS
+            ), "프로세스 B의 재고 감소 실패"
 
             # 그 후 DB 커밋 실패 발생
             raise Exception("DB commit failed after concurrent decrease")
@@ -678,6 +838,8 @@ class TestPurchaseRollback:
 
             assert "DB commit failed" in str(exc_info.value)
 
+        assert [future.result(timeout=5) for future in compensation_futures] == [True]
+
         # 검증: 최종 Redis 재고
         # 프로세스 A는 롤백되고, 프로세스 B만 반영되어야 함
         final_redis_stock = InventoryService.get_stock(sample_product.id, redis_client)
@@ -692,3 +854,41 @@ class TestPurchaseRollback:
         # 추가 검증: DB는 여전히 원래 값
         test_db.refresh(sample_product)
         assert sample_product.stock == initial_stock
+
+    @pytest.mark.asyncio
+    async def test_rollback_on_db_error_async(
+        self,
+        test_db: Session,
+        redis_client: Redis,
+        settings: Settings,
+        sample_user: User,
+        sample_product: Product,
+    ):
+        """Test: 비동기 구매의 DB 트랜잭션 실패 시 백그라운드 태스크로 Redis 재고 복구"""
+        initial_stock = sample_product.stock
+        async_redis = create_async_redis_client(settings)
+
+        try:
+            with patch.object(
+                PurchaseService,
+                "_record_purchase",
+                side_effect=Exception("DB commit failed"),
+            ):
+                with pytest.raises(Exception, match="DB commit failed"):
+                    await PurchaseService.purchase_product_async(
+                        user_id=sample_user.id,
+                        product_id=sample_product.id,
+                        quantity=5,
+                        db=test_db,
+                        redis=async_redis,
+                        settings=settings,
+                    )
+
+            # 백그라운드 보상 태스크 완료 대기
+            tasks = list(purchase_service._COMPENSATION_TASKS)
+            assert await asyncio.gather(*tasks) == [True]
+        finally:
+            await async_redis.aclose(close_connection_pool=True)
+
+        redis_stock = InventoryService.get_stock(sample_product.id, redis_client)
+        assert redis_stock == initial_stock
@@ -0,0 +1,171 @@
+"""
+수동 쿼럼 Redlock 재고 서비스 테스트
+"""
+
+import pytest
+
+from app.core.config import Settings
+from app.db.redis_client import create_async_redis_nodes, create_redis_nodes
+from app.services.inventory_service import InventoryService
+from app.services.redlock_manual_service import RedlockManualService
+
+
+PRODUCT_ID = 1
+
+
+@pytest.fixture
+def redis_nodes(settings: Settings):
+    """테스트용 동기 Redis 노드 리스트 (재고/락 키를 테스트 전후로 정리)"""
+    nodes = create_redis_nodes(settings)
+    keys = (f"stock:{PRODUCT_ID}", f"lock:stock:{PRODUCT_ID}")
+
+    for node in nodes:
+        node.delete(*keys)
+
+    yield nodes
+
+    for node in nodes:
+        node.delete(*keys)
+        node.close()
+
+
+class TestDecreaseStockSync:
+    """동기 재고 감소 테스트"""
+
+    def test_decrease_stock_success(self, redis_nodes, settings: Settings):
+        """Test: 재고 감소 성공 후 락이 해제됨"""
+        RedlockManualService.initialize_stock(PRODUCT_ID, 10, redis_nodes)
+
+        result = RedlockManualService.decrease_stock_sync(
+            PRODUCT_ID, 3, redis_nodes, settings
+        )
+
+        assert result == (InventoryService.DECREASE_SUCCESS, 7)
+        assert RedlockManualService.get_stock(PRODUCT_ID, redis_nodes) == 7
+        assert all(node.exists(f"lock:stock:{PRODUCT_ID}") == 0 for node in redis_nodes)
+
+    def test_decrease_stock_lock_held_on_majority(
+        self, redis_nodes, settings: Settings
+    ):
+        """Test: 과반수 노드의 락을 다른 클라이언트가 점유 중이면 재고를 바꾸지 않음"""
+        if len(redis_nodes) < 3:
+            pytest.skip("다중 Redis 노드가 필요합니다")
+        RedlockManualService.initialize_stock(PRODUCT_ID, 10, redis_nodes)
+        majority = len(redis_nodes) // 2 + 1
+        for node in redis_nodes[:majority]:
+            node.set(f"lock:stock:{PRODUCT_ID}", "other-client", ex=10)
+
+        result = RedlockManualService.decrease_stock_sync(
+            PRODUCT_ID, 3, redis_nodes, settings
+        )
+
+        assert result == (InventoryService.DECREASE_LOCK_NOT_ACQUIRED, None)
+        assert all(int(node.get(f"stock:{PRODUCT_ID}")) == 10 for node in redis_nodes)
+        assert [node.get(f"lock:stock:{PRODUCT_ID}") for node in redis_nodes] == [
+            "other-client"
+        ] * majority + [None] * (len(redis_nodes) - majority)
+
+    def test_decrease_stock_retries_until_lock_released(
+        self, redis_nodes, settings: Settings
+    ):
+        """Test: 다른 클라이언트의 락이 만료되면 재시도로 재고 감소 성공"""
+        RedlockManualService.initialize_stock(PRODUCT_ID, 10, redis_nodes)
+        for node in redis_nodes:
+            node.set(f"lock:stock:{PRODUCT_ID}", "other-client", px=30)
+
+        result = RedlockManualService.decrease_stock_sync(
+            PRODUCT_ID, 3, redis_nodes, settings
+        )
+
+        assert result == (InventoryService.DECREASE_SUCCESS, 7)
+        assert all(int(node.get(f"stock:{PRODUCT_ID}")) == 7 for node in redis_nodes)
+
+    def test_decrease_stock_lock_held_on_minority(
+        self, redis_nodes, settings: Settings
+    ):
+        """Test: 소수 노드의 락이 점유 중이어도 성공하고 모든 노드의 재고가 일치"""
+        if len(redis_nodes) < 3:
+            pytest.skip("다중 Redis 노드가 필요합니다")
+        RedlockManualService.initialize_stock(PRODUCT_ID, 10, redis_nodes)
+        redis_nodes[0].set(f"lock:stock:{PRODUCT_ID}", "other-client", ex=10)
+
+        result = RedlockManualService.decrease_stock_sync(
+            PRODUCT_ID, 3, redis_nodes, settings
+        )
+
+        assert result == (InventoryService.DECREASE_SUCCESS, 7)
+        assert all(int(node.get(f"stock:{PRODUCT_ID}")) == 7 for node in redis_nodes)
+        assert redis_nodes[0].get(f"lock:stock:{PRODUCT_ID}") == "other-client"
+        assert all(
+            node.exists(f"lock:stock:{PRODUCT_ID}") == 0 for node in redis_nodes[1:]
+        )
+
+    def test_decrease_stock_product_not_found(self, redis_nodes, settings: Settings):
+        """Test: 재고 키가 없으면 상품 없음 코드 반환"""
+        result = RedlockManualService.decrease_stock_sync(
+            PRODUCT_ID, 1, redis_nodes, settings
+        )
+
+        assert result == (InventoryService.DECREASE_PRODUCT_NOT_FOUND, None)
+
+    def test_decrease_stock_quorum_failure_rolls_back_only_decreased_nodes(
+        self, redis_nodes, settings: Settings
+    ):
+        """Test: 감소 쿼럼 실패 시 실제로 감소한 노드만 복구"""
+        if len(redis_nodes) < 3:
+            pytest.skip("다중 Redis 노드가 필요합니다")
+        # 과반수 노드는 재고 부족, 나머지는 충분한 상태
+        minority = len(redis_nodes) // 2
+        for i, node in enumerate(redis_nodes):
+            node.set(f"stock:{PRODUCT_ID}", 10 if i < minority else 1)
+
+        result = RedlockManualService.decrease_stock_sync(
+            PRODUCT_ID, 5, redis_nodes, settings
+        )
+
+        assert result == (InventoryService.DECREASE_INSUFFICIENT_STOCK, 1)
+        assert [int(node.get(f"stock:{PRODUCT_ID}")) for node in redis_nodes] == [
+            10 if i < minority else 1 for i in range(len(redis_nodes))
+        ]
+        assert all(node.exists(f"lock:stock:{PRODUCT_ID}") == 0 for node in redis_nodes)
+
+
+class TestDecreaseStockAsync:
+    """비동기(redis.asyncio) 재고 감소 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_decrease_stock_async_success(self, redis_nodes, settings: Settings):
+        """Test: 비동기 클라이언트로 재고 감소 성공 후 락이 해제됨"""
+        RedlockManualService.initialize_stock(PRODUCT_ID, 10, redis_nodes)
+        async_nodes = create_async_redis_nodes(settings)
+
+        try:
+            result = await RedlockManualService.decrease_stock_async(
+                PRODUCT_ID, 4, async_nodes, settings
+            )
+            stock = await RedlockManualService.get_stock_async(PRODUCT_ID, async_nodes)
+        finally:
+            for node in async_nodes:
+                await node.aclose(close_connection_pool=True)
+
+        assert result == (InventoryService.DECREASE_SUCCESS, 6)
+        assert stock == 6
+        assert all(node.exists(f"lock:stock:{PRODUCT_ID}") == 0 for node in redis_nodes)
+
+    @pytest.mark.asyncio
+    async def test_decrease_stock_async_insufficient(
+        self, redis_nodes, settings: Settings
+    ):
+        """Test: 재고 부족 시 재고 부족 코드와 현재 재고 반환"""
+        RedlockManualService.initialize_stock(PRODUCT_ID, 2, redis_nodes)
+        async_nodes = create_async_redis_nodes(settings)
+
+        try:
+            result = await RedlockManualService.decrease_stock_async(
+                PRODUCT_ID, 5, async_nodes, settings
+            )
+        finally:
+            for node in async_nodes:
+                await node.aclose(close_connection_pool=True)
+
+        assert result == (InventoryService.DECREASE_INSUFFICIENT_STOCK, 2)
@@ -16,7 +16,7 @@ import pytest
 from redis import Redis
 
 from app.core.config import Settings
-from app.db.redis_client import create_redis_nodes
+from app.db.redis_client import create_lock_manager, create_redis_nodes
 from app.services.redlock_service import RedlockService
 
 
@@ -108,6 +108,23 @@ class TestRedlockBasic:
 
         assert result == stock_value
 
+    def test_get_stocks_with_quorum(self, redis_nodes, redlock_settings):
+        """
+        여러 상품 재고 일괄 조회 테스트
+
+        시나리오:
+        - 상품마다 쿼럼 이상/미만의 노드에 재고 설정
+        - 쿼럼을 만족한 상품만 재고 값 반환
+        """
+        for node in redis_nodes:
+            node.set("stock:21", 30)
+        for node in redis_nodes[:2]:
+            node.set("stock:22", 40)
+
+        result = RedlockService.get_stocks([21, 22, 23], redis_nodes)
+
+        assert result == {21: 30, 22: None, 23: None}
+
     def test_decrease_stock_sync_basic(self, redis_nodes, redlock_settings):
         """
         동기 방식 재고 감소 기본 테스트
@@ -288,6 +305,31 @@ class TestRedlockAsync:
         final_stock = RedlockService.get_stock(product_id, redis_nodes)
         assert final_stock == initial_stock - decrease_quantity
 
+    async def test_decrease_stock_async_shared_lock_manager(
+        self, redis_nodes, redlock_settings
+    ):
+        """
+        공유 락 매니저 재사용 테스트
+
+        시나리오:
+        - 한 락 매니저로 여러 번 재고 감소
+        - 호출이 끝나도 공유 매니저는 종료되지 않음
+        """
+        product_id = 24
+        RedlockService.initialize_stock(product_id, 100, redis_nodes)
+        lock_manager = create_lock_manager(redlock_settings)
+
+        try:
+            for _ in range(3):
+                result = await RedlockService.decrease_stock_with_redlock(
+                    product_id, 10, redis_nodes, redlock_settings, lock_manager
+                )
+                assert result is True
+        finally:
+            await lock_manager.destroy()
+
+        assert RedlockService.get_stock(product_id, redis_nodes) == 70
+
     async def test_concurrent_async_decrease(self, redis_nodes, redlock_settings):
         """
         비동기 동시 재고 감소 테스트